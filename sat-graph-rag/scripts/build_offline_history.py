@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Build the full amendment history offline and write it in one bulk pass.
+
+Replays the parsed constitution and all parsed amendments in memory with the
+same aggregation rules as the temporal engine, then writes the resulting
+graph into an empty database. Use --dry-run to only compute the stats (they
+match an online run of process_all_amendments.py).
+"""
+
+import sys
+from pathlib import Path
+import argparse
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.offline_builder import OfflineHistoryBuilder
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Build the amendment history offline")
+    parser.add_argument("--constitution", default="data/intermediate/constitution.json")
+    parser.add_argument(
+        "--amendments", default="data/intermediate/amendments/parsed_amendments.json"
+    )
+    parser.add_argument("--enactment-date", default="1988-10-05", help="Date for v1 versions")
+    parser.add_argument("--batch-size", type=int, default=None, help="Rows per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Compute stats without writing")
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("OFFLINE FULL-HISTORY BUILD")
+    print("="*70)
+
+    builder = OfflineHistoryBuilder()
+    model = builder.build(args.constitution, args.amendments, args.enactment_date)
+
+    print(f"\n📊 Amendments: {builder.summary['applied']} applied, "
+          f"{builder.summary['skipped']} skipped")
+    print(f"   Components: {len(model.components):,}")
+    print(f"   CTVs: {len(model.ctvs):,}")
+    for key, value in model.stats.items():
+        print(f"   {key}: {value:,}")
+
+    if args.dry_run:
+        print("\n(dry run: nothing written)")
+        return
+
+    print("\n💾 Writing graph...")
+    written = builder.write(args.batch_size)
+    for name, count in written.items():
+        print(f"   {name}: {count:,} rows")
+
+    print("\n" + "="*70)
+    print("✅ Offline build complete!")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
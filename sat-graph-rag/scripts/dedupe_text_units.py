@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""Collapse duplicate TextUnits into a content-addressed store.
+
+Run once on graphs loaded before TextUnits were keyed by content_hash, or
+before propagated ancestor versions shared their predecessor's CLV.
+The uniqueness constraint on content_hash is created afterwards.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.connection import get_connection
+from src.graph.schema import SchemaManager
+from src.graph.text_store import collapse_duplicate_text_units, share_propagated_clvs
+
+
+def main():
+    """Main execution."""
+    print("\n" + "="*70)
+    print("DEDUPLICATING TEXT UNITS")
+    print("="*70)
+
+    conn = get_connection()
+
+    with conn.session() as session:
+        before = session.run("MATCH (t:TextUnit) RETURN count(t) AS count").single()["count"]
+    print(f"\n  TextUnits before: {before:,}")
+
+    stats = collapse_duplicate_text_units(conn)
+    stats["clvs_removed"] = share_propagated_clvs(conn)
+
+    with conn.session() as session:
+        after = session.run("MATCH (t:TextUnit) RETURN count(t) AS count").single()["count"]
+
+    print(f"  TextUnits after:  {after:,}")
+    print("\n  Migration Statistics:")
+    for key, value in stats.items():
+        print(f"    • {key}: {value:,}")
+
+    # Now that hashes are unique, enforce it
+    SchemaManager(conn).create_constraints()
+
+    print("\n" + "="*70)
+    print("✅ Deduplication complete!")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Embed the graph's TextUnits for semantic search.
+
+Only TextUnits missing from the saved matrix are embedded, in batches, so
+the script can be re-run after every batch of amendments. With --push the
+vectors are also written to TextUnit.embedding (the Neo4j vector index).
+"""
+
+import sys
+from pathlib import Path
+import argparse
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.connection import get_connection
+from src.graph.schema import SchemaManager
+from src.rag.embeddings import EmbeddingStore, get_embedder
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Embed TextUnits")
+    parser.add_argument("--embedder", choices=["hashing", "openai"], default="hashing")
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--output", default="data/embeddings/text_units.npz")
+    parser.add_argument("--batch-size", type=int, default=64, help="Texts per embedding call")
+    parser.add_argument("--push", action="store_true", help="Write vectors to Neo4j")
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("TEXTUNIT EMBEDDINGS")
+    print("="*70)
+
+    store = EmbeddingStore(get_embedder(args.embedder, args.dimensions), args.batch_size)
+    if Path(args.output).exists():
+        store.load(args.output)
+        print(f"\n   Loaded {len(store):,} embeddings from {args.output}")
+
+    conn = get_connection()
+    embedded = store.sync(conn)
+    store.save(args.output)
+    print(f"\n   ✓ Embedded {embedded:,} new TextUnits ({len(store):,} total)")
+
+    if args.push:
+        SchemaManager(conn).create_vector_index(store.dimensions)
+        pushed = store.push_to_neo4j(conn)
+        print(f"   ✓ Pushed {pushed:,} vectors to the text_embedding index")
+
+    print("\n" + "="*70)
+    print("✅ Done!")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+"""Export the parsed constitution as CSV files for neo4j-admin import."""
+
+import sys
+from pathlib import Path
+import argparse
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.admin_import import AdminImportExporter
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Export constitution for neo4j-admin import")
+    parser.add_argument(
+        "json_paths", nargs="*", default=["data/intermediate/constitution.json"],
+        help="Parsed norm JSON files (one Norm each)",
+    )
+    parser.add_argument("--output-dir", default="data/import", help="Directory for CSV files")
+    parser.add_argument("--enactment-date", default="1988-10-05", help="Date for v1 versions")
+    parser.add_argument("--database", default="neo4j", help="Target database name")
+    args = parser.parse_args()
+
+    exporter = AdminImportExporter(args.output_dir)
+    stats = exporter.export(args.json_paths, enactment_date=args.enactment_date)
+
+    print("\nExport Statistics:")
+    for key, value in stats.items():
+        print(f"  {key}: {value:,}")
+
+    print("\nStop the database, then import with:")
+    print(f"  {exporter.import_command(args.database)}")
+
+
+if __name__ == "__main__":
+    main()
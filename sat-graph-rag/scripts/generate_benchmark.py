@@ -23,6 +23,7 @@ from dataclasses import dataclass, asdict
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from neo4j import GraphDatabase
+from src.graph.validity import ValidityIndex
 import os
 from dotenv import load_dotenv
 
@@ -52,6 +53,8 @@ class BenchmarkGenerator:
             os.getenv('NEO4J_URI'),
             auth=(os.getenv('NEO4J_USER'), os.getenv('NEO4J_PASSWORD'))
         )
+        # Version validity intervals (binary search per component)
+        self.validity = ValidityIndex(self.driver)
 
     def close(self):
         """Close Neo4j connection."""
@@ -90,19 +93,20 @@ class BenchmarkGenerator:
 
     def _get_text_for_version(self, component_id: str, target_date: date) -> Dict:
         """Get text content for a component at a specific date."""
+        ctv_id = self.validity.version_at(component_id, target_date.isoformat())
+        if ctv_id is None:
+            return None
+
         with self.driver.session() as session:
             result = session.run("""
-                MATCH (c:Component {component_id: $component_id})
-                      -[:HAS_VERSION]->(v:CTV)
-                WHERE v.date_start <= $target_date
-                  AND (v.date_end IS NULL OR v.date_end > $target_date)
-                MATCH (v)-[:EXPRESSED_IN]->(clv:CLV)-[:HAS_TEXT]->(t:TextUnit)
+                MATCH (v:CTV {ctv_id: $ctv_id})
+                      -[:EXPRESSED_IN]->(clv:CLV)-[:HAS_TEXT]->(t:TextUnit)
                 RETURN v.version_number AS version,
                        t.full_text AS text,
                        t.content_hash AS text_hash,
                        t.header AS header
                 LIMIT 1
-            """, component_id=component_id, target_date=target_date)
+            """, ctv_id=ctv_id)
 
             record = result.single()
             if record:
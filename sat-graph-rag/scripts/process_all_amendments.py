@@ -9,8 +9,8 @@ This script demonstrates the aggregation model at scale by:
 """
 
 import sys
-import json
 from pathlib import Path
+import argparse
 from datetime import datetime
 from typing import Dict, List
 
@@ -19,12 +19,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.graph.temporal_engine import TemporalEngine
 from src.graph.connection import get_connection
-
-
-def load_amendments(path: str = "data/intermediate/amendments/parsed_amendments.json") -> List[Dict]:
-    """Load parsed amendment data."""
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+from src.graph.amendments import load_amendments, build_article_mapping, changes_for_amendment
+from src.graph.scheduler import AmendmentScheduler
+from src.graph.journal import AmendmentJournal
 
 
 def get_component_mapping(conn) -> Dict[str, str]:
@@ -36,30 +33,13 @@ def get_component_mapping(conn) -> Dict[str, str]:
     """
     query = """
     MATCH (c:Component {component_type: 'article'})
-    RETURN c.component_id AS comp_id, c.ordering_id AS ordering
+    RETURN c.component_id AS component_id, c.ordering_id AS ordering_id
     """
 
-    mapping = {}
     with conn.session() as session:
-        results = list(session.run(query))
-
-    for r in results:
-        comp_id = r["comp_id"]
-        ordering = r["ordering"]
+        results = session.run(query).data()
 
-        # Extract article number from component_id or ordering
-        # e.g., "tit_01_art_1" -> "1" or "art_5" -> "5"
-        if ordering:
-            mapping[ordering] = comp_id
-
-        # Also try to extract from ID
-        if "_art_" in comp_id:
-            parts = comp_id.split("_art_")
-            if len(parts) > 1:
-                art_num = parts[1].split("_")[0]
-                mapping[art_num] = comp_id
-
-    return mapping
+    return build_article_mapping(results)
 
 
 def get_aggregation_stats(conn) -> Dict:
@@ -122,34 +102,7 @@ def process_amendments_batch(
             continue
 
         # Collect changes
-        changes = []
-
-        # Modified articles
-        for art_num in amendment.get("articles_modified", []):
-            if art_num in mapping:
-                changes.append({
-                    "component_id": mapping[art_num],
-                    "new_content": f"Modified by EC {number}",
-                    "change_type": "modify"
-                })
-
-        # Added articles (treat as modify if exists, skip if new)
-        for art_num in amendment.get("articles_added", []):
-            if art_num in mapping:
-                changes.append({
-                    "component_id": mapping[art_num],
-                    "new_content": f"Added/Modified by EC {number}",
-                    "change_type": "modify"
-                })
-
-        # Repealed articles
-        for art_num in amendment.get("articles_repealed", []):
-            if art_num in mapping:
-                changes.append({
-                    "component_id": mapping[art_num],
-                    "new_content": "",
-                    "change_type": "repeal"
-                })
+        changes = changes_for_amendment(amendment, mapping)
 
         if not changes:
             skipped += 1
@@ -187,14 +140,108 @@ def process_amendments_batch(
     }
 
 
+def plan_amendments_batch(
+    amendments: List[Dict],
+    mapping: Dict[str, str],
+    engine: TemporalEngine,
+    max_new_ctvs: int = 500
+):
+    """
+    Plan amendments without writing anything.
+
+    Each plan is computed against the current graph state, so for a batch
+    the totals are an estimate of the write volume, not an exact replay.
+
+    Args:
+        amendments: List of parsed amendments
+        mapping: Article number -> component ID mapping
+        engine: TemporalEngine instance
+        max_new_ctvs: Flag amendments that would create more CTVs than this
+    """
+    totals = {"new_ctvs": 0, "new_aggregations": 0, "reused_ctvs": 0, "estimated_writes": 0}
+    flagged = []
+
+    print(f"\n🧮 Planning {len(amendments)} amendments (dry run)...\n")
+    for amendment in amendments:
+        changes = changes_for_amendment(amendment, mapping)
+        if not changes:
+            continue
+
+        plan = engine.plan_amendment(amendment["number"], amendment["date"], changes)
+        summary = plan.summary()
+        for key in totals:
+            totals[key] += summary[key]
+        if plan.exceeds(max_new_ctvs=max_new_ctvs):
+            flagged.append(amendment["number"])
+
+    print(f"   New CTVs: {totals['new_ctvs']:,}")
+    print(f"   New aggregations: {totals['new_aggregations']:,}")
+    print(f"   Reused CTVs: {totals['reused_ctvs']:,}")
+    print(f"   Estimated writes: {totals['estimated_writes']:,}")
+    if flagged:
+        print(f"\n   ⚠️  Over {max_new_ctvs} new CTVs: EC {', '.join(map(str, flagged))}")
+
+    return {"totals": totals, "flagged": flagged}
+
+
+def process_amendments_concurrently(
+    amendments: List[Dict],
+    mapping: Dict[str, str],
+    engine: TemporalEngine,
+    max_workers: int
+):
+    """
+    Process amendments with an AmendmentScheduler.
+
+    Amendments touching different Titles run concurrently; conflicting ones
+    are applied in date order, so the result matches a serial replay.
+    """
+    scheduled = []
+    skipped = 0
+    for amendment in amendments:
+        changes = changes_for_amendment(amendment, mapping)
+        if not changes:
+            skipped += 1
+            continue
+        scheduled.append({
+            "amendment_number": amendment["number"],
+            "amendment_date": amendment["date"],
+            "changes": changes,
+            "description": f"Emenda Constitucional {amendment['number']}",
+        })
+
+    print(f"\n🚀 Processing {len(scheduled)} amendments on {max_workers} workers...")
+    result = AmendmentScheduler(engine, max_workers).run(scheduled)
+    for number, error in sorted(result["failed"].items()):
+        print(f"  ❌ EC {number}: Error - {error}")
+
+    return {
+        "total": len(amendments),
+        "processed": len(result["applied"]),
+        "skipped": skipped + len(result["failed"])
+    }
+
+
 def main():
     """Main execution."""
+    parser = argparse.ArgumentParser(description="Apply all parsed amendments")
+    parser.add_argument("--dry-run", action="store_true", help="Plan without writing")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Apply amendments touching different Titles concurrently"
+    )
+    parser.add_argument(
+        "--journal", default="data/journal/amendments.jsonl",
+        help="Resume journal; amendments in it (and committed in the graph) are skipped"
+    )
+    args = parser.parse_args()
+
     print("\n" + "="*70)
     print("PROCESSING ALL CONSTITUTIONAL AMENDMENTS")
     print("="*70)
 
     conn = get_connection()
-    engine = TemporalEngine(conn)
+    engine = TemporalEngine(conn, journal=AmendmentJournal(args.journal))
 
     # Load amendments
     print("\n📂 Loading amendments...")
@@ -215,16 +262,23 @@ def main():
     print(f"   Actions: {initial_stats.get('actions', '?')}")
     print(f"   Avg versions/component: {initial_stats.get('avg_versions', 0):.2f}")
 
+    if args.dry_run:
+        plan_amendments_batch(amendments, mapping, engine)
+        return
+
     # Process amendments
     start_time = datetime.now()
 
-    result = process_amendments_batch(
-        amendments=amendments,
-        mapping=mapping,
-        engine=engine,
-        start_idx=0,
-        batch_size=10  # Report every 10 amendments
-    )
+    if args.workers > 1:
+        result = process_amendments_concurrently(amendments, mapping, engine, args.workers)
+    else:
+        result = process_amendments_batch(
+            amendments=amendments,
+            mapping=mapping,
+            engine=engine,
+            start_idx=0,
+            batch_size=10  # Report every 10 amendments
+        )
 
     duration = (datetime.now() - start_time).total_seconds()
 
@@ -239,6 +293,7 @@ def main():
     print(f"   Total: {result['total']}")
     print(f"   Processed: {result['processed']}")
     print(f"   Skipped: {result['skipped']}")
+    print(f"   Already applied (resumed): {len(engine.already_applied)}")
     print(f"   Duration: {duration:.1f}s")
 
     print(f"\nGraph State:")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Render the full constitution for every epoch, or read the renders.
+
+    build   Rebuild the graph in memory (latest snapshot plus the amendment
+            event log, or the parsed constitution plus the log) and render
+            every epoch; parts unchanged since the last build are kept
+    show    Print the constitution on --date (a file read, no database)
+    diff    Unified diff between the constitution on two dates
+"""
+
+import sys
+from pathlib import Path
+import argparse
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.journal import AmendmentJournal
+from src.graph.memory import InMemoryGraph
+from src.graph.offline_builder import OfflineHistoryBuilder
+from src.graph.renders import RenderStore, render_epochs
+from src.graph.snapshot import SnapshotStore, replay_events, restore_from_snapshot
+
+
+def rebuild_graph(args) -> InMemoryGraph:
+    """The current graph, without touching the database."""
+    journal = AmendmentJournal(args.journal)
+    store = SnapshotStore(args.snapshots)
+    if store.latest(journal.journal_id) is not None:
+        return restore_from_snapshot(journal, store, write=False)
+
+    graph = OfflineHistoryBuilder(model=InMemoryGraph()).load_base(args.constitution)
+    replay_events(graph, journal.events())
+    return graph
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Per-epoch constitution renders")
+    parser.add_argument("command", choices=["build", "show", "diff"])
+    parser.add_argument("dates", nargs="*", help="YYYY-MM-DD (one for show, two for diff)")
+    parser.add_argument("--renders", default="data/renders")
+    parser.add_argument("--journal", default="data/journal/amendments.jsonl")
+    parser.add_argument("--snapshots", default="data/snapshots")
+    parser.add_argument("--constitution", default="data/intermediate/constitution.json")
+    parser.add_argument(
+        "--split-depth", type=int, default=1, help="Hierarchy depth of the shared parts"
+    )
+    args = parser.parse_args()
+
+    store = RenderStore(args.renders)
+
+    if args.command == "show":
+        if len(args.dates) != 1:
+            parser.error("show takes one date")
+        text = store.read_at(args.dates[0])
+        print(text if text is not None else f"No constitution in force on {args.dates[0]}")
+        return
+
+    if args.command == "diff":
+        if len(args.dates) != 2:
+            parser.error("diff takes two dates")
+        old, new = (store.index.epoch_of(d) for d in args.dates)
+        if old is None or new is None:
+            parser.error("both dates must be on or after enactment")
+        print("\n".join(store.diff(old, new)))
+        return
+
+    print("\n" + "="*70)
+    print("EPOCH RENDERS")
+    print("="*70)
+
+    try:
+        graph = rebuild_graph(args)
+    except ValueError as e:
+        print(f"\n❌ {e}\n")
+        sys.exit(1)
+    stats = render_epochs(graph, args.renders, args.split_depth)
+
+    print(f"\n   Epochs: {stats['epochs']:,}")
+    print(f"   Parts: {stats['parts']:,} ({stats['parts_written']:,} new, "
+          f"{stats['parts_pruned']:,} pruned)")
+    print(f"   Written to: {args.renders}")
+
+    print("\n" + "="*70)
+    print("✅ Done!")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
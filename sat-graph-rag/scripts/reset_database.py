@@ -1,13 +1,22 @@
 #!/usr/bin/env python
-"""Reset database and reload constitution from scratch."""
+"""Reset database and reload constitution from scratch.
+
+The amendment journal describes the wiped graph, so it is rotated (moved
+aside with a timestamp) and a new journal, with a new ID, is started for
+the next process_all_amendments run. Snapshots are named after the journal
+they were taken from, so the ones taken before the reset are no longer
+used by snapshot_graph.py or render_epochs.py.
+"""
 
 import sys
 from pathlib import Path
+import argparse
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.graph.connection import get_connection
+from src.graph.journal import AmendmentJournal
 from src.graph.loader import load_constitution
 
 
@@ -38,13 +47,20 @@ def clear_database():
         print(f"  ✅ Database cleared!")
 
 
+def rotate_journal(path: str):
+    """Move the amendment journal of the wiped graph aside."""
+    rotated = AmendmentJournal(path).rotate()
+    if rotated is not None:
+        print(f"\n  Journal moved to: {rotated}")
+
+
 def reload_constitution():
     """Reload the constitution from JSON."""
     print("\n" + "="*70)
     print("LOADING CONSTITUTION")
     print("="*70)
 
-    stats = load_constitution()
+    stats = load_constitution(bulk=True)
 
     print("\n  ✅ Constitution loaded successfully!")
     print("\n  Load Statistics:")
@@ -54,12 +70,20 @@ def reload_constitution():
 
 def main():
     """Main execution."""
+    parser = argparse.ArgumentParser(description="Reset the database and reload the constitution")
+    parser.add_argument(
+        "--journal", default="data/journal/amendments.jsonl",
+        help="Amendment journal to rotate (see process_all_amendments.py)",
+    )
+    args = parser.parse_args()
+
     print("\n" + "🔄"*35)
     print("DATABASE RESET AND RELOAD")
     print("🔄"*35)
 
     try:
         clear_database()
+        rotate_journal(args.journal)
         reload_constitution()
 
         print("\n" + "="*70)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Resync the graph with a re-parsed constitution, writing only the changes.
+
+Replaces `reset_database.py` + full reload when Planalto republishes the
+compiled text. The resync is recorded in the amendment journal; snapshots
+taken before it can no longer be restored by replaying the journal.
+"""
+
+import sys
+from pathlib import Path
+import argparse
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.connection import get_connection
+from src.graph.journal import AmendmentJournal
+from src.graph.resync import ConstitutionResync
+from src.graph.temporal_engine import TemporalEngine
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Incrementally resync the constitution graph")
+    parser.add_argument(
+        "json_path", nargs="?", default="data/intermediate/constitution.json",
+        help="Re-parsed constitution JSON",
+    )
+    parser.add_argument("--effective-date", help="Date the changes take effect (default: today)")
+    parser.add_argument("--dry-run", action="store_true", help="Report the diff without writing")
+    parser.add_argument("--journal", default="data/journal/amendments.jsonl")
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("RESYNC CONSTITUTION" + (" (DRY RUN)" if args.dry_run else ""))
+    print("="*70)
+
+    engine = TemporalEngine(get_connection(), journal=AmendmentJournal(args.journal))
+    try:
+        summary = ConstitutionResync(engine=engine).resync(
+            args.json_path,
+            effective_date=args.effective_date,
+            dry_run=args.dry_run,
+        )
+    except ValueError as e:
+        print(f"\n❌ {e}\n")
+        sys.exit(1)
+
+    print(f"\n  Added:     {len(summary['added']):,}")
+    print(f"  Removed:   {len(summary['removed']):,}")
+    print(f"  Changed:   {len(summary['changed']):,}")
+    print(f"    • text:       {summary['text_changed']:,}")
+    print(f"    • structure:  {summary['structure_changed']:,}")
+    print(f"    • reactivated: {summary['reactivated']:,}")
+    print(f"  New ancestor versions: {summary['propagated']:,}")
+    print(f"  Unchanged: {summary['unchanged']:,}")
+
+    for kind in ("added", "removed", "changed"):
+        if summary[kind]:
+            sample = ", ".join(summary[kind][:10])
+            more = f" (+{len(summary[kind]) - 10} more)" if len(summary[kind]) > 10 else ""
+            print(f"\n  {kind}: {sample}{more}")
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Revert one applied amendment (e.g. to re-apply a corrected parse).
+
+Deletes the versions the amendment created and reopens the ones it
+superseded. Amendments applied after it on the same components must be
+reverted first (latest first).
+"""
+
+import sys
+from pathlib import Path
+import argparse
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.connection import get_connection
+from src.graph.journal import AmendmentJournal
+from src.graph.temporal_engine import TemporalEngine
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Revert applied amendments")
+    parser.add_argument("numbers", type=int, nargs="+", help="EC numbers, latest first")
+    parser.add_argument(
+        "--journal", default="data/journal/amendments.jsonl",
+        help="Resume journal to record the revert in"
+    )
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("REVERTING AMENDMENTS")
+    print("="*70)
+
+    engine = TemporalEngine(get_connection(), journal=AmendmentJournal(args.journal))
+
+    for number in args.numbers:
+        try:
+            result = engine.revert_amendment(number)
+        except ValueError as e:
+            print(f"\n   ❌ EC {number}: {e}")
+            sys.exit(1)
+        print(f"\n   ✓ EC {number}: {result['deleted_ctvs']} CTVs deleted, "
+              f"{result['reopened_ctvs']} reopened, "
+              f"{result['deleted_text_units']} TextUnits deleted")
+
+    print("\n" + "="*70)
+    print("✅ Revert complete!")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,16 @@ from src.baseline import create_baseline_retriever
 from src.rag.planner import QueryPlanner
 from src.rag.retriever import HybridRetriever
 from src.evaluation.metrics import temporal_precision, CTV
+from src.graph.memory import InMemoryGraph
 
 
-def evaluate_quick():
-    """Run quick evaluation on 10 handpicked queries."""
+def evaluate_quick(in_memory: bool = False):
+    """Run quick evaluation on 10 handpicked queries.
+
+    Args:
+        in_memory: Replay the parsed data into an InMemoryGraph instead of
+            querying Neo4j
+    """
 
     print("="*80)
     print("QUICK TLR-BENCH EVALUATION")
@@ -24,9 +30,10 @@ def evaluate_quick():
 
     # Initialize
     print("\n🔧 Initializing...")
-    baseline = create_baseline_retriever()
+    conn = InMemoryGraph.build() if in_memory else None
+    baseline = create_baseline_retriever(conn)
     sat_planner = QueryPlanner()
-    sat_retriever = HybridRetriever()
+    sat_retriever = HybridRetriever(conn)
     print(f"   ✅ Baseline: {baseline.get_stats()['total_chunks']} chunks")
     print(f"   ✅ SAT-Graph-RAG: Ready")
 
@@ -142,4 +149,4 @@ def evaluate_quick():
 
 
 if __name__ == "__main__":
-    evaluate_quick()
+    evaluate_quick(in_memory="--in-memory" in sys.argv)
@@ -163,7 +163,24 @@ def test_temporal_consistency():
         checks_passed += 1
     print_check("Active version is latest", invalid == 0)
 
-    # Check 2.4: SUPERSEDES chain is valid
+    # Check 2.4: CURRENT points at the one active version
+    with conn.session() as session:
+        result = list(session.run("""
+            MATCH (c:Component)
+            OPTIONAL MATCH (c)-[:CURRENT]->(cur:CTV)
+            OPTIONAL MATCH (c)-[:HAS_VERSION]->(active:CTV {is_active: true})
+            WITH c, collect(DISTINCT cur) AS current, collect(DISTINCT active) AS active
+            WHERE current <> active
+            RETURN count(c) AS invalid
+        """))
+
+    invalid = result[0]["invalid"]
+    checks_total += 1
+    if invalid == 0:
+        checks_passed += 1
+    print_check("CURRENT matches the active version", invalid == 0, f"{invalid} invalid")
+
+    # Check 2.5: SUPERSEDES chain is valid
     print("\n  🔗 Checking SUPERSEDES relationships...")
     with conn.session() as session:
         result = list(session.run("""
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""Snapshot the temporal graph, or restore a database from a snapshot.
+
+    snapshot  Replay the amendment event log since the latest snapshot and
+              save a new one (run it periodically, e.g. after each batch of
+              amendments; --every skips it until enough events accumulate)
+    restore   Rebuild an empty database from the latest snapshot plus the
+              events after it, in one bulk write
+"""
+
+import sys
+from pathlib import Path
+import argparse
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.journal import AmendmentJournal
+from src.graph.snapshot import SnapshotStore, restore_from_snapshot, take_snapshot
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Graph snapshots and restore")
+    parser.add_argument("command", choices=["snapshot", "restore"])
+    parser.add_argument("--journal", default="data/journal/amendments.jsonl")
+    parser.add_argument("--snapshots", default="data/snapshots")
+    parser.add_argument("--constitution", default="data/intermediate/constitution.json")
+    parser.add_argument(
+        "--every", type=int, default=1, help="Snapshot only after this many new events"
+    )
+    parser.add_argument("--batch-size", type=int, default=None, help="Rows per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Restore in memory only")
+    args = parser.parse_args()
+
+    journal = AmendmentJournal(args.journal)
+    store = SnapshotStore(args.snapshots)
+
+    print("\n" + "="*70)
+    print(f"GRAPH {args.command.upper()}")
+    print("="*70)
+
+    try:
+        if args.command == "snapshot":
+            path = take_snapshot(journal, store, args.constitution, min_events=args.every)
+        else:
+            graph = restore_from_snapshot(
+                journal, store, write=not args.dry_run, batch_size=args.batch_size
+            )
+    except ValueError as e:
+        print(f"\n❌ {e}\n")
+        sys.exit(1)
+
+    if args.command == "snapshot":
+        if path is None:
+            print("\n   Not enough new events; no snapshot written")
+        else:
+            print(f"\n   ✓ Snapshot written: {path}")
+    else:
+        print(f"\n   Components: {len(graph.components):,}")
+        print(f"   CTVs: {len(graph.ctvs):,}")
+        print(f"   Actions: {len(graph.actions):,}")
+        if args.dry_run:
+            print("\n(dry run: nothing written)")
+
+    print("\n" + "="*70)
+    print("✅ Done!")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
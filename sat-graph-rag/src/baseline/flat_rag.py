@@ -7,12 +7,13 @@ This is a standard flat-chunk RAG with no temporal or structural awareness:
 - No amendment tracking or version history
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from dataclasses import dataclass
 import re
 import json
 
 from ..graph.connection import get_connection, Neo4jConnection
+from ..graph.memory import InMemoryGraph
 
 
 @dataclass
@@ -36,7 +37,10 @@ class FlatChunkRAG:
     - Simple keyword matching
     """
 
-    def __init__(self, conn: Optional[Neo4jConnection] = None):
+    # Component types indexed as chunks
+    CHUNK_TYPES = ['article', 'paragraph', 'item']
+
+    def __init__(self, conn: Optional[Union[Neo4jConnection, InMemoryGraph]] = None):
         self.conn = conn or get_connection()
         self.chunks = []
         self._build_flat_index()
@@ -45,9 +49,9 @@ class FlatChunkRAG:
         """Build flat index of current constitution text only."""
         # Get ONLY active (current) versions - no historical data
         query = """
-        MATCH (c:Component)-[:HAS_VERSION]->(v:CTV {is_active: true})
+        MATCH (c:Component)-[:CURRENT]->(v:CTV)
               -[:EXPRESSED_IN]->(:CLV)-[:HAS_TEXT]->(t:TextUnit)
-        WHERE c.component_type IN ['article', 'paragraph', 'item']
+        WHERE c.component_type IN $types
         RETURN c.component_id AS id,
                c.component_type AS type,
                c.ordering_id AS ordering,
@@ -56,8 +60,11 @@ class FlatChunkRAG:
         ORDER BY c.component_id
         """
 
-        with self.conn.session() as session:
-            results = list(session.run(query))
+        if isinstance(self.conn, InMemoryGraph):
+            results = self.conn.current_chunks(self.CHUNK_TYPES)
+        else:
+            with self.conn.session() as session:
+                results = list(session.run(query, {"types": self.CHUNK_TYPES}))
 
         self.chunks = []
         for r in results:
@@ -159,6 +166,8 @@ class FlatChunkRAG:
         }
 
 
-def create_baseline_retriever() -> FlatChunkRAG:
+def create_baseline_retriever(
+    conn: Optional[Union[Neo4jConnection, InMemoryGraph]] = None
+) -> FlatChunkRAG:
     """Convenience function to create baseline retriever."""
-    return FlatChunkRAG()
+    return FlatChunkRAG(conn)
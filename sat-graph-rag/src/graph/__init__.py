@@ -3,6 +3,11 @@
 from .connection import Neo4jConnection, get_connection
 from .schema import SchemaManager, setup_schema
 from .loader import ConstitutionLoader, load_constitution
+from .hierarchy import ComponentHierarchy
+from .model import TemporalGraphModel
+from .memory import InMemoryGraph
+from .offline_builder import OfflineHistoryBuilder, build_full_history
+from .admin_import import AdminImportExporter, export_for_admin_import
 
 __all__ = [
     "Neo4jConnection",
@@ -11,4 +16,11 @@ __all__ = [
     "setup_schema",
     "ConstitutionLoader",
     "load_constitution",
+    "ComponentHierarchy",
+    "TemporalGraphModel",
+    "InMemoryGraph",
+    "OfflineHistoryBuilder",
+    "build_full_history",
+    "AdminImportExporter",
+    "export_for_admin_import",
 ]
@@ -0,0 +1,263 @@
+"""Offline CSV export for `neo4j-admin database import`.
+
+This module is the offline sibling of ConstitutionLoader: instead of writing
+through Bolt transactions it turns the parsed constitution JSON into
+header-annotated node and relationship CSV files that `neo4j-admin` can
+import into an empty database in a single pass.
+
+The IDs (`{comp_id}_v1`, `_pt`, `_pt_text`) and the MD5 `content_hash` are
+produced by the same helpers the online loader uses, so a database built
+from these files is indistinguishable from one built by ConstitutionLoader.
+As online, TextUnits are content-addressed: a text seen before is not
+written again and its CLV links to the first TextUnit with that hash.
+
+Component IDs are only unique within a norm, so when several norms are
+exported together every component ID (and the CTV, CLV and TextUnit IDs
+derived from it) is prefixed with the norm's official_id. A single norm
+keeps the loader's IDs, which the amendment pipeline addresses.
+"""
+
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+from pathlib import Path
+import csv
+import json
+import logging
+
+from .loader import iter_component_rows
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AdminImportExporter:
+    """Writes constitution JSON files as neo4j-admin import CSVs."""
+
+    # Node files: name -> header (neo4j-admin type annotations)
+    NODE_FILES = {
+        "norms": [
+            "official_id:ID(Norm)", "name", "enactment_date:date", "jurisdiction",
+            "document_type", "created_at:datetime", ":LABEL",
+        ],
+        "components": [
+            "component_id:ID(Component)", "component_type", "ordering_id", "norm_id",
+            "parent_id", "created_at:datetime", ":LABEL",
+        ],
+        "ctvs": [
+            "ctv_id:ID(CTV)", "component_id", "version_number:int", "date_start:date",
+            "is_active:boolean", "is_original:boolean", "amendment_numbers:int[]",
+            "created_at:datetime", ":LABEL",
+        ],
+        "clvs": [
+            "clv_id:ID(CLV)", "ctv_id", "language", "created_at:datetime", ":LABEL",
+        ],
+        "text_units": [
+            "text_id:ID(TextUnit)", "clv_id", "header", "content", "full_text",
+            "char_count:int", "content_hash", "created_at:datetime", ":LABEL",
+        ],
+    }
+
+    # Relationship files: name -> header
+    RELATIONSHIP_FILES = {
+        "has_component": [":START_ID(Norm)", ":END_ID(Component)", ":TYPE"],
+        "has_child": [":START_ID(Component)", ":END_ID(Component)", ":TYPE"],
+        "has_version": [":START_ID(Component)", ":END_ID(CTV)", ":TYPE"],
+        "current": [":START_ID(Component)", ":END_ID(CTV)", ":TYPE"],
+        "expressed_in": [":START_ID(CTV)", ":END_ID(CLV)", ":TYPE"],
+        "has_text": [":START_ID(CLV)", ":END_ID(TextUnit)", ":TYPE"],
+        "aggregates": [":START_ID(CTV)", ":END_ID(CTV)", "ordering:int", ":TYPE"],
+    }
+
+    # Separator for array properties (neo4j-admin default)
+    ARRAY_DELIMITER = ";"
+
+    # Row keys holding IDs derived from the component ID
+    ID_KEYS = ("component_id", "parent_id", "ctv_id", "parent_ctv_id", "clv_id", "text_id")
+
+    def __init__(self, output_dir: str = "data/import"):
+        self.output_dir = Path(output_dir)
+        self.stats = {
+            "norms": 0,
+            "components": 0,
+            "ctvs": 0,
+            "clvs": 0,
+            "text_units": 0,
+            "relationships": 0,
+        }
+        # content_hash -> text_id of the TextUnit already written
+        self._text_ids: Dict[str, str] = {}
+
+    def export(
+        self,
+        json_paths: Iterable[str] = ("data/intermediate/constitution.json",),
+        enactment_date: str = "1988-10-05",
+        prefix_ids: Optional[bool] = None,
+    ) -> dict:
+        """Export one or more parsed norms to import CSVs.
+
+        Args:
+            json_paths: Parsed norm JSON files (one Norm each)
+            enactment_date: Date used for the Norm and every v1 CTV
+            prefix_ids: Prefix component IDs with the norm (default: only
+                when more than one norm is exported)
+
+        Returns:
+            Statistics using the same keys as ConstitutionLoader
+        """
+        json_paths = list(json_paths)
+        if prefix_ids is None:
+            prefix_ids = len(json_paths) > 1
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        created_at = datetime.now().isoformat(timespec="seconds")
+
+        files = {}
+        writers: Dict[str, csv.writer] = {}
+        try:
+            for name, header in {**self.NODE_FILES, **self.RELATIONSHIP_FILES}.items():
+                f = open(self.output_dir / f"{name}.csv", "w", encoding="utf-8", newline="")
+                files[name] = f
+                # Every CTV field is present, so quote them all: an empty
+                # amendment_numbers is then "" (an empty array), not an empty
+                # field (no property)
+                quoting = csv.QUOTE_ALL if name == "ctvs" else csv.QUOTE_MINIMAL
+                writers[name] = csv.writer(f, quoting=quoting)
+                writers[name].writerow(header)
+
+            for json_path in json_paths:
+                logger.info(f"Exporting {json_path}")
+                with open(json_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._write_norm(writers, data, enactment_date, created_at, prefix_ids)
+        finally:
+            for f in files.values():
+                f.close()
+
+        logger.info(f"Export complete ({self.output_dir}). Stats: {self.stats}")
+        return self.stats
+
+    def _write_norm(
+        self,
+        writers: Dict[str, csv.writer],
+        data: dict,
+        enactment_date: str,
+        created_at: str,
+        prefix_ids: bool = False,
+    ):
+        """Write the Norm node and its whole component tree."""
+        norm_id = data.get("official_id", "CF1988")
+        writers["norms"].writerow([
+            norm_id,
+            data.get("name", "Constituição da República Federativa do Brasil"),
+            enactment_date,
+            "Brazil",
+            "Constitution",
+            created_at,
+            "Norm",
+        ])
+        self.stats["norms"] += 1
+
+        for row in iter_component_rows(data.get("components", []), norm_id, enactment_date):
+            if prefix_ids:
+                row = self._prefixed(row, norm_id)
+            self._write_row(writers, row, created_at)
+
+    @classmethod
+    def _prefixed(cls, row: dict, norm_id: str) -> dict:
+        """The row with its component-derived IDs prefixed by the norm."""
+        return {
+            **row,
+            **{key: f"{norm_id}_{row[key]}" for key in cls.ID_KEYS if row[key]},
+        }
+
+    def _write_row(self, writers: Dict[str, csv.writer], row: dict, created_at: str):
+        """Write the node chain and links for one component row."""
+        comp_id = row["component_id"]
+        ctv_id = row["ctv_id"]
+        clv_id = row["clv_id"]
+        content_hash = row["content_hash"]
+        text_id = self._text_ids.get(content_hash)
+
+        writers["components"].writerow([
+            comp_id, row["component_type"], row["ordering_id"], row["norm_id"],
+            row["parent_id"], created_at, "Component",
+        ])
+        writers["ctvs"].writerow([
+            ctv_id, comp_id, row["version_number"], row["date_start"], self._bool(True),
+            self._bool(row["is_original"]), self._array(row["amendment_numbers"]),
+            created_at, "CTV",
+        ])
+        writers["clvs"].writerow([clv_id, ctv_id, row["language"], created_at, "CLV"])
+        if text_id is None:
+            text_id = self._text_ids[content_hash] = row["text_id"]
+            writers["text_units"].writerow([
+                text_id, clv_id, row["header"], row["content"], row["full_text"],
+                len(row["full_text"]), content_hash, created_at, "TextUnit",
+            ])
+            self.stats["text_units"] += 1
+
+        if row["parent_id"]:
+            writers["has_child"].writerow([row["parent_id"], comp_id, "HAS_CHILD"])
+        else:
+            writers["has_component"].writerow([row["norm_id"], comp_id, "HAS_COMPONENT"])
+        writers["has_version"].writerow([comp_id, ctv_id, "HAS_VERSION"])
+        writers["current"].writerow([comp_id, ctv_id, "CURRENT"])
+        writers["expressed_in"].writerow([ctv_id, clv_id, "EXPRESSED_IN"])
+        writers["has_text"].writerow([clv_id, text_id, "HAS_TEXT"])
+        if row["parent_ctv_id"]:
+            writers["aggregates"].writerow(
+                [row["parent_ctv_id"], ctv_id, row["ordering"], "AGGREGATES"]
+            )
+
+        self.stats["components"] += 1
+        self.stats["ctvs"] += 1
+        self.stats["clvs"] += 1
+        # As in ConstitutionLoader, CURRENT (a pointer to the active version)
+        # is not counted
+        self.stats["relationships"] += 5 if row["parent_ctv_id"] else 4
+
+    def _array(self, values: List) -> str:
+        """Encode a list property with the import array delimiter."""
+        return self.ARRAY_DELIMITER.join(str(v) for v in values)
+
+    @staticmethod
+    def _bool(value: bool) -> str:
+        """Encode a boolean the way neo4j-admin parses it."""
+        return "true" if value else "false"
+
+    def import_command(self, database: str = "neo4j") -> str:
+        """Build the neo4j-admin command that imports the exported files."""
+        args = ["neo4j-admin", "database", "import", "full", database, "--overwrite-destination"]
+        for name in self.NODE_FILES:
+            args.append(f"--nodes={self.output_dir / f'{name}.csv'}")
+        for name in self.RELATIONSHIP_FILES:
+            args.append(f"--relationships={self.output_dir / f'{name}.csv'}")
+        args.append("--multiline-fields=true")
+        args.append(f"--array-delimiter={self.ARRAY_DELIMITER}")
+        return " ".join(args)
+
+
+def export_for_admin_import(
+    json_path: str = "data/intermediate/constitution.json",
+    output_dir: str = "data/import",
+) -> dict:
+    """Convenience function to export the constitution for neo4j-admin.
+
+    Args:
+        json_path: Path to parsed constitution JSON
+        output_dir: Directory for the generated CSV files
+
+    Returns:
+        Export statistics
+    """
+    exporter = AdminImportExporter(output_dir)
+    return exporter.export([json_path])
+
+
+if __name__ == "__main__":
+    exporter = AdminImportExporter()
+    stats = exporter.export()
+    print("\nExport Statistics:")
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+    print("\nImport with:")
+    print(f"  {exporter.import_command()}")
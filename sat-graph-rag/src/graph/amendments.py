@@ -0,0 +1,92 @@
+"""Helpers that turn parsed amendments into TemporalEngine change lists.
+
+Shared by the online replay (scripts/process_all_amendments.py) and the
+offline history builder so both apply exactly the same changes.
+"""
+
+from typing import Dict, Iterable, List
+import json
+
+
+def load_amendments(
+    path: str = "data/intermediate/amendments/parsed_amendments.json",
+) -> List[Dict]:
+    """Load parsed amendment data."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_article_mapping(articles: Iterable[Dict]) -> Dict[str, str]:
+    """
+    Build a mapping from article numbers to component IDs.
+
+    Args:
+        articles: Article components with `component_id` and `ordering_id`
+
+    Returns:
+        Dict mapping "5" -> "tit_01_art_5" (or similar)
+    """
+    mapping = {}
+    for article in articles:
+        comp_id = article["component_id"]
+        ordering = article.get("ordering_id")
+
+        # Extract article number from component_id or ordering
+        # e.g., "tit_01_art_1" -> "1" or "art_5" -> "5"
+        if ordering:
+            mapping[ordering] = comp_id
+
+        # Also try to extract from ID
+        if "_art_" in comp_id:
+            parts = comp_id.split("_art_")
+            if len(parts) > 1:
+                art_num = parts[1].split("_")[0]
+                mapping[art_num] = comp_id
+
+    return mapping
+
+
+def changes_for_amendment(amendment: Dict, mapping: Dict[str, str]) -> List[Dict]:
+    """
+    Collect the component changes of one parsed amendment.
+
+    Articles that are not in the mapping are ignored.
+
+    Args:
+        amendment: Parsed amendment (number, articles_modified/added/repealed)
+        mapping: Article number -> component ID mapping
+
+    Returns:
+        List of {component_id, new_content, change_type}
+    """
+    number = amendment["number"]
+    changes = []
+
+    # Modified articles
+    for art_num in amendment.get("articles_modified", []):
+        if art_num in mapping:
+            changes.append({
+                "component_id": mapping[art_num],
+                "new_content": f"Modified by EC {number}",
+                "change_type": "modify"
+            })
+
+    # Added articles (treat as modify if exists, skip if new)
+    for art_num in amendment.get("articles_added", []):
+        if art_num in mapping:
+            changes.append({
+                "component_id": mapping[art_num],
+                "new_content": f"Added/Modified by EC {number}",
+                "change_type": "modify"
+            })
+
+    # Repealed articles
+    for art_num in amendment.get("articles_repealed", []):
+        if art_num in mapping:
+            changes.append({
+                "component_id": mapping[art_num],
+                "new_content": "",
+                "change_type": "repeal"
+            })
+
+    return changes
@@ -0,0 +1,108 @@
+"""Epochs: the distinct states of the constitution.
+
+Between two consecutive dates on which some version starts or ends, the
+constitution does not change. Each of those intervals is an epoch: epoch
+0 starts at enactment, epoch n at the n-th distinct later boundary (an
+amendment date or a resync's effective date). Any query date maps to its
+epoch with a bisect, and every date of an epoch has the same
+point-in-time answer as the epoch's start date, so answers, renders and
+caches can be keyed by epoch instead of by raw date.
+
+Boundaries are read from the versions themselves, so every change to the
+graph is covered; call `invalidate()` after writing versions.
+"""
+
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Tuple
+import logging
+
+from .connection import get_connection, Neo4jConnection
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class EpochIndex:
+    """Sorted epoch start dates, loaded lazily from the graph."""
+
+    # Enactment plus every date a version starts or ends (resyncs have no Action)
+    BOUNDARIES_QUERY = """
+    MATCH (n:Norm)
+    RETURN toString(n.enactment_date) AS date
+    UNION
+    MATCH (v:CTV)
+    UNWIND [v.date_start, v.date_end] AS boundary
+    WITH DISTINCT boundary WHERE boundary IS NOT NULL
+    RETURN toString(boundary) AS date
+    """
+
+    def __init__(self, conn: Optional[Neo4jConnection] = None):
+        self.conn = conn
+        self._starts: Optional[List[str]] = None
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[Optional[str]]) -> "EpochIndex":
+        """Build an index from boundary dates ("YYYY-MM-DD"; None is ignored)."""
+        index = cls()
+        index._index(dates)
+        return index
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._starts is not None
+
+    def load(self) -> "EpochIndex":
+        """Read the epoch boundaries from the graph (replacing the cache)."""
+        conn = self.conn or get_connection()
+        with conn.session() as session:
+            records = session.run(self.BOUNDARIES_QUERY).data()
+        self._index(r["date"] for r in records)
+        logger.info(f"Loaded {len(self._starts)} epochs")
+        return self
+
+    def ensure_loaded(self) -> "EpochIndex":
+        if not self.is_loaded:
+            self.load()
+        return self
+
+    def invalidate(self):
+        """Drop the cached boundaries; they are reloaded on next use."""
+        self._starts = None
+
+    def _index(self, dates: Iterable[Optional[str]]):
+        self._starts = sorted({d for d in dates if d})
+
+    def epoch_of(self, date_str: str) -> Optional[int]:
+        """Epoch a date falls in (None before enactment)."""
+        self.ensure_loaded()
+        epoch = bisect_right(self._starts, date_str) - 1
+        return epoch if epoch >= 0 else None
+
+    def start(self, epoch: int) -> str:
+        """First date of an epoch (its canonical date)."""
+        self.ensure_loaded()
+        return self._starts[epoch]
+
+    def end(self, epoch: int) -> Optional[str]:
+        """First date after an epoch (None for the current one)."""
+        self.ensure_loaded()
+        return self._starts[epoch + 1] if epoch + 1 < len(self._starts) else None
+
+    def canonical_date(self, date_str: str) -> str:
+        """Start of the epoch of a date (the date itself before enactment)."""
+        epoch = self.epoch_of(date_str)
+        return date_str if epoch is None else self._starts[epoch]
+
+    def epochs(self) -> List[Tuple[int, str, Optional[str]]]:
+        """(epoch, start, end) of every epoch, oldest first."""
+        self.ensure_loaded()
+        return [(epoch, self.start(epoch), self.end(epoch)) for epoch in range(len(self))]
+
+    @property
+    def current(self) -> int:
+        """The latest epoch."""
+        return len(self) - 1
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return len(self._starts)
@@ -0,0 +1,129 @@
+"""In-memory cache of the Component hierarchy.
+
+The HAS_CHILD tree is fixed while amendments are replayed, so instead of
+running variable-length path queries per changed component, the parent map
+is read once and ancestor, depth and subtree questions are answered in
+memory in O(depth) (O(size) for subtrees).
+
+The cache is not refreshed automatically: call `invalidate()` after
+anything that changes the structure (e.g. a resync).
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+import logging
+
+from .connection import get_connection, Neo4jConnection
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ComponentHierarchy:
+    """Parent/child map of every Component, loaded lazily from the graph."""
+
+    PARENT_MAP_QUERY = """
+    MATCH (c:Component)
+    OPTIONAL MATCH (p:Component)-[:HAS_CHILD]->(c)
+    RETURN c.component_id AS component_id, p.component_id AS parent_id
+    """
+
+    def __init__(self, conn: Optional[Neo4jConnection] = None):
+        self.conn = conn
+        self._parents: Optional[Dict[str, Optional[str]]] = None
+        self._children: Dict[str, List[str]] = {}
+        self._depths: Dict[str, int] = {}
+
+    @classmethod
+    def from_parent_map(cls, parents: Dict[str, Optional[str]]) -> "ComponentHierarchy":
+        """Build a hierarchy from component_id -> parent_id (None for roots)."""
+        hierarchy = cls()
+        hierarchy._index(parents)
+        return hierarchy
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._parents is not None
+
+    def load(self) -> "ComponentHierarchy":
+        """Read the parent map from the graph (replacing any cached one)."""
+        conn = self.conn or get_connection()
+        with conn.session() as session:
+            records = session.run(self.PARENT_MAP_QUERY).data()
+        self._index({r["component_id"]: r["parent_id"] for r in records})
+        logger.info(f"Loaded hierarchy of {len(self._parents)} components")
+        return self
+
+    def ensure_loaded(self) -> "ComponentHierarchy":
+        if not self.is_loaded:
+            self.load()
+        return self
+
+    def invalidate(self):
+        """Drop the cached hierarchy; it is reloaded on next use."""
+        self._parents = None
+        self._children = {}
+        self._depths = {}
+
+    def _index(self, parents: Dict[str, Optional[str]]):
+        self._parents = dict(parents)
+        self._children = {}
+        for comp_id, parent_id in self._parents.items():
+            if parent_id is not None:
+                self._children.setdefault(parent_id, []).append(comp_id)
+        self._depths = {}
+
+    def parent(self, component_id: str) -> Optional[str]:
+        self.ensure_loaded()
+        return self._parents.get(component_id)
+
+    def children(self, component_id: str) -> List[str]:
+        self.ensure_loaded()
+        return list(self._children.get(component_id, []))
+
+    def ancestors(self, component_id: str) -> List[str]:
+        """Ancestors of a component, nearest first, up to the root."""
+        self.ensure_loaded()
+        chain = []
+        parent_id = self._parents.get(component_id)
+        while parent_id is not None:
+            chain.append(parent_id)
+            parent_id = self._parents.get(parent_id)
+        return chain
+
+    def depth(self, component_id: str) -> int:
+        """Number of HAS_CHILD hops from the root (roots have depth 0)."""
+        self.ensure_loaded()
+        depth = self._depths.get(component_id)
+        if depth is None:
+            depth = len(self.ancestors(component_id))
+            self._depths[component_id] = depth
+        return depth
+
+    def subtree(self, component_id: str) -> List[str]:
+        """A component and all of its descendants, depth-first preorder."""
+        self.ensure_loaded()
+        result = []
+        stack = [component_id]
+        while stack:
+            comp_id = stack.pop()
+            result.append(comp_id)
+            stack.extend(reversed(self._children.get(comp_id, [])))
+        return result
+
+    def ancestors_of(self, component_ids: Iterable[str]) -> Set[str]:
+        """Union of the ancestors of several components."""
+        result: Set[str] = set()
+        for comp_id in component_ids:
+            result.update(self.ancestors(comp_id))
+        return result
+
+    def group_by_depth(
+        self,
+        component_ids: Iterable[str],
+        reverse: bool = False
+    ) -> List[List[str]]:
+        """Group components by depth (shallowest level first unless reversed)."""
+        levels: Dict[int, List[str]] = {}
+        for comp_id in sorted(component_ids):
+            levels.setdefault(self.depth(comp_id), []).append(comp_id)
+        return [levels[d] for d in sorted(levels, reverse=reverse)]
@@ -0,0 +1,210 @@
+"""Durable event log of amendment replay.
+
+AmendmentJournal is an append-only JSON Lines file of immutable events:
+one per committed amendment (the whole amendment, not its individual
+changes: its date, full change list, stats and the CTV IDs it allocated),
+one per reverted amendment, which cancels the earlier entry, and one per
+ConstitutionResync that wrote changes (its effective date and summary;
+resyncs are recorded, not replayable). Events are numbered by `seq`.
+Each event is flushed and fsynced before apply_amendment returns, so
+after an interruption a replay skips every journaled amendment with one
+read of its Action instead of a write transaction.
+
+The journal is a fast path, not the source of truth: TemporalEngine also
+marks each Action `status: 'committed'` inside the amendment's own
+transaction. An amendment that committed just before a crash (and never
+reached the journal) is still detected and skipped, and its entry is
+written then; a journaled amendment whose Action is gone (the database
+was reset) is applied again. `rotate()` starts a new journal when the
+database is wiped.
+
+Because amendment events carry the full changes, the graph can be rebuilt
+from a snapshot plus the events after it (see snapshot.py), unless a
+resync is among them.
+"""
+
+from typing import Dict, Iterator, List, Optional
+from datetime import datetime
+from pathlib import Path
+import json
+import logging
+import os
+import threading
+import uuid
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AmendmentJournal:
+    """Append-only event log of committed and reverted amendments."""
+
+    def __init__(self, path: str = "data/journal/amendments.jsonl"):
+        self.path = Path(path)
+        self._entries: Optional[Dict[int, dict]] = None
+        self._last_seq = 0
+        self._journal_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def entries(self) -> Dict[int, dict]:
+        """Committed (and not reverted) amendments by number, read once."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = {}
+                for event in self._iter_file():
+                    if "journal_id" in event:
+                        # The header line written when the journal was started
+                        self._journal_id = event.get("journal_id")
+                        continue
+                    self._last_seq = max(self._last_seq, event.get("seq", 0))
+                    if event.get("resync"):
+                        continue
+                    if event.get("reverted"):
+                        self._entries.pop(event["amendment_number"], None)
+                    else:
+                        self._entries[event["amendment_number"]] = event
+                logger.info(f"Journal {self.path}: {len(self._entries)} committed amendments")
+            return self._entries
+
+    def events(self, after_seq: int = 0) -> Iterator[dict]:
+        """Events in the order they were written, after a sequence number."""
+        for event in self._iter_file():
+            if event.get("seq", 0) > after_seq:
+                yield event
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the latest event (0 if none)."""
+        self.entries()
+        return self._last_seq
+
+    @property
+    def journal_id(self) -> Optional[str]:
+        """ID of this journal (None for journals written before IDs existed).
+
+        Sequence numbers restart in every journal, so snapshots are tied to
+        the journal ID as well as to a sequence number.
+        """
+        self.entries()
+        return self._journal_id
+
+    def rotate(self) -> Optional[Path]:
+        """Move the journal aside (timestamped) and start an empty one.
+
+        The new journal gets a new ID, so snapshots of the old one are not
+        mistaken for its own.
+
+        Returns:
+            Where the old journal was moved, or None if there was none
+        """
+        with self._lock:
+            self._entries = None
+            self._last_seq = 0
+            rotated = None
+            if self.path.exists():
+                stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+                rotated = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+                self.path.rename(rotated)
+                logger.info(f"Journal rotated to {rotated}")
+            self._start()
+        return rotated
+
+    def _start(self):
+        """Create the journal file with its header line (a new journal ID)."""
+        self._journal_id = f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        header = {"journal_id": self._journal_id,
+                  "created_at": datetime.now().isoformat(timespec="seconds")}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _iter_file(self) -> Iterator[dict]:
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A write interrupted mid-line; the graph check covers it
+                    logger.warning(f"{self.path}:{line_number}: skipping incomplete entry")
+
+    def is_committed(self, amendment_number: int) -> bool:
+        return amendment_number in self.entries()
+
+    def record(
+        self,
+        amendment_number: int,
+        amendment_date: str,
+        changes: List[Dict],
+        stats: Optional[Dict] = None,
+        ctv_ids: Optional[List[str]] = None,
+        recovered: bool = False,
+        description: str = "",
+    ) -> dict:
+        """Append a committed amendment and fsync the journal.
+
+        Args:
+            amendment_number: EC number
+            amendment_date: Date string "YYYY-MM-DD"
+            changes: The amendment's changes, as given to apply_amendment
+            stats: Stats of the transaction that committed it
+            ctv_ids: CTVs created by it
+            recovered: Found committed in the graph but missing from the journal
+            description: Amendment description
+
+        Returns:
+            The journal entry
+        """
+        entry = {
+            "amendment_number": amendment_number,
+            "amendment_date": amendment_date,
+            "description": description,
+            "changes": [
+                {
+                    "component_id": c["component_id"],
+                    "change_type": c.get("change_type", "modify"),
+                    "new_content": c.get("new_content", ""),
+                }
+                for c in changes
+            ],
+            "stats": stats,
+            "ctv_ids": ctv_ids,
+            "recovered": recovered,
+        }
+        self._append(entry)
+        return entry
+
+    def record_revert(self, amendment_number: int) -> dict:
+        """Append a revert, so a later replay applies the amendment again."""
+        entry = {"amendment_number": amendment_number, "reverted": True}
+        self._append(entry)
+        return entry
+
+    def record_resync(self, effective_date: str, summary: dict) -> dict:
+        """Append a resync, which changed the graph outside of amendments."""
+        entry = {"resync": True, "effective_date": effective_date, "summary": summary}
+        self._append(entry)
+        return entry
+
+    def _append(self, entry: dict):
+        entries = self.entries()
+        with self._lock:
+            self._last_seq += 1
+            entry["seq"] = self._last_seq
+            entry["committed_at"] = datetime.now().isoformat(timespec="seconds")
+            if not self.path.exists():
+                self._start()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            if entry.get("reverted"):
+                entries.pop(entry["amendment_number"], None)
+            elif not entry.get("resync"):
+                entries[entry["amendment_number"]] = entry
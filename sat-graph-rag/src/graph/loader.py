@@ -5,11 +5,14 @@ creating the full node chain: Norm -> Component -> CTV -> CLV -> TextUnit
 with proper AGGREGATES relationships between CTVs.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 import logging
 import hashlib
+import os
+import threading
 
 from .connection import get_connection, Neo4jConnection
 from .schema import SchemaManager
@@ -18,9 +21,244 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def compute_content_hash(full_text: str) -> str:
+    """Compute the short MD5 hash stored on TextUnit.content_hash."""
+    return hashlib.md5(full_text.encode()).hexdigest()[:16]
+
+
+def build_component_row(
+    component: dict,
+    norm_id: str,
+    parent_id: Optional[str],
+    parent_ctv_id: Optional[str],
+    enactment_date: str,
+    ordering: int,
+) -> dict:
+    """Flatten one parsed component into the row written by the bulk loader.
+
+    The row carries everything needed for the Component -> CTV -> CLV -> TextUnit
+    chain plus its HAS_CHILD / AGGREGATES / HAS_COMPONENT links, using the same
+    IDs as the per-node path.
+    """
+    comp_id = component.get("component_id")
+    ctv_id = f"{comp_id}_v1"
+    clv_id = f"{ctv_id}_pt"
+    full_text = component.get("full_text", "")
+    events = component.get("events", [])
+
+    return {
+        "component_id": comp_id,
+        "component_type": component.get("component_type"),
+        "ordering_id": component.get("ordering_id", ""),
+        "norm_id": norm_id,
+        "parent_id": parent_id,
+        "parent_ctv_id": parent_ctv_id,
+        "ordering": ordering,
+        "ctv_id": ctv_id,
+        "version_number": 1,
+        "date_start": enactment_date,
+        "is_original": component.get("is_original", True),
+        "amendment_numbers": [
+            e.get("amendment_number") for e in events if e.get("amendment_number")
+        ],
+        "clv_id": clv_id,
+        "language": "pt",
+        "text_id": f"{clv_id}_text",
+        "header": component.get("header"),
+        "content": component.get("content"),
+        "full_text": full_text,
+        "content_hash": compute_content_hash(full_text),
+    }
+
+
+def iter_subtree_rows(
+    component: dict,
+    norm_id: str,
+    enactment_date: str,
+    ordering: int,
+    parent_id: Optional[str] = None,
+    parent_ctv_id: Optional[str] = None,
+) -> Iterator[dict]:
+    """Yield rows for one component and its descendants, depth-first."""
+    row = build_component_row(
+        component=component,
+        norm_id=norm_id,
+        parent_id=parent_id,
+        parent_ctv_id=parent_ctv_id,
+        enactment_date=enactment_date,
+        ordering=ordering,
+    )
+    yield row
+    yield from iter_component_rows(
+        components=component.get("children", []),
+        norm_id=norm_id,
+        enactment_date=enactment_date,
+        parent_id=row["component_id"],
+        parent_ctv_id=row["ctv_id"],
+    )
+
+
+def iter_component_rows(
+    components: List[dict],
+    norm_id: str,
+    enactment_date: str,
+    parent_id: Optional[str] = None,
+    parent_ctv_id: Optional[str] = None,
+) -> Iterator[dict]:
+    """Yield component rows depth-first, parents before their children."""
+    for idx, component in enumerate(components):
+        yield from iter_subtree_rows(
+            component=component,
+            norm_id=norm_id,
+            enactment_date=enactment_date,
+            ordering=idx + 1,
+            parent_id=parent_id,
+            parent_ctv_id=parent_ctv_id,
+        )
+
+
+def count_subtree(component: dict) -> int:
+    """Count a component and all of its descendants."""
+    return 1 + sum(count_subtree(child) for child in component.get("children", []))
+
+
+def balance_shards(components: List[dict], n_shards: int) -> List[List[Tuple[int, dict]]]:
+    """Split top-level components into shards of similar total size.
+
+    Uses longest-processing-time-first assignment on subtree sizes.
+
+    Returns:
+        Shards of (ordering, component) pairs, largest shard first
+    """
+    shards: List[List[Tuple[int, dict]]] = [[] for _ in range(max(1, n_shards))]
+    sizes = [0] * len(shards)
+    ranked = sorted(
+        enumerate(components, start=1),
+        key=lambda item: count_subtree(item[1]),
+        reverse=True,
+    )
+    for ordering, component in ranked:
+        target = sizes.index(min(sizes))
+        shards[target].append((ordering, component))
+        sizes[target] += count_subtree(component)
+    return [shard for shard in shards if shard]
+
+
 class ConstitutionLoader:
     """Loads parsed constitution into Neo4j graph."""
 
+    # Rows written per explicit transaction in bulk mode
+    DEFAULT_BATCH_SIZE = 1000
+
+    # UNWIND statements run (in order) for every bulk batch.
+    # Each entry is (name, query, row keys sent to the server).
+    BULK_STATEMENTS = [
+        (
+            "components",
+            """
+            UNWIND $rows AS row
+            MERGE (c:Component {component_id: row.component_id})
+            ON CREATE SET
+                c.component_type = row.component_type,
+                c.ordering_id = row.ordering_id,
+                c.norm_id = row.norm_id,
+                c.parent_id = row.parent_id,
+                c.created_at = datetime()
+            """,
+            ("component_id", "component_type", "ordering_id", "norm_id", "parent_id"),
+        ),
+        (
+            "has_child",
+            """
+            UNWIND $rows AS row
+            WITH row WHERE row.parent_id IS NOT NULL
+            MATCH (parent:Component {component_id: row.parent_id})
+            MATCH (child:Component {component_id: row.component_id})
+            MERGE (parent)-[:HAS_CHILD]->(child)
+            """,
+            ("component_id", "parent_id"),
+        ),
+        (
+            "ctvs",
+            """
+            UNWIND $rows AS row
+            MATCH (c:Component {component_id: row.component_id})
+            MERGE (v:CTV {ctv_id: row.ctv_id})
+            ON CREATE SET
+                v.component_id = row.component_id,
+                v.version_number = row.version_number,
+                v.date_start = date(row.date_start),
+                v.date_end = null,
+                v.is_active = true,
+                v.is_original = row.is_original,
+                v.amendment_numbers = row.amendment_numbers,
+                v.created_at = datetime()
+            MERGE (c)-[:HAS_VERSION]->(v)
+            WITH c, v
+            WHERE v.is_active AND NOT (c)-[:CURRENT]->(:CTV)
+            CREATE (c)-[:CURRENT]->(v)
+            """,
+            (
+                "component_id", "ctv_id", "version_number", "date_start",
+                "is_original", "amendment_numbers",
+            ),
+        ),
+        (
+            "clvs",
+            """
+            UNWIND $rows AS row
+            MATCH (v:CTV {ctv_id: row.ctv_id})
+            MERGE (l:CLV {clv_id: row.clv_id})
+            ON CREATE SET
+                l.ctv_id = row.ctv_id,
+                l.language = row.language,
+                l.created_at = datetime()
+            MERGE (v)-[:EXPRESSED_IN]->(l)
+            """,
+            ("ctv_id", "clv_id", "language"),
+        ),
+        (
+            "text_units",
+            """
+            UNWIND $rows AS row
+            MATCH (l:CLV {clv_id: row.clv_id})
+            MERGE (t:TextUnit {content_hash: row.content_hash})
+            ON CREATE SET
+                t.text_id = row.text_id,
+                t.clv_id = row.clv_id,
+                t.header = row.header,
+                t.content = row.content,
+                t.full_text = row.full_text,
+                t.char_count = size(row.full_text),
+                t.created_at = datetime()
+            MERGE (l)-[:HAS_TEXT]->(t)
+            """,
+            ("clv_id", "text_id", "header", "content", "full_text", "content_hash"),
+        ),
+        (
+            "aggregates",
+            """
+            UNWIND $rows AS row
+            WITH row WHERE row.parent_ctv_id IS NOT NULL
+            MATCH (parent:CTV {ctv_id: row.parent_ctv_id})
+            MATCH (child:CTV {ctv_id: row.ctv_id})
+            MERGE (parent)-[:AGGREGATES {ordering: row.ordering}]->(child)
+            """,
+            ("ctv_id", "parent_ctv_id", "ordering"),
+        ),
+        (
+            "has_component",
+            """
+            UNWIND $rows AS row
+            WITH row WHERE row.parent_id IS NULL
+            MATCH (n:Norm {official_id: row.norm_id})
+            MATCH (c:Component {component_id: row.component_id})
+            MERGE (n)-[:HAS_COMPONENT]->(c)
+            """,
+            ("component_id", "parent_id", "norm_id"),
+        ),
+    ]
+
     def __init__(self, conn: Optional[Neo4jConnection] = None):
         self.conn = conn or get_connection()
         self.stats = {
@@ -31,17 +269,26 @@ class ConstitutionLoader:
             "text_units": 0,
             "relationships": 0,
         }
+        # Content hashes already written (TextUnits are shared by hash)
+        self._seen_hashes: Set[str] = set()
+        self._hash_lock = threading.Lock()
 
     def load_from_json(
         self,
         json_path: str = "data/intermediate/constitution.json",
         enactment_date: str = "1988-10-05",
+        bulk: bool = False,
+        batch_size: Optional[int] = None,
     ) -> dict:
         """Load constitution from parsed JSON.
 
         Args:
             json_path: Path to parsed constitution JSON
             enactment_date: Date the constitution was enacted
+            bulk: Write batched UNWIND statements instead of one
+                statement per node
+            batch_size: Components per bulk transaction
+                (defaults to DEFAULT_BATCH_SIZE)
 
         Returns:
             Statistics about loaded nodes and relationships
@@ -59,6 +306,16 @@ class ConstitutionLoader:
             enactment_date=enactment_date,
         )
 
+        if bulk:
+            self._load_bulk(
+                components=data.get("components", []),
+                norm_id=norm_id,
+                enactment_date=enactment_date,
+                batch_size=batch_size or self.DEFAULT_BATCH_SIZE,
+            )
+            logger.info(f"Bulk load complete. Stats: {self.stats}")
+            return self.stats
+
         # Process top-level components (Titles)
         for idx, component in enumerate(data.get("components", [])):
             self._load_component(
@@ -73,6 +330,166 @@ class ConstitutionLoader:
         logger.info(f"Load complete. Stats: {self.stats}")
         return self.stats
 
+    def _load_bulk(
+        self,
+        components: List[dict],
+        norm_id: str,
+        enactment_date: str,
+        batch_size: int,
+    ):
+        """Write the component tree in batches, one transaction per batch.
+
+        Rows are produced depth-first, so a parent is always written in the
+        same or an earlier batch than its children.
+        """
+        batch: List[dict] = []
+        with self.conn.session() as session:
+            for row in iter_component_rows(components, norm_id, enactment_date):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    self._flush_batch(session, batch)
+                    batch = []
+            if batch:
+                self._flush_batch(session, batch)
+
+    def _flush_batch(
+        self,
+        session,
+        rows: List[dict],
+        link_roots: bool = True,
+        stats: Optional[dict] = None,
+    ):
+        """Write one batch of rows in an explicit write transaction."""
+        session.execute_write(self._write_rows, rows, link_roots)
+        self._count_rows(rows, stats)
+        logger.debug(f"Wrote batch of {len(rows)} components")
+
+    @classmethod
+    def _write_rows(cls, tx, rows: List[dict], link_roots: bool = True):
+        """Run every bulk UNWIND statement for a batch of rows."""
+        for name, query, keys in cls.BULK_STATEMENTS:
+            if name == "has_component" and not link_roots:
+                continue
+            tx.run(query, {"rows": [{k: row[k] for k in keys} for row in rows]}).consume()
+
+    def _count_rows(self, rows: List[dict], stats: Optional[dict] = None):
+        """Update stats exactly as the per-node path would for these rows."""
+        stats = self.stats if stats is None else stats
+        for row in rows:
+            stats["components"] += 1
+            stats["ctvs"] += 1
+            stats["clvs"] += 1
+            self._count_text_unit(row["content_hash"], stats)
+            # HAS_CHILD or HAS_COMPONENT, HAS_VERSION, EXPRESSED_IN, HAS_TEXT
+            stats["relationships"] += 4
+            if row["parent_ctv_id"]:
+                stats["relationships"] += 1  # AGGREGATES
+
+    def load_parallel(
+        self,
+        json_path: str = "data/intermediate/constitution.json",
+        enactment_date: str = "1988-10-05",
+        max_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> dict:
+        """Load the constitution with one worker per shard of Title subtrees.
+
+        Top-level Titles are independent subtrees, so after the Norm, the
+        Title Components and their HAS_COMPONENT links exist, each shard is
+        written concurrently on its own session using the bulk statements.
+        Workers are threads: the work is dominated by server-side writes and
+        the driver is thread-safe (sessions are not shared between workers).
+
+        Args:
+            json_path: Path to parsed constitution JSON
+            enactment_date: Date the constitution was enacted
+            max_workers: Worker threads (defaults to the CPU count)
+            batch_size: Components per bulk transaction
+
+        Returns:
+            Statistics merged from all workers
+        """
+        logger.info(f"Loading constitution from {json_path} in parallel")
+
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        norm_id = data.get("official_id", "CF1988")
+        self._create_norm(
+            official_id=norm_id,
+            name=data.get("name", "Constituição da República Federativa do Brasil"),
+            enactment_date=enactment_date,
+        )
+
+        components = data.get("components", [])
+        if not components:
+            return self.stats
+
+        # Roots first, so workers never contend on the Norm node
+        roots = [
+            build_component_row(c, norm_id, None, None, enactment_date, idx + 1)
+            for idx, c in enumerate(components)
+        ]
+        with self.conn.session() as session:
+            session.execute_write(self._write_roots, roots)
+
+        max_workers = max_workers or os.cpu_count() or 1
+        shards = balance_shards(components, min(max_workers, len(components)))
+        batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            futures = [
+                pool.submit(self._load_shard, shard, norm_id, enactment_date, batch_size)
+                for shard in shards
+            ]
+            for future in futures:
+                for key, value in future.result().items():
+                    self.stats[key] += value
+
+        logger.info(f"Parallel load complete ({len(shards)} workers). Stats: {self.stats}")
+        return self.stats
+
+    @classmethod
+    def _write_roots(cls, tx, rows: List[dict]):
+        """Create top-level Components and link them to the Norm."""
+        for name, query, keys in cls.BULK_STATEMENTS:
+            if name in ("components", "has_component"):
+                tx.run(query, {"rows": [{k: row[k] for k in keys} for row in rows]}).consume()
+
+    def _load_shard(
+        self,
+        shard: List[Tuple[int, dict]],
+        norm_id: str,
+        enactment_date: str,
+        batch_size: int,
+    ) -> dict:
+        """Write the subtrees of one shard on a dedicated session.
+
+        Returns:
+            Stats for this shard only
+        """
+        stats = {key: 0 for key in self.stats}
+        batch: List[dict] = []
+        with self.conn.session() as session:
+            for ordering, component in shard:
+                for row in iter_subtree_rows(component, norm_id, enactment_date, ordering):
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        self._flush_batch(session, batch, link_roots=False, stats=stats)
+                        batch = []
+            if batch:
+                self._flush_batch(session, batch, link_roots=False, stats=stats)
+        return stats
+
+    def _count_text_unit(self, content_hash: str, stats: Optional[dict] = None):
+        """Count a TextUnit only the first time its content hash is written."""
+        stats = self.stats if stats is None else stats
+        with self._hash_lock:
+            if content_hash in self._seen_hashes:
+                return
+            self._seen_hashes.add(content_hash)
+        stats["text_units"] += 1
+
     def _create_norm(self, official_id: str, name: str, enactment_date: str):
         """Create the Norm node."""
         query = """
@@ -241,6 +658,9 @@ class ConstitutionLoader:
             v.amendment_numbers = $amendment_numbers,
             v.created_at = datetime()
         MERGE (c)-[:HAS_VERSION]->(v)
+        WITH c, v
+        WHERE v.is_active AND NOT (c)-[:CURRENT]->(:CTV)
+        CREATE (c)-[:CURRENT]->(v)
         """
 
         amendment_numbers = [
@@ -293,20 +713,20 @@ class ConstitutionLoader:
         content: Optional[str],
         full_text: str,
     ):
-        """Create a TextUnit node."""
-        # Create content hash for deduplication
-        content_hash = hashlib.md5(full_text.encode()).hexdigest()[:16]
+        """Create (or reuse) the content-addressed TextUnit for a CLV."""
+        # Identical text shares one TextUnit, keyed by its content hash
+        content_hash = compute_content_hash(full_text)
 
         query = """
         MATCH (l:CLV {clv_id: $clv_id})
-        MERGE (t:TextUnit {text_id: $text_id})
+        MERGE (t:TextUnit {content_hash: $content_hash})
         ON CREATE SET
+            t.text_id = $text_id,
             t.clv_id = $clv_id,
             t.header = $header,
             t.content = $content,
             t.full_text = $full_text,
             t.char_count = size($full_text),
-            t.content_hash = $content_hash,
             t.created_at = datetime()
         MERGE (l)-[:HAS_TEXT]->(t)
         """
@@ -322,7 +742,7 @@ class ConstitutionLoader:
                     "content_hash": content_hash,
                 },
             )
-        self.stats["text_units"] += 1
+        self._count_text_unit(content_hash)
         self.stats["relationships"] += 1
 
     def _create_aggregation(
@@ -365,11 +785,17 @@ class ConstitutionLoader:
 
 def load_constitution(
     json_path: str = "data/intermediate/constitution.json",
+    bulk: bool = False,
+    batch_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
 ) -> dict:
     """Convenience function to load constitution.
 
     Args:
         json_path: Path to parsed constitution JSON
+        bulk: Use the batched UNWIND load path
+        batch_size: Components per bulk transaction
+        max_workers: Load Title subtrees in parallel with this many workers
 
     Returns:
         Load statistics
@@ -382,7 +808,9 @@ def load_constitution(
 
     # Load data
     loader = ConstitutionLoader()
-    return loader.load_from_json(json_path)
+    if max_workers:
+        return loader.load_parallel(json_path, max_workers=max_workers, batch_size=batch_size)
+    return loader.load_from_json(json_path, bulk=bulk, batch_size=batch_size)
 
 
 if __name__ == "__main__":
@@ -390,7 +818,3 @@ if __name__ == "__main__":
     print("\nLoad Statistics:")
     for key, value in stats.items():
         print(f"  {key}: {value}")
-
-
-
-
@@ -0,0 +1,358 @@
+"""In-memory temporal graph backend.
+
+InMemoryGraph is a TemporalGraphModel with the extra indexes needed to
+answer the engine's, retriever's and baseline's queries without Neo4j.
+It can be passed anywhere a Neo4jConnection is expected by TemporalEngine,
+HybridRetriever and FlatChunkRAG; they detect it and call the methods below
+instead of running Cypher. Each method returns records shaped like the
+corresponding Cypher query's rows, so the callers' result handling is shared.
+
+Typical use (tests, benchmarks, CI without Docker):
+
+    graph = InMemoryGraph.build("data/intermediate/constitution.json",
+                                "data/intermediate/amendments/parsed_amendments.json")
+    engine = TemporalEngine(graph)
+    retriever = HybridRetriever(graph, engine=engine)  # cleared by engine's amendments
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+import json
+import logging
+
+from .loader import iter_component_rows
+from .epochs import EpochIndex
+from .model import TemporalGraphModel
+from .validity import ValidityIndex
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class InMemoryGraph(TemporalGraphModel):
+    """Pure-Python graph store usable in place of a Neo4jConnection."""
+
+    def __init__(self):
+        super().__init__()
+        # amendment_number -> action_id
+        self._actions_by_number: Dict[int, str] = {}
+        # Built on first point-in-time lookup, then updated per amendment
+        self._validity: Optional[ValidityIndex] = None
+        self._epochs: Optional[EpochIndex] = None
+
+    @classmethod
+    def from_json(
+        cls,
+        json_path: str = "data/intermediate/constitution.json",
+        enactment_date: str = "1988-10-05",
+    ) -> "InMemoryGraph":
+        """Load a parsed constitution (original versions only)."""
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        graph = cls()
+        norm_id = data.get("official_id", "CF1988")
+        graph.add_norm(
+            official_id=norm_id,
+            name=data.get("name", "Constituição da República Federativa do Brasil"),
+            enactment_date=enactment_date,
+        )
+        graph.add_rows(iter_component_rows(data.get("components", []), norm_id, enactment_date))
+        logger.info(f"Loaded {len(graph.components)} components in memory")
+        return graph
+
+    @classmethod
+    def from_state(cls, state: dict) -> "InMemoryGraph":
+        graph = super().from_state(state)
+        graph._actions_by_number = {
+            action["amendment_number"]: action_id for action_id, action in graph.actions.items()
+        }
+        return graph
+
+    @classmethod
+    def build(
+        cls,
+        json_path: str = "data/intermediate/constitution.json",
+        amendments_path: str = "data/intermediate/amendments/parsed_amendments.json",
+        enactment_date: str = "1988-10-05",
+    ) -> "InMemoryGraph":
+        """Load a parsed constitution and replay all parsed amendments."""
+        from .offline_builder import OfflineHistoryBuilder
+
+        builder = OfflineHistoryBuilder(model=cls())
+        return builder.build(json_path, amendments_path, enactment_date)
+
+    # ------------------------------------------------------------------
+    # Connection-like API
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def session(self, database: str = "neo4j"):
+        raise TypeError(
+            "InMemoryGraph does not run Cypher; call its methods (point_in_time, "
+            "amendment_changes, component_history, ...) or use a Neo4jConnection"
+        )
+        yield  # pragma: no cover
+
+    def close(self) -> None:
+        """Nothing to release (mirrors Neo4jConnection.close)."""
+
+    def verify_connection(self) -> bool:
+        return True
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    def add_rows(self, rows: Iterable[dict]):
+        super().add_rows(rows)
+        self._validity = None
+        self._epochs = None
+
+    def apply_amendment(self, amendment_number: int, *args, **kwargs) -> dict:
+        stats = super().apply_amendment(amendment_number, *args, **kwargs)
+        action_id = self._actions_by_number[amendment_number] = f"ec_{amendment_number}"
+        self._refresh_validity(self.created_ctvs.get(action_id, []))
+        self._epochs = None
+        return stats
+
+    def revert_amendment(self, amendment_number: int) -> dict:
+        created = self.created_ctvs.get(f"ec_{amendment_number}", [])
+        touched = [self.ctvs[ctv_id]["component_id"] for ctv_id in created]
+        result = super().revert_amendment(amendment_number)
+        self._actions_by_number.pop(amendment_number, None)
+        self._epochs = None
+        if self._validity is not None:
+            for comp_id in touched:
+                self._validity.set_versions(comp_id, self._version_rows(comp_id))
+        return result
+
+    @property
+    def validity(self) -> ValidityIndex:
+        """Validity intervals of every component's versions."""
+        if self._validity is None:
+            self._validity = ValidityIndex.from_versions(
+                {comp_id: self._version_rows(comp_id) for comp_id in self.components},
+                self.roots(),
+            )
+        return self._validity
+
+    @property
+    def epochs(self) -> EpochIndex:
+        """Epochs opened by the enactment and by every version start or end."""
+        if self._epochs is None:
+            self._epochs = EpochIndex.from_dates(
+                [n["enactment_date"] for n in self.norms.values()]
+                + [v[key] for v in self.ctvs.values() for key in ("date_start", "date_end")]
+            )
+        return self._epochs
+
+    def _version_rows(self, component_id: str) -> List[tuple]:
+        return [
+            (v["date_start"], v["date_end"], v["ctv_id"], v["version_number"])
+            for v in (self.ctvs[ctv_id] for ctv_id in self.versions.get(component_id, []))
+        ]
+
+    def _refresh_validity(self, ctv_ids: List[str]):
+        if self._validity is None:
+            return
+        for comp_id in {self.ctvs[ctv_id]["component_id"] for ctv_id in ctv_ids}:
+            self._validity.set_versions(comp_id, self._version_rows(comp_id))
+
+    def version_at(self, component_id: str, date_str: str) -> Optional[dict]:
+        """The CTV of a component valid at a date, if any (binary search)."""
+        ctv_id = self.validity.version_at(component_id, date_str)
+        return self.ctvs[ctv_id] if ctv_id is not None else None
+
+    def match_components(self, component_id: str) -> List[str]:
+        """Components whose ID equals or ends with `component_id` (exact first)."""
+        if component_id in self.components:
+            return [component_id]
+        return sorted(c for c in self.components if c.endswith(component_id))
+
+    def roots(self) -> List[str]:
+        """Top-level components (linked from the Norm), by ID."""
+        return sorted(c for c, comp in self.components.items() if comp["parent_id"] is None)
+
+    # ------------------------------------------------------------------
+    # Records (shaped like the Cypher queries they replace)
+    # ------------------------------------------------------------------
+
+    def _text(self, ctv_id: str) -> Optional[str]:
+        text = self.text_for(ctv_id)
+        return text["full_text"] if text else None
+
+    def point_in_time(
+        self,
+        date_str: str,
+        component_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[dict]:
+        """Versions valid at a date, for one component or for the roots."""
+        if component_id:
+            candidates, limit = self.match_components(component_id), 1
+        else:
+            candidates = self.roots()
+
+        records = []
+        for comp_id in candidates:
+            ctv = self.version_at(comp_id, date_str)
+            if ctv is None or ctv["ctv_id"] not in self.expressed_in:
+                continue
+            version_info = {
+                "version": ctv["version_number"],
+                "start": ctv["date_start"],
+                "end": ctv["date_end"],
+            }
+            if component_id:
+                version_info["is_active"] = ctv["is_active"]
+                version_info["is_original"] = ctv["is_original"]
+            records.append(self._record(comp_id, ctv["ctv_id"], version_info))
+            if len(records) >= limit:
+                break
+        return records
+
+    def amendment_changes(self, amendment_number: int, limit: int = 10) -> List[dict]:
+        """CTVs that resulted from an amendment, with the superseded text."""
+        action_id = self._actions_by_number.get(amendment_number)
+        if action_id is None:
+            return []
+        action = self.actions[action_id]
+
+        records = []
+        for ctv_id in self.resulted_in.get(action_id, []):
+            if ctv_id not in self.expressed_in:
+                continue
+            ctv = self.ctvs[ctv_id]
+            prev_id = self.supersedes.get(ctv_id)
+            record = self._record(ctv["component_id"], ctv_id, {
+                "version": ctv["version_number"],
+                "start": ctv["date_start"],
+            })
+            record["provenance"] = {
+                "amendment": action["amendment_number"],
+                "date": action["amendment_date"],
+                "description": action["description"],
+                "previous_text": self._text(prev_id) if prev_id else None,
+            }
+            records.append(record)
+            if len(records) >= limit:
+                break
+        return records
+
+    def component_history(self, component_id: str, limit: int = 10) -> List[dict]:
+        """Versions of a component with text, newest first."""
+        records = []
+        for ctv_id in reversed(self.versions.get(component_id, [])):
+            if ctv_id not in self.expressed_in:
+                continue
+            ctv = self.ctvs[ctv_id]
+            prev_id = self.supersedes.get(ctv_id)
+            records.append(self._record(component_id, ctv_id, {
+                "version": ctv["version_number"],
+                "start": ctv["date_start"],
+                "end": ctv["date_end"],
+                "amendment": ctv.get("amendment_number"),
+                "previous_version": self.ctvs[prev_id]["version_number"] if prev_id else None,
+            }))
+            if len(records) >= limit:
+                break
+        return records
+
+    def recent_changes(self, limit: int = 10) -> List[dict]:
+        """CTVs created by amendments, most recent amendment first."""
+        actions = sorted(self.actions.values(), key=lambda a: a["amendment_date"], reverse=True)
+        records = []
+        for action in actions:
+            for ctv_id in self.resulted_in.get(action["action_id"], []):
+                if ctv_id not in self.expressed_in:
+                    continue
+                ctv = self.ctvs[ctv_id]
+                record = self._record(ctv["component_id"], ctv_id, {
+                    "version": ctv["version_number"],
+                })
+                record["provenance"] = {
+                    "amendment": action["amendment_number"],
+                    "date": action["amendment_date"],
+                }
+                records.append(record)
+                if len(records) >= limit:
+                    return records
+        return records
+
+    def current_documents(self, component_ids: Optional[Iterable[str]] = None) -> List[dict]:
+        """Active version and text of components (all if None; LexicalIndex)."""
+        records = []
+        for comp_id in self.components if component_ids is None else component_ids:
+            ctv = self.active_version(comp_id)
+            text = self.text_for(ctv["ctv_id"]) if ctv else None
+            if text is None:
+                continue
+            records.append({
+                "component_id": comp_id,
+                "component_type": self.components[comp_id]["component_type"],
+                "ctv_id": ctv["ctv_id"],
+                "version_number": ctv["version_number"],
+                "content_hash": text["content_hash"],
+                "text": text["full_text"],
+            })
+        return records
+
+    def version_texts(self) -> List[dict]:
+        """Interval and TextUnit of every CTV with text (EpochMasks)."""
+        return [
+            {
+                "ctv_id": ctv_id,
+                "start": ctv["date_start"],
+                "end": ctv["date_end"],
+                "content_hash": self.clvs[self.expressed_in[ctv_id]]["content_hash"],
+            }
+            for ctv_id, ctv in self.ctvs.items() if ctv_id in self.expressed_in
+        ]
+
+    def ctv_records(self, ctv_ids: List[str], limit: int = 10) -> List[dict]:
+        """Given CTVs with their text, in order (see HybridRetriever.POINT_IN_TIME_QUERY)."""
+        records = []
+        for ctv_id in ctv_ids:
+            if ctv_id not in self.expressed_in:
+                continue
+            ctv = self.ctvs[ctv_id]
+            record = self._record(ctv["component_id"], ctv_id, {
+                "version": ctv["version_number"],
+                "start": ctv["date_start"],
+                "end": ctv["date_end"],
+            })
+            record["ctv_id"] = ctv_id
+            records.append(record)
+            if len(records) >= limit:
+                break
+        return records
+
+    def current_chunks(self, component_types: Iterable[str]) -> List[dict]:
+        """Active text of the given component types (FlatChunkRAG's index)."""
+        types = set(component_types)
+        records = []
+        for comp_id in sorted(self.components):
+            comp = self.components[comp_id]
+            if comp["component_type"] not in types:
+                continue
+            ctv = self.active_version(comp_id)
+            text = self.text_for(ctv["ctv_id"]) if ctv else None
+            if text is None:
+                continue
+            records.append({
+                "id": comp_id,
+                "type": comp["component_type"],
+                "ordering": comp["ordering_id"],
+                "text": text["full_text"],
+                "header": text.get("header"),
+            })
+        return records
+
+    def _record(self, component_id: str, ctv_id: str, version_info: dict) -> dict:
+        return {
+            "component_id": component_id,
+            "component_type": self.components[component_id]["component_type"],
+            "text": self._text(ctv_id),
+            "version_info": version_info,
+        }
@@ -0,0 +1,422 @@
+"""Pure-Python model of the temporal aggregation graph.
+
+TemporalGraphModel holds the same nodes and relationships that the loader
+and TemporalEngine write to Neo4j (Components, CTVs, CLVs, TextUnits,
+AGGREGATES, SUPERSEDES, Actions) in plain dicts, and applies amendments
+with the same rules as the engine:
+
+- a changed component gets a new CTV that SUPERSEDES the active one
+- every ancestor gets a new CTV, deepest level first, that is expressed by
+  the previous version's CLV and AGGREGATES the children's active CTVs
+- stats use the engine's keys and are counted the same way
+
+This makes it possible to compute a complete amendment history without a
+database and compare it with (or write it in place of) the online replay.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .hierarchy import ComponentHierarchy
+from .loader import compute_content_hash
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Properties stored on Component nodes
+COMPONENT_FIELDS = ("component_id", "component_type", "ordering_id", "norm_id", "parent_id")
+
+
+def change_rounds(changes: List[Dict]) -> List[List[Dict]]:
+    """Split changes into rounds with at most one change per component.
+
+    The n-th change to a component goes into round n, which preserves
+    the order of repeated changes while batching distinct components.
+    """
+    rounds: List[List[Dict]] = []
+    seen: Dict[str, int] = {}
+    for change in changes:
+        occurrence = seen.get(change["component_id"], 0)
+        seen[change["component_id"]] = occurrence + 1
+        if occurrence == len(rounds):
+            rounds.append([])
+        rounds[occurrence].append(change)
+    return rounds
+
+
+class TemporalGraphModel:
+    """In-memory nodes and relationships of the aggregation model."""
+
+    def __init__(self):
+        self.norms: Dict[str, dict] = {}
+        self.components: Dict[str, dict] = {}
+        self.ctvs: Dict[str, dict] = {}
+        # component_id -> ctv_ids ordered by version_number
+        self.versions: Dict[str, List[str]] = {}
+        self.clvs: Dict[str, dict] = {}
+        # ctv_id -> clv_id (EXPRESSED_IN; ancestor versions share a CLV)
+        self.expressed_in: Dict[str, str] = {}
+        # content_hash -> TextUnit properties (HAS_TEXT is clv["content_hash"])
+        self.text_units: Dict[str, dict] = {}
+        # content_hash -> number of CLVs with that text
+        self.text_refs: Dict[str, int] = {}
+        # parent ctv_id -> [(ordering, child ctv_id)]
+        self.aggregates: Dict[str, List[Tuple[int, str]]] = {}
+        # new ctv_id -> previous ctv_id
+        self.supersedes: Dict[str, str] = {}
+        self.actions: Dict[str, dict] = {}
+        # action_id -> ctv_ids
+        self.resulted_in: Dict[str, List[str]] = {}
+        # action_id -> every ctv_id it created (changed and propagated), in order
+        self.created_ctvs: Dict[str, List[str]] = {}
+        self.hierarchy = ComponentHierarchy.from_parent_map({})
+        self.stats = {
+            "new_ctvs": 0,
+            "closed_ctvs": 0,
+            "reused_ctvs": 0,
+            "new_aggregations": 0,
+            "actions_created": 0,
+        }
+
+    # Attributes saved in a snapshot (see `state` / `from_state`)
+    STATE_FIELDS = (
+        "norms", "components", "ctvs", "versions", "clvs", "expressed_in",
+        "text_units", "text_refs", "aggregates", "supersedes", "actions",
+        "resulted_in", "created_ctvs", "stats",
+    )
+
+    def state(self) -> dict:
+        """The whole graph as JSON-serialisable data."""
+        return {name: getattr(self, name) for name in self.STATE_FIELDS}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "TemporalGraphModel":
+        """Rebuild a model saved with `state`."""
+        model = cls()
+        for name in cls.STATE_FIELDS:
+            setattr(model, name, state[name])
+        model.aggregates = {
+            parent: [tuple(link) for link in links]
+            for parent, links in state["aggregates"].items()
+        }
+        model.hierarchy = ComponentHierarchy.from_parent_map(
+            {comp_id: c["parent_id"] for comp_id, c in model.components.items()}
+        )
+        return model
+
+    # ------------------------------------------------------------------
+    # Base tree
+    # ------------------------------------------------------------------
+
+    def add_norm(self, official_id: str, name: str, enactment_date: str):
+        self.norms[official_id] = {
+            "official_id": official_id,
+            "name": name,
+            "enactment_date": enactment_date,
+        }
+
+    def add_rows(self, rows: Iterable[dict]):
+        """Add loader component rows (see `iter_component_rows`) as v1 versions."""
+        for row in rows:
+            comp_id = row["component_id"]
+            self.components[comp_id] = {k: row[k] for k in COMPONENT_FIELDS}
+            self._add_ctv({
+                "ctv_id": row["ctv_id"],
+                "component_id": comp_id,
+                "version_number": row["version_number"],
+                "date_start": row["date_start"],
+                "date_end": None,
+                "is_active": True,
+                "is_original": row["is_original"],
+                "amendment_numbers": row["amendment_numbers"],
+            })
+            self._add_text(row["ctv_id"], row["language"], {
+                "text_id": row["text_id"],
+                "clv_id": row["clv_id"],
+                "header": row["header"],
+                "content": row["content"],
+                "full_text": row["full_text"],
+                "content_hash": row["content_hash"],
+            })
+            if row["parent_ctv_id"]:
+                self.aggregates.setdefault(row["parent_ctv_id"], []).append(
+                    (row["ordering"], row["ctv_id"])
+                )
+
+        self.hierarchy = ComponentHierarchy.from_parent_map(
+            {comp_id: c["parent_id"] for comp_id, c in self.components.items()}
+        )
+
+    def _add_ctv(self, ctv: dict):
+        self.ctvs[ctv["ctv_id"]] = ctv
+        self.versions.setdefault(ctv["component_id"], []).append(ctv["ctv_id"])
+
+    def _add_text(self, ctv_id: str, language: str, text: dict) -> str:
+        """Create the CLV of a CTV and link it to the TextUnit for `text`.
+
+        TextUnits are content-addressed: an existing hash is reused.
+        """
+        clv_id = f"{ctv_id}_{language}"
+        text = self.text_units.setdefault(text["content_hash"], {
+            **text,
+            "char_count": len(text["full_text"]),
+        })
+        self.clvs[clv_id] = {
+            "clv_id": clv_id,
+            "ctv_id": ctv_id,
+            "language": language,
+            "content_hash": text["content_hash"],
+        }
+        self.text_refs[text["content_hash"]] = self.text_refs.get(text["content_hash"], 0) + 1
+        self.expressed_in[ctv_id] = clv_id
+        return clv_id
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def active_version(self, component_id: str) -> Optional[dict]:
+        """The active CTV of a component, if any."""
+        versions = self.versions.get(component_id)
+        if versions:
+            ctv = self.ctvs[versions[-1]]
+            if ctv["is_active"]:
+                return ctv
+        return None
+
+    def text_for(self, ctv_id: str) -> Optional[dict]:
+        """The TextUnit of a CTV (via its CLV), if any."""
+        clv_id = self.expressed_in.get(ctv_id)
+        if clv_id is None:
+            return None
+        return self.text_units.get(self.clvs[clv_id]["content_hash"])
+
+    # ------------------------------------------------------------------
+    # Amendments
+    # ------------------------------------------------------------------
+
+    def apply_amendment(
+        self,
+        amendment_number: int,
+        amendment_date: str,
+        changes: List[Dict],
+        description: str = "",
+        stats: Optional[Dict] = None
+    ) -> dict:
+        """
+        Apply an amendment with the same rules and stats as TemporalEngine.
+
+        Args:
+            amendment_number: EC number (e.g., 45)
+            amendment_date: Date string "YYYY-MM-DD"
+            changes: List of {component_id, new_content, change_type}
+            description: Amendment description
+            stats: Dict to count into (defaults to the cumulative self.stats)
+
+        Returns:
+            The updated statistics (unchanged if the amendment was already
+            committed)
+        """
+        stats = self.stats if stats is None else stats
+        action_id = f"ec_{amendment_number}"
+        if self.is_committed(amendment_number):
+            logger.info(f"EC {amendment_number} already committed, skipping")
+            return stats
+        self.actions.setdefault(action_id, {
+            "action_id": action_id,
+            "action_type": "amendment",
+            "amendment_number": amendment_number,
+            "amendment_date": amendment_date,
+            "description": description,
+            "affected_components": [c["component_id"] for c in changes],
+            "status": "committed",
+        })
+        stats["actions_created"] += 1
+        resulted_in = self.resulted_in.setdefault(action_id, [])
+        created = self.created_ctvs.setdefault(action_id, [])
+
+        affected_ancestors = set()
+        for round_changes in change_rounds(changes):
+            for change in round_changes:
+                comp_id = change["component_id"]
+                is_repeal = change.get("change_type", "modify") == "repeal"
+                new = self._new_version(
+                    comp_id, amendment_date, amendment_number, stats,
+                    created_by_action="amendment", is_repealed=is_repeal,
+                )
+                if new is None:
+                    logger.error(f"No active CTV found for {comp_id}")
+                    continue
+
+                content = change.get("new_content", "") or ""
+                if not is_repeal and content:
+                    self._add_text(new["ctv_id"], "pt", {
+                        "text_id": f"{new['ctv_id']}_pt_text",
+                        "clv_id": f"{new['ctv_id']}_pt",
+                        "header": None,
+                        "content": None,
+                        "full_text": content,
+                        "content_hash": compute_content_hash(content),
+                    })
+
+                if new["ctv_id"] not in resulted_in:
+                    resulted_in.append(new["ctv_id"])
+                created.append(new["ctv_id"])
+                affected_ancestors.update(self.hierarchy.ancestors(comp_id))
+
+        for level in self.hierarchy.group_by_depth(affected_ancestors, reverse=True):
+            for comp_id in level:
+                new = self._update_ancestor(comp_id, amendment_date, amendment_number, stats)
+                if new is not None:
+                    created.append(new["ctv_id"])
+
+        return stats
+
+    def revert_amendment(self, amendment_number: int) -> dict:
+        """
+        Remove the versions an amendment created and reopen the ones it closed.
+
+        Only allowed while the amendment's versions are still the latest of
+        their components (no later amendment built on them).
+
+        Args:
+            amendment_number: EC number
+
+        Returns:
+            {"deleted_ctvs", "reopened_ctvs", "deleted_text_units"}
+
+        Raises:
+            ValueError: The amendment is not applied or has been superseded
+        """
+        action_id = f"ec_{amendment_number}"
+        if not self.is_committed(amendment_number):
+            raise ValueError(f"EC {amendment_number} is not applied")
+
+        created = self.created_ctvs.get(action_id, [])
+        by_component: Dict[str, List[str]] = {}
+        for ctv_id in created:
+            by_component.setdefault(self.ctvs[ctv_id]["component_id"], []).append(ctv_id)
+        for comp_id, ctv_ids in by_component.items():
+            if self.versions[comp_id][-len(ctv_ids):] != ctv_ids:
+                raise ValueError(
+                    f"EC {amendment_number} is superseded on {comp_id}; "
+                    "revert the later amendments first"
+                )
+
+        result = {"deleted_ctvs": 0, "reopened_ctvs": 0, "deleted_text_units": 0}
+        for comp_id, ctv_ids in by_component.items():
+            previous = self.supersedes[ctv_ids[0]]
+            for ctv_id in ctv_ids:
+                result["deleted_text_units"] += self._delete_ctv(ctv_id)
+                result["deleted_ctvs"] += 1
+            del self.versions[comp_id][-len(ctv_ids):]
+            self.ctvs[previous]["date_end"] = None
+            self.ctvs[previous]["is_active"] = True
+            result["reopened_ctvs"] += 1
+
+        del self.actions[action_id]
+        self.resulted_in.pop(action_id, None)
+        self.created_ctvs.pop(action_id, None)
+        return result
+
+    def _delete_ctv(self, ctv_id: str) -> int:
+        """Delete a CTV with its own CLV; returns the TextUnits orphaned."""
+        del self.ctvs[ctv_id]
+        self.supersedes.pop(ctv_id, None)
+        self.aggregates.pop(ctv_id, None)
+        clv = self.clvs.get(self.expressed_in.pop(ctv_id, None))
+        if clv is None or clv["ctv_id"] != ctv_id:
+            return 0  # no text, or a CLV shared with an earlier version
+
+        clv_id = clv["clv_id"]
+
+        content_hash = self.clvs.pop(clv_id)["content_hash"]
+        self.text_refs[content_hash] -= 1
+        if self.text_refs[content_hash] == 0:
+            del self.text_refs[content_hash]
+            del self.text_units[content_hash]
+            return 1
+        return 0
+
+    def is_committed(self, amendment_number: int) -> bool:
+        """Whether an amendment's Action is already committed."""
+        action = self.actions.get(f"ec_{amendment_number}")
+        # Actions from before statuses were recorded have none
+        return action is not None and action.get("status", "committed") == "committed"
+
+    def _new_version(
+        self,
+        component_id: str,
+        date_start: str,
+        amendment_number: int,
+        stats: Dict,
+        created_by_action: str,
+        is_repealed: bool = False,
+    ) -> Optional[dict]:
+        """Close the active CTV of a component and create its successor."""
+        current = self.active_version(component_id)
+        if current is None:
+            return None
+
+        current["date_end"] = date_start
+        current["is_active"] = False
+
+        version_number = current["version_number"] + 1
+        new = {
+            "ctv_id": f"{component_id}_v{version_number}",
+            "component_id": component_id,
+            "version_number": version_number,
+            "date_start": date_start,
+            "date_end": None,
+            "is_active": True,
+            "is_original": False,
+            "created_by_action": created_by_action,
+            "amendment_number": amendment_number,
+        }
+        if created_by_action == "amendment":
+            new["is_repealed"] = is_repealed
+        self._add_ctv(new)
+        self.supersedes[new["ctv_id"]] = current["ctv_id"]
+
+        stats["closed_ctvs"] += 1
+        stats["new_ctvs"] += 1
+        return new
+
+    def _update_ancestor(
+        self,
+        component_id: str,
+        amendment_date: str,
+        amendment_number: int,
+        stats: Dict,
+    ) -> Optional[dict]:
+        """New ancestor CTV aggregating the children's active CTVs."""
+        new = self._new_version(
+            component_id, amendment_date, amendment_number, stats,
+            created_by_action="amendment_propagation",
+        )
+        if new is None:
+            logger.warning(f"No active CTV for ancestor {component_id}")
+            return None
+        prev_ctv_id = self.supersedes[new["ctv_id"]]
+
+        # The ancestor's own text is unchanged: share the previous CLV
+        prev_clv_id = self.expressed_in.get(prev_ctv_id)
+        if prev_clv_id is not None:
+            self.expressed_in[new["ctv_id"]] = prev_clv_id
+
+        old_orderings = {
+            self.ctvs[child]["component_id"]: ordering
+            for ordering, child in self.aggregates.get(prev_ctv_id, [])
+        }
+        links = []
+        for child_id in self.hierarchy.children(component_id):
+            child = self.active_version(child_id)
+            if child is None:
+                continue
+            links.append((old_orderings.get(child_id, 0), child["ctv_id"]))
+            stats["new_aggregations"] += 1
+            if child["date_start"] < amendment_date:
+                stats["reused_ctvs"] += 1
+        self.aggregates[new["ctv_id"]] = links
+        return new
@@ -0,0 +1,332 @@
+"""Offline full-history build.
+
+Instead of pushing every amendment through the live TemporalEngine, the
+OfflineHistoryBuilder replays the parsed constitution and all parsed
+amendments in a TemporalGraphModel and then writes the resulting graph in
+one bulk pass of batched UNWIND statements:
+
+1. the original tree, with the loader's bulk statements
+2. CTVs created by amendments, then the closing of superseded CTVs and
+   the move of each Component's CURRENT link to its active version
+3. their CLVs and (content-addressed) TextUnits; propagated ancestor
+   versions are linked to the CLV they share with the previous version
+4. AGGREGATES, SUPERSEDES, Actions and RESULTED_IN
+
+The model applies the engine's rules, so its stats (`new_ctvs`,
+`reused_ctvs`, `new_aggregations`, ...) match an online replay of the same
+amendments and can be used to verify it.
+"""
+
+from typing import Dict, Iterator, List, Optional
+import json
+import logging
+
+from .connection import get_connection, Neo4jConnection
+from .loader import ConstitutionLoader, iter_component_rows
+from .model import TemporalGraphModel
+from .amendments import load_amendments, build_article_mapping, changes_for_amendment
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class OfflineHistoryBuilder:
+    """Computes the complete amendment history in memory and bulk-writes it."""
+
+    DEFAULT_BATCH_SIZE = ConstitutionLoader.DEFAULT_BATCH_SIZE
+
+    NEW_CTVS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (c:Component {component_id: row.component_id})
+    CREATE (v:CTV {
+        ctv_id: row.ctv_id,
+        component_id: row.component_id,
+        version_number: row.version_number,
+        date_start: date(row.date_start),
+        date_end: null,
+        is_active: true,
+        is_original: false,
+        created_by_action: row.created_by_action,
+        amendment_number: row.amendment_number,
+        is_repealed: row.is_repealed,
+        created_at: datetime()
+    })
+    CREATE (c)-[:HAS_VERSION]->(v)
+    """
+
+    CLOSE_CTVS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (v:CTV {ctv_id: row.ctv_id})
+    SET v.date_end = date(row.date_end),
+        v.is_active = false
+    """
+
+    # Moves CURRENT (set to v1 by the loader) to the latest active version
+    CURRENT_QUERY = """
+    UNWIND $rows AS row
+    MATCH (c:Component {component_id: row.component_id})
+    MATCH (v:CTV {ctv_id: row.ctv_id})
+    OPTIONAL MATCH (c)-[old:CURRENT]->(:CTV)
+    DELETE old
+    MERGE (c)-[:CURRENT]->(v)
+    """
+
+    TEXT_QUERY = """
+    UNWIND $rows AS row
+    MATCH (v:CTV {ctv_id: row.ctv_id})
+    CREATE (l:CLV {
+        clv_id: row.clv_id,
+        ctv_id: row.ctv_id,
+        language: row.language,
+        created_at: datetime()
+    })
+    MERGE (t:TextUnit {content_hash: row.content_hash})
+    ON CREATE SET
+        t.text_id = row.text_id,
+        t.clv_id = row.clv_id,
+        t.header = row.header,
+        t.content = row.content,
+        t.full_text = row.full_text,
+        t.char_count = size(row.full_text),
+        t.created_at = datetime()
+    CREATE (v)-[:EXPRESSED_IN]->(l)
+    CREATE (l)-[:HAS_TEXT]->(t)
+    """
+
+    SHARED_CLV_QUERY = """
+    UNWIND $rows AS row
+    MATCH (v:CTV {ctv_id: row.ctv_id})
+    MATCH (l:CLV {clv_id: row.clv_id})
+    CREATE (v)-[:EXPRESSED_IN]->(l)
+    """
+
+    AGGREGATES_QUERY = """
+    UNWIND $rows AS row
+    MATCH (parent:CTV {ctv_id: row.parent_ctv_id})
+    MATCH (child:CTV {ctv_id: row.ctv_id})
+    CREATE (parent)-[:AGGREGATES {ordering: row.ordering}]->(child)
+    """
+
+    SUPERSEDES_QUERY = """
+    UNWIND $rows AS row
+    MATCH (new:CTV {ctv_id: row.ctv_id})
+    MATCH (prev:CTV {ctv_id: row.prev_ctv_id})
+    CREATE (new)-[:SUPERSEDES]->(prev)
+    """
+
+    ACTIONS_QUERY = """
+    UNWIND $rows AS row
+    MERGE (a:Action {action_id: row.action_id})
+    ON CREATE SET
+        a.action_type = row.action_type,
+        a.amendment_number = row.amendment_number,
+        a.amendment_date = date(row.amendment_date),
+        a.description = row.description,
+        a.affected_components = row.affected_components,
+        a.status = row.status,
+        a.created_at = datetime()
+    """
+
+    RESULTED_IN_QUERY = """
+    UNWIND $rows AS row
+    MATCH (a:Action {action_id: row.action_id})
+    MATCH (v:CTV {ctv_id: row.ctv_id})
+    MERGE (a)-[:RESULTED_IN]->(v)
+    """
+
+    def __init__(
+        self,
+        conn: Optional[Neo4jConnection] = None,
+        model: Optional[TemporalGraphModel] = None,
+    ):
+        self.conn = conn
+        self.model = model if model is not None else TemporalGraphModel()
+        self.base_rows: List[dict] = []
+        self.summary = {"amendments": 0, "applied": 0, "skipped": 0}
+
+    def build(
+        self,
+        json_path: str = "data/intermediate/constitution.json",
+        amendments_path: str = "data/intermediate/amendments/parsed_amendments.json",
+        enactment_date: str = "1988-10-05",
+    ) -> TemporalGraphModel:
+        """Replay the constitution and all amendments in memory.
+
+        Args:
+            json_path: Path to parsed constitution JSON
+            amendments_path: Path to parsed amendments JSON
+            enactment_date: Date the constitution was enacted
+
+        Returns:
+            The populated TemporalGraphModel
+        """
+        self.load_base(json_path, enactment_date)
+        mapping = build_article_mapping(
+            r for r in self.base_rows if r["component_type"] == "article"
+        )
+        amendments = load_amendments(amendments_path)
+        self.replay(amendments, mapping)
+        return self.model
+
+    def load_base(
+        self,
+        json_path: str = "data/intermediate/constitution.json",
+        enactment_date: str = "1988-10-05",
+    ) -> TemporalGraphModel:
+        """Add the original constitution (v1 versions) to the model."""
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        norm_id = data.get("official_id", "CF1988")
+        self.model.add_norm(
+            official_id=norm_id,
+            name=data.get("name", "Constituição da República Federativa do Brasil"),
+            enactment_date=enactment_date,
+        )
+        self.base_rows = list(
+            iter_component_rows(data.get("components", []), norm_id, enactment_date)
+        )
+        self.model.add_rows(self.base_rows)
+        return self.model
+
+    def replay(self, amendments: List[Dict], mapping: Dict[str, str]):
+        """Apply parsed amendments in order, as process_all_amendments does."""
+        for amendment in amendments:
+            self.summary["amendments"] += 1
+            changes = changes_for_amendment(amendment, mapping)
+            if not changes:
+                self.summary["skipped"] += 1
+                continue
+            self.model.apply_amendment(
+                amendment_number=amendment["number"],
+                amendment_date=amendment["date"],
+                changes=changes,
+                description=f"Emenda Constitucional {amendment['number']}",
+            )
+            self.summary["applied"] += 1
+
+        logger.info(f"Replayed {self.summary['applied']} amendments. Stats: {self.model.stats}")
+
+    def write(self, batch_size: Optional[int] = None) -> dict:
+        """Write the built graph in one bulk pass.
+
+        Args:
+            batch_size: Rows per write transaction
+
+        Returns:
+            Number of rows written per statement
+        """
+        batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        conn = self.conn or get_connection()
+        written = {}
+
+        with conn.session() as session:
+            for norm in self.model.norms.values():
+                session.run("""
+                    MERGE (n:Norm {official_id: $official_id})
+                    ON CREATE SET
+                        n.name = $name,
+                        n.enactment_date = date($enactment_date),
+                        n.jurisdiction = 'Brazil',
+                        n.document_type = 'Constitution',
+                        n.created_at = datetime()
+                """, norm)
+
+            for name, query, rows in self.iter_statements():
+                written[name] = 0
+                for batch in _batches(rows, batch_size):
+                    if query is None:
+                        session.execute_write(ConstitutionLoader._write_rows, batch)
+                    else:
+                        session.execute_write(_run_batch, query, batch)
+                    written[name] += len(batch)
+
+        logger.info(f"Offline history written: {written}")
+        return written
+
+    def iter_statements(self):
+        """Yield (name, query, rows) in write order (query None = loader rows)."""
+        model = self.model
+        new_ctvs = [v for v in model.ctvs.values() if v["version_number"] > 1]
+
+        yield "base", None, self.base_rows
+        yield "new_ctvs", self.NEW_CTVS_QUERY, [
+            {
+                "ctv_id": v["ctv_id"],
+                "component_id": v["component_id"],
+                "version_number": v["version_number"],
+                "date_start": v["date_start"],
+                "created_by_action": v["created_by_action"],
+                "amendment_number": v["amendment_number"],
+                "is_repealed": v.get("is_repealed"),
+            }
+            for v in new_ctvs
+        ]
+        yield "closed_ctvs", self.CLOSE_CTVS_QUERY, [
+            {"ctv_id": v["ctv_id"], "date_end": v["date_end"]}
+            for v in model.ctvs.values() if not v["is_active"]
+        ]
+        yield "current", self.CURRENT_QUERY, [
+            {"component_id": v["component_id"], "ctv_id": v["ctv_id"]}
+            for v in new_ctvs if v["is_active"]
+        ]
+        # CLVs created by an amendment; propagated versions share an earlier CLV
+        expressed = [
+            (v["ctv_id"], model.clvs[model.expressed_in[v["ctv_id"]]])
+            for v in new_ctvs if v["ctv_id"] in model.expressed_in
+        ]
+        yield "texts", self.TEXT_QUERY, [
+            {
+                **{k: text[k] for k in ("text_id", "header", "content", "full_text")},
+                "ctv_id": ctv_id,
+                "clv_id": clv["clv_id"],
+                "language": clv["language"],
+                "content_hash": clv["content_hash"],
+            }
+            for ctv_id, clv in expressed if clv["ctv_id"] == ctv_id
+            for text in [model.text_units[clv["content_hash"]]]
+        ]
+        yield "shared_clvs", self.SHARED_CLV_QUERY, [
+            {"ctv_id": ctv_id, "clv_id": clv["clv_id"]}
+            for ctv_id, clv in expressed if clv["ctv_id"] != ctv_id
+        ]
+        yield "aggregates", self.AGGREGATES_QUERY, [
+            {"parent_ctv_id": v["ctv_id"], "ctv_id": child, "ordering": ordering}
+            for v in new_ctvs
+            for ordering, child in model.aggregates.get(v["ctv_id"], [])
+        ]
+        yield "supersedes", self.SUPERSEDES_QUERY, [
+            {"ctv_id": new, "prev_ctv_id": prev} for new, prev in model.supersedes.items()
+        ]
+        yield "actions", self.ACTIONS_QUERY, list(model.actions.values())
+        yield "resulted_in", self.RESULTED_IN_QUERY, [
+            {"action_id": action_id, "ctv_id": ctv_id}
+            for action_id, ctv_ids in model.resulted_in.items()
+            for ctv_id in ctv_ids
+        ]
+
+
+def _batches(rows: List[dict], size: int) -> Iterator[List[dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _run_batch(tx, query: str, rows: List[dict]):
+    tx.run(query, {"rows": rows}).consume()
+
+
+def build_full_history(
+    json_path: str = "data/intermediate/constitution.json",
+    amendments_path: str = "data/intermediate/amendments/parsed_amendments.json",
+    write: bool = True,
+) -> dict:
+    """Convenience function to build (and optionally write) the full history.
+
+    Returns:
+        Aggregation statistics, using TemporalEngine's keys
+    """
+    builder = OfflineHistoryBuilder()
+    builder.build(json_path, amendments_path)
+    if write:
+        builder.write()
+    return builder.model.stats
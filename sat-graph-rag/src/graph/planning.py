@@ -0,0 +1,176 @@
+"""Dry-run planning of amendments.
+
+`plan_changes` simulates what TemporalEngine.apply_amendment would write,
+using the same rules (rounds of changes, deepest ancestor level first,
+shared CLVs for propagated versions), from a read-only snapshot of the
+active versions involved. The resulting AmendmentPlan lists the CTVs that
+would be closed and created, the AGGREGATES edges and new TextUnits, the
+sibling CTVs that would be reused, and an estimate of the write volume.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+
+from .hierarchy import ComponentHierarchy
+from .loader import compute_content_hash
+from .model import change_rounds
+
+
+@dataclass
+class AmendmentPlan:
+    """What applying one amendment would write (nothing is written)."""
+    amendment_number: int
+    amendment_date: str
+    closed_ctvs: List[str] = field(default_factory=list)
+    new_ctvs: List[str] = field(default_factory=list)
+    # (parent ctv_id, child ctv_id, ordering)
+    new_aggregations: List[Tuple[str, str, int]] = field(default_factory=list)
+    # content hashes of TextUnits that do not exist yet
+    new_text_units: List[str] = field(default_factory=list)
+    new_clvs: int = 0
+    shared_clvs: int = 0
+    reused_ctvs: int = 0
+    missing_components: List[str] = field(default_factory=list)
+    affected_ancestors: List[str] = field(default_factory=list)
+
+    @property
+    def estimated_writes(self) -> Dict[str, int]:
+        """Nodes, relationships and property updates the amendment would write."""
+        new_ctvs = len(self.new_ctvs)
+        changed = new_ctvs - len(self.affected_ancestors)
+        nodes = 1 + new_ctvs + self.new_clvs + len(self.new_text_units)  # 1 Action
+        relationships = (
+            2 * new_ctvs                    # HAS_VERSION + SUPERSEDES
+            + self.new_clvs * 2             # EXPRESSED_IN + HAS_TEXT
+            + self.shared_clvs              # EXPRESSED_IN to a shared CLV
+            + len(self.new_aggregations)    # AGGREGATES
+            + changed                       # RESULTED_IN
+        )
+        properties = 2 * len(self.closed_ctvs)  # date_end, is_active
+        return {
+            "nodes": nodes,
+            "relationships": relationships,
+            "properties": properties,
+            "total": nodes + relationships + properties,
+        }
+
+    def summary(self) -> dict:
+        """Counts per kind of write, as reported before scheduling a batch."""
+        return {
+            "amendment_number": self.amendment_number,
+            "closed_ctvs": len(self.closed_ctvs),
+            "new_ctvs": len(self.new_ctvs),
+            "new_aggregations": len(self.new_aggregations),
+            "new_text_units": len(self.new_text_units),
+            "reused_ctvs": self.reused_ctvs,
+            "affected_ancestors": len(self.affected_ancestors),
+            "missing_components": len(self.missing_components),
+            "estimated_writes": self.estimated_writes["total"],
+        }
+
+    def exceeds(
+        self,
+        max_new_ctvs: Optional[int] = None,
+        max_writes: Optional[int] = None,
+    ) -> bool:
+        """Whether the plan is over a propagation or write budget."""
+        if max_new_ctvs is not None and len(self.new_ctvs) > max_new_ctvs:
+            return True
+        if max_writes is not None and self.estimated_writes["total"] > max_writes:
+            return True
+        return False
+
+
+def plan_components(changes: List[Dict], hierarchy: ComponentHierarchy) -> Set[str]:
+    """Components whose active version a plan needs to read.
+
+    That is the changed components, their ancestors and the ancestors'
+    children (whose active versions would be aggregated).
+    """
+    changed = {c["component_id"] for c in changes}
+    ancestors = hierarchy.ancestors_of(changed)
+    needed = changed | ancestors
+    for comp_id in ancestors:
+        needed.update(hierarchy.children(comp_id))
+    return needed
+
+
+def plan_changes(
+    amendment_number: int,
+    amendment_date: str,
+    changes: List[Dict],
+    hierarchy: ComponentHierarchy,
+    active: Dict[str, dict],
+    orderings: Dict[str, Dict[str, int]],
+    existing_hashes: Set[str],
+) -> AmendmentPlan:
+    """Simulate an amendment against a snapshot of active versions.
+
+    Args:
+        amendment_number: EC number
+        amendment_date: Date string "YYYY-MM-DD"
+        changes: List of {component_id, new_content, change_type}
+        hierarchy: Component hierarchy
+        active: component_id -> {ctv_id, version_number, date_start} of the
+            active CTV (for at least `plan_components`)
+        orderings: active ancestor ctv_id -> {child component_id: ordering}
+        existing_hashes: Content hashes (of the new texts) already stored
+
+    Returns:
+        AmendmentPlan
+    """
+    plan = AmendmentPlan(amendment_number, amendment_date)
+    active = {comp_id: dict(ctv) for comp_id, ctv in active.items()}
+    planned_hashes = set(existing_hashes)
+
+    def new_version(comp_id: str) -> Optional[dict]:
+        current = active.get(comp_id)
+        if current is None:
+            return None
+        new = {
+            "ctv_id": f"{comp_id}_v{current['version_number'] + 1}",
+            "version_number": current["version_number"] + 1,
+            "date_start": amendment_date,
+            "prev_ctv_id": current["ctv_id"],
+        }
+        plan.closed_ctvs.append(current["ctv_id"])
+        plan.new_ctvs.append(new["ctv_id"])
+        active[comp_id] = new
+        return new
+
+    affected: Set[str] = set()
+    for round_changes in change_rounds(changes):
+        for change in round_changes:
+            comp_id = change["component_id"]
+            if new_version(comp_id) is None:
+                plan.missing_components.append(comp_id)
+                continue
+            content = change.get("new_content", "") or ""
+            if change.get("change_type", "modify") != "repeal" and content:
+                plan.new_clvs += 1
+                content_hash = compute_content_hash(content)
+                if content_hash not in planned_hashes:
+                    planned_hashes.add(content_hash)
+                    plan.new_text_units.append(content_hash)
+            affected.update(hierarchy.ancestors(comp_id))
+
+    for level in hierarchy.group_by_depth(affected, reverse=True):
+        for comp_id in level:
+            new = new_version(comp_id)
+            if new is None:
+                plan.missing_components.append(comp_id)
+                continue
+            plan.affected_ancestors.append(comp_id)
+            plan.shared_clvs += 1
+            old_orderings = orderings.get(new["prev_ctv_id"], {})
+            for child_id in hierarchy.children(comp_id):
+                child = active.get(child_id)
+                if child is None:
+                    continue
+                plan.new_aggregations.append(
+                    (new["ctv_id"], child["ctv_id"], old_orderings.get(child_id, 0))
+                )
+                if child["date_start"] < amendment_date:
+                    plan.reused_ctvs += 1
+
+    return plan
@@ -0,0 +1,223 @@
+"""Precomputed full-text renders of the constitution, one per epoch.
+
+Between two consecutive amendment dates the constitution does not change
+(see epochs.py), so its whole text can be rendered once per epoch: the
+root CTVs valid at the epoch start, each followed by the subtree it
+AGGREGATES in `ordering` order. Reading "the constitution on date X" is
+then a bisect over the epoch starts and a few file reads.
+
+Renders mirror the aggregation model. An amendment creates new CTVs only
+for the changed components and their ancestors, and every other subtree
+keeps its CTV, so the renders are split into parts at `split_depth`
+(by default the children of the Titles): a part is the full text of one
+subtree, stored once under its content hash and listed by every epoch
+manifest that contains it. Components above the split depth contribute
+only their own text as a part.
+
+Layout of a render directory:
+
+    index.json             [[epoch, start, end], ...]
+    epochs/{epoch}.json    manifest: ordered [ctv_id, part_hash] pairs
+    parts/{hash}.txt       text of one part
+"""
+
+from difflib import SequenceMatcher, unified_diff
+from typing import Dict, Iterator, List, Optional, Tuple
+from pathlib import Path
+import json
+import logging
+import os
+
+from .epochs import EpochIndex
+from .loader import compute_content_hash
+from .memory import InMemoryGraph
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Separator between the texts of consecutive components
+SEPARATOR = "\n"
+
+
+def _write_atomic(path: Path, text: str):
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class EpochRenderer:
+    """Renders every epoch of an in-memory graph to a render directory."""
+
+    def __init__(
+        self,
+        graph: InMemoryGraph,
+        directory: str = "data/renders",
+        split_depth: int = 1,
+    ):
+        self.graph = graph
+        self.directory = Path(directory)
+        self.split_depth = split_depth
+        # ctv_id -> hash of its part, for parts already rendered in this build
+        self._part_hashes: Dict[str, str] = {}
+        self.stats = {"epochs": 0, "parts": 0, "parts_written": 0, "parts_pruned": 0}
+
+    def roots(self) -> List[str]:
+        """Top-level components in document order (the order they were loaded in)."""
+        return [c for c, comp in self.graph.components.items() if comp["parent_id"] is None]
+
+    def own_text(self, ctv_id: str) -> str:
+        return self.graph._text(ctv_id) or ""
+
+    def render_ctv(self, ctv_id: str) -> str:
+        """Full text of a CTV and the subtree it aggregates."""
+        texts = []
+        stack = [ctv_id]
+        while stack:
+            current = stack.pop()
+            text = self.own_text(current)
+            if text:
+                texts.append(text)
+            children = sorted(self.graph.aggregates.get(current, []), key=lambda link: link[0])
+            stack.extend(child for _, child in reversed(children))
+        return SEPARATOR.join(texts)
+
+    def parts(self, ctv_id: str, depth: int = 0) -> Iterator[Tuple[str, bool]]:
+        """(ctv_id, whole_subtree) of the parts of a CTV's subtree, in reading order."""
+        if depth >= self.split_depth:
+            yield ctv_id, True
+            return
+        yield ctv_id, False
+        children = sorted(self.graph.aggregates.get(ctv_id, []), key=lambda link: link[0])
+        for _, child in children:
+            yield from self.parts(child, depth + 1)
+
+    def manifest(self, start: str) -> List[Tuple[str, str]]:
+        """[ctv_id, part_hash] pairs of the constitution valid at `start`.
+
+        A part is rendered and written the first time its CTV is seen; the
+        epochs that share the CTV reuse its hash.
+        """
+        entries = []
+        for root in self.roots():
+            root_ctv = self.graph.validity.version_at(root, start)
+            if root_ctv is None:
+                continue
+            for ctv_id, whole_subtree in self.parts(root_ctv):
+                part_hash = self._part_hashes.get(ctv_id)
+                if part_hash is None:
+                    text = self.render_ctv(ctv_id) if whole_subtree else self.own_text(ctv_id)
+                    part_hash = compute_content_hash(text)
+                    self._part_hashes[ctv_id] = part_hash
+                    path = self.directory / "parts" / f"{part_hash}.txt"
+                    if not path.exists():
+                        _write_atomic(path, text)
+                        self.stats["parts_written"] += 1
+                entries.append((ctv_id, part_hash))
+        return entries
+
+    def build(self) -> Dict:
+        """Render every epoch; parts unchanged since an earlier build are kept.
+
+        Returns:
+            Stats: epochs, parts (distinct, referenced), parts_written, parts_pruned
+        """
+        self.stats = dict.fromkeys(self.stats, 0)
+        self._part_hashes = {}
+        (self.directory / "parts").mkdir(parents=True, exist_ok=True)
+        (self.directory / "epochs").mkdir(parents=True, exist_ok=True)
+
+        epochs = self.graph.epochs.epochs()
+        referenced = set()
+        for epoch, start, end in epochs:
+            entries = self.manifest(start)
+            referenced.update(part_hash for _, part_hash in entries)
+            _write_atomic(
+                self.directory / "epochs" / f"{epoch}.json",
+                json.dumps({"epoch": epoch, "start": start, "end": end, "parts": entries}),
+            )
+        # The index is written last: readers only see complete builds
+        _write_atomic(self.directory / "index.json", json.dumps(epochs))
+
+        for path in (self.directory / "epochs").glob("*.json"):
+            if int(path.stem) >= len(epochs):
+                path.unlink()
+        for path in (self.directory / "parts").glob("*.txt"):
+            if path.stem not in referenced:
+                path.unlink()
+                self.stats["parts_pruned"] += 1
+
+        self.stats["epochs"] = len(epochs)
+        self.stats["parts"] = len(referenced)
+        logger.info(
+            f"Rendered {len(epochs)} epochs from {len(referenced)} parts "
+            f"({self.stats['parts_written']} new)"
+        )
+        return self.stats
+
+
+class RenderStore:
+    """Reads the renders written by EpochRenderer."""
+
+    def __init__(self, directory: str = "data/renders"):
+        self.directory = Path(directory)
+        self._index: Optional[EpochIndex] = None
+
+    @property
+    def index(self) -> EpochIndex:
+        if self._index is None:
+            epochs = json.loads((self.directory / "index.json").read_text(encoding="utf-8"))
+            self._index = EpochIndex.from_dates(start for _, start, _ in epochs)
+        return self._index
+
+    def invalidate(self):
+        """Forget the epoch index (after a rebuild)."""
+        self._index = None
+
+    def manifest(self, epoch: int) -> dict:
+        path = self.directory / "epochs" / f"{epoch}.json"
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def part(self, part_hash: str) -> str:
+        return (self.directory / "parts" / f"{part_hash}.txt").read_text(encoding="utf-8")
+
+    def read(self, epoch: int) -> str:
+        """Full text of the constitution during an epoch."""
+        texts = (self.part(part_hash) for _, part_hash in self.manifest(epoch)["parts"])
+        return SEPARATOR.join(text for text in texts if text)
+
+    def read_at(self, date_str: str) -> Optional[str]:
+        """Full text of the constitution on a date (None before enactment)."""
+        epoch = self.index.epoch_of(date_str)
+        return None if epoch is None else self.read(epoch)
+
+    def diff(self, old_epoch: int, new_epoch: int) -> List[str]:
+        """Unified diff between two epochs.
+
+        Parts are compared by hash first, so only the parts that differ are
+        read and diffed.
+        """
+        old = self.manifest(old_epoch)
+        new = self.manifest(new_epoch)
+        old_hashes = [part_hash for _, part_hash in old["parts"]]
+        new_hashes = [part_hash for _, part_hash in new["parts"]]
+
+        lines = []
+        matcher = SequenceMatcher(None, old_hashes, new_hashes, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            before = SEPARATOR.join(self.part(h) for h in old_hashes[i1:i2]).splitlines()
+            after = SEPARATOR.join(self.part(h) for h in new_hashes[j1:j2]).splitlines()
+            lines.extend(unified_diff(
+                before, after, fromfile=old["start"], tofile=new["start"], lineterm=""
+            ))
+        return lines
+
+
+def render_epochs(
+    graph: InMemoryGraph,
+    directory: str = "data/renders",
+    split_depth: int = 1,
+) -> Dict:
+    """Convenience function to render every epoch of a graph."""
+    return EpochRenderer(graph, directory, split_depth).build()
@@ -0,0 +1,489 @@
+"""Incremental, diff-based reload of a re-parsed constitution.
+
+When Planalto republishes the compiled text, ConstitutionResync compares the
+newly parsed `constitution.json` with the graph by `component_id` and
+`content_hash` and writes only what changed:
+
+- added: new Component with a v1 version starting at the effective date
+- removed: the active CTV is closed at the effective date
+- text changed: the active CTV is closed at the effective date and a new
+  one, with its own CLV and the TextUnit for the new content, starts then
+- structure changed: parent, ordering and type are updated and the
+  HAS_CHILD link is moved
+- reactivated: a component that was removed earlier reappears with a new
+  version starting at the effective date
+
+As in TemporalEngine, versions valid before the effective date are never
+edited: every parent whose children were added, removed, moved or
+reordered gets a new CTV at the effective date (and so do its ancestors,
+and those of text changes, deepest level first), expressed by the previous
+version's CLV and aggregating the children's active CTVs. The effective
+date must therefore fall after the start of every version it supersedes.
+
+The graph state is read once; writes are proportional to the number of
+changes.
+"""
+
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import date
+import json
+import logging
+
+from .connection import get_connection, Neo4jConnection
+from .hierarchy import ComponentHierarchy
+from .loader import ConstitutionLoader, iter_component_rows
+from .temporal_engine import TemporalEngine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Component fields compared to detect structural changes
+STRUCTURE_FIELDS = ("parent_id", "ordering", "component_type", "ordering_id")
+
+# Row fields needed to relink a component to new text
+TEXT_FIELDS = ("component_id", "content_hash", "header", "content", "full_text")
+
+
+@dataclass
+class ComponentDiff:
+    """Differences between a parsed constitution and the graph."""
+    added: List[dict] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    text_changed: List[dict] = field(default_factory=list)
+    structure_changed: List[dict] = field(default_factory=list)
+    reactivated: List[str] = field(default_factory=list)
+    # Components given a new version (reactivated ones and the parents and
+    # ancestors of structural changes), deepest level first
+    levels: List[List[str]] = field(default_factory=list)
+    # component_id -> position under its parent, for the new parent versions
+    orderings: Dict[str, int] = field(default_factory=dict)
+    # Latest start (or end, for reactivated components) of the versions the
+    # diff closes or succeeds; the effective date must be after it
+    latest_start: Optional[str] = None
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> List[str]:
+        """IDs of existing components whose text or structure changed."""
+        ids = {r["component_id"] for r in self.text_changed + self.structure_changed}
+        return sorted(ids.union(self.reactivated))
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def summary(self) -> dict:
+        """Report counts and component IDs per change kind."""
+        return {
+            "added": [r["component_id"] for r in self.added],
+            "removed": list(self.removed),
+            "changed": self.changed,
+            "text_changed": len(self.text_changed),
+            "structure_changed": len(self.structure_changed),
+            "reactivated": len(self.reactivated),
+            "propagated": sum(len(level) for level in self.levels) - len(
+                {r["component_id"] for r in self.text_changed}.union(self.reactivated)
+            ),
+            "unchanged": self.unchanged,
+        }
+
+
+def _structure(row: dict) -> dict:
+    """Structural fields of a row as they are stored in the graph."""
+    structure = {f: row[f] for f in STRUCTURE_FIELDS}
+    if row["parent_id"] is None:
+        # Titles hang off the Norm, so they have no AGGREGATES ordering
+        structure["ordering"] = None
+    return structure
+
+
+def diff_components(graph_state: Dict[str, dict], rows: List[dict]) -> ComponentDiff:
+    """Compare parsed component rows with the graph state.
+
+    Args:
+        graph_state: component_id -> {active, content_hash, parent_id,
+            ordering, component_type, ordering_id, date_start, date_end} as
+            read from the graph
+        rows: Component rows of the re-parsed constitution, depth-first
+
+    Returns:
+        ComponentDiff (added rows keep their depth-first order)
+    """
+    diff = ComponentDiff()
+    seen = set()
+
+    for row in rows:
+        comp_id = row["component_id"]
+        seen.add(comp_id)
+        current = graph_state.get(comp_id)
+
+        if current is None:
+            diff.added.append(row)
+            continue
+
+        modified = False
+        if not current.get("active", True):
+            diff.reactivated.append(comp_id)
+            modified = True
+        # A version without text (repealed) has no CLV to relink
+        if current.get("content_hash") not in (None, row["content_hash"]):
+            diff.text_changed.append(row)
+            modified = True
+        expected = _structure(row)
+        if any(current.get(f) != expected[f] for f in STRUCTURE_FIELDS):
+            diff.structure_changed.append(row)
+            modified = True
+        if not modified:
+            diff.unchanged += 1
+
+    diff.removed = sorted(
+        comp_id for comp_id, state in graph_state.items()
+        if comp_id not in seen and state.get("active", True)
+    )
+    diff.levels = _version_levels(diff, graph_state, rows)
+    moved = {r["component_id"] for r in diff.added + diff.structure_changed}
+    moved.update(diff.reactivated)
+    diff.orderings = {
+        r["component_id"]: r["ordering"]
+        for r in rows if r["component_id"] in moved and r["parent_id"] is not None
+    }
+    superseded = [graph_state[c].get("date_start") for level in diff.levels for c in level]
+    superseded += [graph_state[c].get("date_start") for c in diff.removed]
+    superseded += [graph_state[c].get("date_end") for c in diff.reactivated]
+    diff.latest_start = max((d for d in superseded if d), default=None)
+    return diff
+
+
+def _version_levels(
+    diff: ComponentDiff,
+    graph_state: Dict[str, dict],
+    rows: List[dict]
+) -> List[List[str]]:
+    """Components that need a new version, grouped by depth, deepest first.
+
+    A component whose text changes gets a new version, and so does a parent
+    whose set or order of children changes, so earlier versions keep their
+    text and children; their ancestors are versioned too. Added parents are
+    skipped: their v1 aggregates the new children directly.
+    """
+    added = {r["component_id"] for r in diff.added}
+    parents = {r["component_id"]: r["parent_id"] for r in rows}
+
+    touched = {r["parent_id"] for r in diff.added}
+    touched.update(graph_state[comp_id].get("parent_id") for comp_id in diff.removed)
+    touched.update(parents[comp_id] for comp_id in diff.reactivated)
+    for row in diff.structure_changed:
+        current = graph_state[row["component_id"]]
+        expected = _structure(row)
+        if any(current.get(f) != expected[f] for f in ("parent_id", "ordering")):
+            touched.update((current.get("parent_id"), row["parent_id"]))
+
+    hierarchy = ComponentHierarchy.from_parent_map(parents)
+    versioned = set(diff.reactivated)
+    for row in diff.text_changed:
+        versioned.add(row["component_id"])
+        versioned.update(hierarchy.ancestors(row["component_id"]))
+    for comp_id in touched:
+        # Removed parents are closed; their subtree goes with them
+        if comp_id is None or comp_id not in parents or comp_id in added:
+            continue
+        versioned.add(comp_id)
+        versioned.update(hierarchy.ancestors(comp_id))
+    return hierarchy.group_by_depth(versioned, reverse=True)
+
+
+# Shares the previous version's CLV with the new version `v` of `c` and
+# aggregates the children's active CTVs (new orderings from $orderings)
+NEW_VERSION_LINKS = """
+    WITH c, v, cur
+    OPTIONAL MATCH (cur)-[:EXPRESSED_IN]->(l:CLV)
+    FOREACH (_ IN CASE WHEN l IS NULL THEN [] ELSE [1] END |
+        CREATE (v)-[:EXPRESSED_IN]->(l))
+    WITH DISTINCT c, v, cur
+    MATCH (c)-[:HAS_CHILD]->(child_comp:Component)-[:CURRENT]->(child:CTV)
+    OPTIONAL MATCH (cur)-[old:AGGREGATES]->(:CTV {component_id: child_comp.component_id})
+    WITH v, child, child_comp, head(collect(old.ordering)) AS old_ordering
+    CREATE (v)-[:AGGREGATES {
+        ordering: coalesce($orderings[child_comp.component_id], old_ordering, 0)
+    }]->(child)
+"""
+
+
+class ConstitutionResync:
+    """Applies a re-parsed constitution to the graph incrementally."""
+
+    # Latest version of every component with its text hash and position
+    STATE_QUERY = """
+    MATCH (c:Component)
+    OPTIONAL MATCH (c)-[:HAS_VERSION]->(v:CTV)
+    WITH c, v ORDER BY v.version_number DESC
+    WITH c, head(collect(v)) AS v
+    OPTIONAL MATCH (v)-[:EXPRESSED_IN]->(:CLV)-[:HAS_TEXT]->(t:TextUnit)
+    OPTIONAL MATCH (:Component)-[:CURRENT]->(:CTV)-[a:AGGREGATES]->(v)
+    RETURN c.component_id AS component_id,
+           c.parent_id AS parent_id,
+           c.component_type AS component_type,
+           c.ordering_id AS ordering_id,
+           coalesce(v.is_active, false) AS active,
+           toString(v.date_start) AS date_start,
+           toString(v.date_end) AS date_end,
+           t.content_hash AS content_hash,
+           a.ordering AS ordering
+    """
+
+    # New version of removed components, after their latest (closed) one
+    REACTIVATE_QUERY = """
+    UNWIND $ids AS comp_id
+    MATCH (c:Component {component_id: comp_id})-[:HAS_VERSION]->(v:CTV)
+    WITH c, v ORDER BY v.version_number DESC
+    WITH c, head(collect(v)) AS cur
+    CREATE (v:CTV {
+        ctv_id: c.component_id + '_v' + toString(cur.version_number + 1),
+        component_id: c.component_id,
+        version_number: cur.version_number + 1,
+        date_start: date($effective_date),
+        date_end: null,
+        is_active: true,
+        is_original: false,
+        created_by_action: 'resync',
+        created_at: datetime()
+    })
+    CREATE (c)-[:HAS_VERSION]->(v)
+    CREATE (c)-[:CURRENT]->(v)
+    CREATE (v)-[:SUPERSEDES]->(cur)
+    """ + NEW_VERSION_LINKS
+
+    # Closes the active version of components and creates its successor
+    PROPAGATE_QUERY = """
+    UNWIND $ids AS comp_id
+    MATCH (c:Component {component_id: comp_id})-[current:CURRENT]->(cur:CTV)
+    SET cur.date_end = date($effective_date),
+        cur.is_active = false
+    DELETE current
+    CREATE (v:CTV {
+        ctv_id: comp_id + '_v' + toString(cur.version_number + 1),
+        component_id: comp_id,
+        version_number: cur.version_number + 1,
+        date_start: date($effective_date),
+        date_end: null,
+        is_active: true,
+        is_original: false,
+        created_by_action: 'resync',
+        created_at: datetime()
+    })
+    CREATE (c)-[:HAS_VERSION]->(v)
+    CREATE (c)-[:CURRENT]->(v)
+    CREATE (v)-[:SUPERSEDES]->(cur)
+    """ + NEW_VERSION_LINKS
+
+    REMOVE_QUERY = """
+    UNWIND $ids AS comp_id
+    MATCH (:Component {component_id: comp_id})-[current:CURRENT]->(v:CTV)
+    SET v.date_end = date($effective_date),
+        v.is_active = false
+    DELETE current
+    """
+
+    # Gives the new versions of text changes, which start out expressed by
+    # the previous version's CLV, their own
+    SPLIT_SHARED_CLV_QUERY = """
+    UNWIND $ids AS comp_id
+    MATCH (:Component {component_id: comp_id})
+          -[:CURRENT]->(v:CTV)-[e:EXPRESSED_IN]->(l:CLV)
+    WHERE l.ctv_id <> v.ctv_id
+    MATCH (l)-[:HAS_TEXT]->(t:TextUnit)
+    DELETE e
+    CREATE (own:CLV {
+        clv_id: v.ctv_id + '_' + l.language,
+        ctv_id: v.ctv_id,
+        language: l.language,
+        created_at: datetime()
+    })
+    CREATE (v)-[:EXPRESSED_IN]->(own)
+    CREATE (own)-[:HAS_TEXT]->(t)
+    """
+
+    # Links the new versions' own CLVs to the new text; TextUnits no CLV
+    # links to any more are deleted
+    TEXT_QUERY = """
+    UNWIND $rows AS row
+    MATCH (:Component {component_id: row.component_id})
+          -[:CURRENT]->(:CTV)-[:EXPRESSED_IN]->(l:CLV)
+    OPTIONAL MATCH (l)-[old:HAS_TEXT]->(old_text:TextUnit)
+    DELETE old
+    WITH DISTINCT l, row, old_text
+    MERGE (t:TextUnit {content_hash: row.content_hash})
+    ON CREATE SET
+        t.text_id = l.clv_id + '_text_' + row.content_hash,
+        t.clv_id = l.clv_id,
+        t.header = row.header,
+        t.content = row.content,
+        t.full_text = row.full_text,
+        t.char_count = size(row.full_text),
+        t.created_at = datetime()
+    MERGE (l)-[:HAS_TEXT]->(t)
+    WITH collect(DISTINCT old_text) AS old_texts
+    UNWIND old_texts AS old_text
+    WITH old_text WHERE NOT (old_text)<-[:HAS_TEXT]-(:CLV)
+    DETACH DELETE old_text
+    """
+
+    # Moves HAS_CHILD; AGGREGATES follow with the parents' new versions
+    STRUCTURE_QUERY = """
+    UNWIND $rows AS row
+    MATCH (c:Component {component_id: row.component_id})
+    SET c.component_type = row.component_type,
+        c.ordering_id = row.ordering_id,
+        c.parent_id = row.parent_id
+    WITH c, row
+    OPTIONAL MATCH (:Component)-[old_child:HAS_CHILD]->(c)
+    OPTIONAL MATCH (:Norm)-[old_root:HAS_COMPONENT]->(c)
+    DELETE old_child, old_root
+    WITH DISTINCT c, row
+    OPTIONAL MATCH (p:Component {component_id: row.parent_id})
+    OPTIONAL MATCH (n:Norm {official_id: row.norm_id})
+    FOREACH (_ IN CASE WHEN p IS NULL THEN [] ELSE [1] END |
+        MERGE (p)-[:HAS_CHILD]->(c))
+    FOREACH (_ IN CASE WHEN p IS NULL AND n IS NOT NULL THEN [1] ELSE [] END |
+        MERGE (n)-[:HAS_COMPONENT]->(c))
+    """
+
+    def __init__(
+        self,
+        conn: Optional[Neo4jConnection] = None,
+        engine: Optional[TemporalEngine] = None
+    ):
+        self.conn = conn or (engine.conn if engine is not None else get_connection())
+        # Engine sharing this process: the resync is recorded in its journal,
+        # its hierarchy is reloaded and its listeners (e.g. HybridRetriever
+        # caches) are told
+        self.engine = engine
+
+    def load_graph_state(self) -> Dict[str, dict]:
+        """Read the comparable state of every Component in the graph."""
+        with self.conn.session() as session:
+            return {r["component_id"]: r for r in session.run(self.STATE_QUERY).data()}
+
+    def diff(
+        self,
+        json_path: str = "data/intermediate/constitution.json",
+        enactment_date: str = "1988-10-05",
+    ) -> ComponentDiff:
+        """Compare a parsed constitution file with the graph (read-only)."""
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        norm_id = data.get("official_id", "CF1988")
+        rows = list(iter_component_rows(data.get("components", []), norm_id, enactment_date))
+        return diff_components(self.load_graph_state(), rows)
+
+    def resync(
+        self,
+        json_path: str = "data/intermediate/constitution.json",
+        effective_date: Optional[str] = None,
+        enactment_date: str = "1988-10-05",
+        dry_run: bool = False,
+    ) -> dict:
+        """Write only the components that differ from the graph.
+
+        Args:
+            json_path: Path to the re-parsed constitution JSON
+            effective_date: Start date of the new versions and end date of
+                the ones they supersede (defaults to today)
+            enactment_date: Enactment date used to build comparable rows
+            dry_run: Compute and report the diff without writing
+
+        Returns:
+            Summary of added, removed and changed components
+
+        Raises:
+            ValueError: The effective date is not after the start of a
+                version the resync would supersede
+        """
+        effective_date = effective_date or date.today().isoformat()
+        diff = self.diff(json_path, enactment_date)
+        summary = diff.summary()
+
+        if diff.latest_start is not None and effective_date <= diff.latest_start:
+            raise ValueError(
+                f"Effective date {effective_date} is not after {diff.latest_start}, "
+                "the start of a version the resync would supersede"
+            )
+
+        if dry_run or diff.is_empty:
+            logger.info(f"Resync {'plan' if dry_run else 'found no changes'}: {summary}")
+            return summary
+
+        for row in diff.added:
+            row["date_start"] = effective_date
+            row["is_original"] = False
+
+        with self.conn.session() as session:
+            session.execute_write(self._write_diff, diff, effective_date)
+        if self.engine is not None:
+            if self.engine.journal is not None:
+                # Snapshots cannot replay it: restores past it are refused
+                self.engine.journal.record_resync(effective_date, summary)
+            self.engine.graph_changed()
+
+        logger.info(
+            f"Resync complete: {len(diff.added)} added, {len(diff.removed)} removed, "
+            f"{len(diff.changed)} changed"
+        )
+        return summary
+
+    def _write_diff(self, tx, diff: ComponentDiff, effective_date: str):
+        """Apply a diff in one transaction."""
+        added = {r["component_id"] for r in diff.added}
+        if diff.added:
+            for name, query, keys in ConstitutionLoader.BULK_STATEMENTS:
+                rows = diff.added
+                if name == "aggregates":
+                    # Existing parents aggregate them from their new version
+                    rows = [r for r in diff.added if r["parent_id"] in added]
+                tx.run(query, {"rows": [{k: r[k] for k in keys} for r in rows]}).consume()
+
+        if diff.structure_changed:
+            tx.run(self.STRUCTURE_QUERY, {"rows": [
+                {k: r[k] for k in ("component_id", "norm_id") + STRUCTURE_FIELDS}
+                for r in diff.structure_changed
+            ]}).consume()
+
+        if diff.removed:
+            tx.run(self.REMOVE_QUERY, {
+                "ids": diff.removed,
+                "effective_date": effective_date,
+            }).consume()
+
+        # Children first, so each new parent version aggregates their new CTVs
+        reactivated = set(diff.reactivated)
+        for level in diff.levels:
+            for query, ids in (
+                (self.REACTIVATE_QUERY, [c for c in level if c in reactivated]),
+                (self.PROPAGATE_QUERY, [c for c in level if c not in reactivated]),
+            ):
+                if ids:
+                    tx.run(query, {
+                        "ids": ids,
+                        "effective_date": effective_date,
+                        "orderings": diff.orderings,
+                    }).consume()
+
+        if diff.text_changed:
+            tx.run(self.SPLIT_SHARED_CLV_QUERY, {
+                "ids": [r["component_id"] for r in diff.text_changed],
+            }).consume()
+            tx.run(self.TEXT_QUERY, {"rows": [
+                {k: r[k] for k in TEXT_FIELDS} for r in diff.text_changed
+            ]}).consume()
+
+
+def resync_constitution(
+    json_path: str = "data/intermediate/constitution.json",
+    effective_date: Optional[str] = None,
+    dry_run: bool = False,
+) -> dict:
+    """Convenience function to resync the graph with a re-parsed constitution."""
+    return ConstitutionResync().resync(json_path, effective_date=effective_date, dry_run=dry_run)
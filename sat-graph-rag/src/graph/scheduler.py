@@ -0,0 +1,160 @@
+"""Concurrent amendment replay.
+
+An amendment writes to its changed components and all of their ancestors
+(its footprint). Two amendments whose footprints are disjoint touch
+different Titles and can be applied at the same time: neither reads what
+the other writes, because the children aggregated by an ancestor are
+themselves in the footprint of any amendment that changes them.
+
+AmendmentScheduler orders amendments by date, makes each one depend on
+the last earlier amendment that touched each component of its footprint,
+and applies them on a thread pool as soon as their dependencies are done.
+Each amendment runs in its own session and transaction (see
+TemporalEngine.apply_amendment), so the final graph is identical to a
+serial replay in the same order.
+"""
+
+from typing import Dict, List, Optional, Set
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import logging
+import os
+
+from .memory import InMemoryGraph
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledAmendment:
+    """An amendment with its footprint and scheduling dependencies."""
+    index: int
+    amendment_number: int
+    amendment_date: str
+    changes: List[Dict]
+    description: str = ""
+    footprint: Set[str] = field(default_factory=set)
+    depends_on: Set[int] = field(default_factory=set)
+
+
+class AmendmentScheduler:
+    """Applies non-conflicting amendments concurrently through one engine."""
+
+    def __init__(self, engine, max_workers: Optional[int] = None):
+        """
+        Args:
+            engine: TemporalEngine to apply amendments with
+            max_workers: Concurrent amendments (defaults to the CPU count;
+                an InMemoryGraph is always replayed serially)
+        """
+        self.engine = engine
+        self.max_workers = max_workers or os.cpu_count() or 1
+        if isinstance(engine.conn, InMemoryGraph):
+            self.max_workers = 1
+
+    def footprint(self, changes: List[Dict]) -> Set[str]:
+        """Components an amendment writes: changed ones and their ancestors."""
+        changed = {c["component_id"] for c in changes}
+        return changed | self.engine.hierarchy.ancestors_of(changed)
+
+    def schedule(self, amendments: List[Dict]) -> List[ScheduledAmendment]:
+        """Order amendments by date and compute their dependencies.
+
+        Args:
+            amendments: Dicts with amendment_number, amendment_date, changes
+                and optionally description (apply_amendment's arguments)
+
+        Returns:
+            Scheduled amendments in replay order
+        """
+        ordered = sorted(amendments, key=lambda a: a["amendment_date"])
+        last_writer: Dict[str, int] = {}
+        scheduled = []
+
+        for index, amendment in enumerate(ordered):
+            item = ScheduledAmendment(
+                index=index,
+                amendment_number=amendment["amendment_number"],
+                amendment_date=amendment["amendment_date"],
+                changes=amendment["changes"],
+                description=amendment.get("description", ""),
+                footprint=self.footprint(amendment["changes"]),
+            )
+            for comp_id in item.footprint:
+                if comp_id in last_writer:
+                    item.depends_on.add(last_writer[comp_id])
+                last_writer[comp_id] = index
+            scheduled.append(item)
+
+        return scheduled
+
+    def run(self, amendments: List[Dict]) -> dict:
+        """Apply amendments, running those with disjoint footprints concurrently.
+
+        A failed amendment is rolled back and reported; amendments after it
+        still run, exactly as in a serial replay that skips it.
+
+        Returns:
+            {"applied": [...], "failed": {amendment_number: error}, "stats": ...}
+        """
+        scheduled = self.schedule(amendments)
+        self.engine.hierarchy.ensure_loaded()
+
+        remaining = {item.index: len(item.depends_on) for item in scheduled}
+        dependents: Dict[int, List[int]] = {item.index: [] for item in scheduled}
+        for item in scheduled:
+            for dep in item.depends_on:
+                dependents[dep].append(item.index)
+
+        applied: List[int] = []
+        failed: Dict[int, str] = {}
+
+        logger.info(
+            f"Scheduling {len(scheduled)} amendments on {self.max_workers} workers "
+            f"({sum(1 for n in remaining.values() if n == 0)} independent at start)"
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+
+            def submit(item: ScheduledAmendment):
+                future = pool.submit(
+                    self.engine.apply_amendment,
+                    item.amendment_number,
+                    item.amendment_date,
+                    item.changes,
+                    item.description,
+                )
+                running[future] = item
+
+            for item in scheduled:
+                if remaining[item.index] == 0:
+                    submit(item)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = running.pop(future)
+                    try:
+                        future.result()
+                        applied.append(item.amendment_number)
+                    except Exception as e:
+                        logger.error(f"EC {item.amendment_number} failed: {e}")
+                        failed[item.amendment_number] = str(e)
+
+                    for index in dependents[item.index]:
+                        remaining[index] -= 1
+                        if remaining[index] == 0:
+                            submit(scheduled[index])
+
+        return {"applied": applied, "failed": failed, "stats": dict(self.engine.stats)}
+
+
+def apply_amendments_concurrently(
+    engine,
+    amendments: List[Dict],
+    max_workers: Optional[int] = None,
+) -> dict:
+    """Convenience function to replay amendments with an AmendmentScheduler."""
+    return AmendmentScheduler(engine, max_workers).run(amendments)
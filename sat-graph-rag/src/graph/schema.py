@@ -7,15 +7,16 @@ Node Types:
 - Component: Abstract structural unit (Title, Chapter, Article, etc.)
 - CTV: ComponentTemporalVersion - version valid in a time period
 - CLV: ComponentLanguageVersion - language expression of a CTV
-- TextUnit: Actual text content with embeddings
+- TextUnit: Actual text content with embeddings (shared by content_hash)
 - Action: Amendment action (create, modify, repeal)
 
 Key Relationships:
 - HAS_COMPONENT: Norm -> Component
 - HAS_CHILD: Component -> Component (hierarchy)
 - HAS_VERSION: Component -> CTV
+- CURRENT: Component -> its active CTV (at most one; moved by every write path)
 - AGGREGATES: CTV -> CTV (paper's key innovation)
-- EXPRESSED_IN: CTV -> CLV
+- EXPRESSED_IN: CTV -> CLV (propagated ancestor versions share the previous CLV)
 - HAS_TEXT: CLV -> TextUnit
 - RESULTED_IN: Action -> CTV
 - SUPERSEDES: CTV -> CTV (version chain)
@@ -49,6 +50,22 @@ class SchemaManager:
         "CREATE CONSTRAINT action_id IF NOT EXISTS FOR (a:Action) REQUIRE a.action_id IS UNIQUE",
     ]
 
+    # TextUnit - content-addressed (one node per distinct text). Graphs loaded
+    # before that hold duplicates until scripts/dedupe_text_units.py runs, so
+    # it is only created once there are none
+    CONTENT_HASH_CONSTRAINT = (
+        "CREATE CONSTRAINT text_content_hash IF NOT EXISTS "
+        "FOR (t:TextUnit) REQUIRE t.content_hash IS UNIQUE"
+    )
+
+    DUPLICATE_HASHES_QUERY = """
+    MATCH (t:TextUnit)
+    WHERE t.content_hash IS NOT NULL
+    WITH t.content_hash AS hash, count(t) AS copies
+    WHERE copies > 1
+    RETURN count(hash) AS duplicates
+    """
+
     # Performance indexes
     INDEXES = [
         # Component indexes
@@ -91,12 +108,24 @@ class SchemaManager:
     def create_constraints(self) -> int:
         """Create all uniqueness constraints.
 
+        The content_hash constraint is skipped, with a warning, while
+        TextUnits still share a hash.
+
         Returns:
             Number of constraints created
         """
         created = 0
         with self.connection.session() as session:
-            for constraint in self.CONSTRAINTS:
+            constraints = list(self.CONSTRAINTS)
+            duplicates = session.run(self.DUPLICATE_HASHES_QUERY).single()["duplicates"]
+            if duplicates:
+                logger.warning(
+                    f"Skipping constraint text_content_hash: {duplicates:,} content hashes "
+                    "have several TextUnits (run scripts/dedupe_text_units.py)"
+                )
+            else:
+                constraints.append(self.CONTENT_HASH_CONSTRAINT)
+            for constraint in constraints:
                 try:
                     session.run(constraint)
                     constraint_name = constraint.split("CONSTRAINT")[1].split("IF")[0].strip()
@@ -160,6 +189,26 @@ class SchemaManager:
                 logger.warning(f"Failed to create vector index: {e}")
                 return False
 
+    def link_current_versions(self) -> int:
+        """Backfill CURRENT links on graphs loaded before they existed.
+
+        Returns:
+            Number of CURRENT relationships created
+        """
+        query = """
+        MATCH (c:Component)-[:HAS_VERSION]->(v:CTV {is_active: true})
+        WHERE NOT (c)-[:CURRENT]->(:CTV)
+        WITH c, v ORDER BY v.version_number DESC
+        WITH c, head(collect(v)) AS v
+        CREATE (c)-[:CURRENT]->(v)
+        RETURN count(*) AS created
+        """
+        with self.connection.session() as session:
+            created = session.run(query).single()["created"]
+        if created:
+            logger.info(f"Linked {created} components to their CURRENT version")
+        return created
+
     def setup_all(self) -> dict:
         """Run complete schema setup.
 
@@ -174,6 +223,7 @@ class SchemaManager:
         constraints_created = self.create_constraints()
         indexes_created = self.create_indexes()
         vector_created = self.create_vector_index()
+        current_linked = self.link_current_versions()
 
         logger.info("Schema setup complete!")
 
@@ -181,6 +231,7 @@ class SchemaManager:
             "constraints_created": constraints_created,
             "indexes_created": indexes_created,
             "vector_index_created": vector_created,
+            "current_links_created": current_linked,
         }
 
     def clear_database(self) -> None:
@@ -0,0 +1,207 @@
+"""Graph snapshots and rebuilds from the amendment event log.
+
+A snapshot is the whole temporal graph (a TemporalGraphModel's state plus
+the loader rows of the original constitution) at a point of the
+AmendmentJournal, identified by the journal's ID and the sequence number
+of the last event it includes. Snapshots are gzipped JSON files named
+`snapshot_{seq}_{journal_id}.json.gz` (`snapshot_{seq}.json.gz` for
+journals without an ID). Sequence numbers restart when the journal is
+rotated (reset_database.py), so only snapshots of the current journal are
+ever loaded.
+
+Rebuilding a database is then: load the latest snapshot, replay the
+journal events after it in memory, and write the result in one bulk pass
+with OfflineHistoryBuilder. Nothing is scraped, parsed or applied through
+the online engine.
+
+Only amendments and reverts can be replayed. A journaled resync changed
+the graph in ways the model does not reproduce, so replaying past one is
+refused instead of silently dropping its changes.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+from pathlib import Path
+import gzip
+import json
+import logging
+import os
+import re
+
+from .connection import Neo4jConnection
+from .journal import AmendmentJournal
+from .memory import InMemoryGraph
+from .model import TemporalGraphModel
+from .offline_builder import OfflineHistoryBuilder
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+
+class SnapshotStore:
+    """Directory of numbered graph snapshots."""
+
+    FILE_PATTERN = re.compile(r"snapshot_(\d+)(?:_([\w-]+))?\.json\.gz$")
+
+    def __init__(self, directory: str = "data/snapshots"):
+        self.directory = Path(directory)
+
+    def paths(self, journal_id: Optional[str] = None) -> List[Tuple[int, Path]]:
+        """(seq, path) of every snapshot of a journal, oldest first."""
+        if not self.directory.exists():
+            return []
+        found = []
+        for path in self.directory.iterdir():
+            match = self.FILE_PATTERN.match(path.name)
+            if match and match.group(2) == journal_id:
+                found.append((int(match.group(1)), path))
+        return sorted(found)
+
+    def latest(self, journal_id: Optional[str] = None) -> Optional[Tuple[int, Path]]:
+        paths = self.paths(journal_id)
+        return paths[-1] if paths else None
+
+    def save(
+        self,
+        model: TemporalGraphModel,
+        seq: int,
+        base_rows: List[dict],
+        journal_id: Optional[str] = None,
+    ) -> Path:
+        """Write a snapshot that includes a journal's events up to `seq`."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        suffix = f"_{journal_id}" if journal_id else ""
+        path = self.directory / f"snapshot_{seq:06d}{suffix}.json.gz"
+        tmp_path = path.with_name(path.name + ".tmp")
+        data = {
+            "format": SNAPSHOT_FORMAT,
+            "journal_id": journal_id,
+            "seq": seq,
+            "base_rows": base_rows,
+            "state": model.state(),
+        }
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        # Readers never see a partial snapshot
+        os.replace(tmp_path, path)
+        logger.info(f"Snapshot {path}: {len(model.ctvs)} CTVs, events up to {seq}")
+        return path
+
+    def load(self, path: Path) -> Tuple[InMemoryGraph, int, List[dict]]:
+        """Load a snapshot as (graph, seq, base_rows)."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path}: unsupported snapshot format {data.get('format')}")
+        return InMemoryGraph.from_state(data["state"]), data["seq"], data["base_rows"]
+
+
+def replay_events(model: TemporalGraphModel, events: Iterable[dict]) -> int:
+    """Apply journal events to a model, in order.
+
+    The CTV IDs each amendment allocates are checked against the IDs
+    recorded in its event.
+
+    Returns:
+        Sequence number of the last event replayed (0 if none)
+
+    Raises:
+        ValueError: An event is a resync, which cannot be replayed
+    """
+    last_seq = 0
+    for event in events:
+        if event.get("resync"):
+            raise ValueError(
+                f"Journal event {event['seq']} is a resync ({event['effective_date']}), "
+                "which cannot be replayed; rebuild the database from the parsed sources "
+                "and start a new journal instead"
+            )
+        number = event["amendment_number"]
+        if event.get("reverted"):
+            model.revert_amendment(number)
+        else:
+            model.apply_amendment(
+                number, event["amendment_date"], event["changes"], event.get("description", "")
+            )
+            recorded = event.get("ctv_ids")
+            created = model.created_ctvs.get(f"ec_{number}")
+            if recorded is not None and created != recorded:
+                logger.warning(
+                    f"EC {number}: replay allocated {created}, the log recorded {recorded}"
+                )
+        last_seq = event["seq"]
+    return last_seq
+
+
+def take_snapshot(
+    journal: AmendmentJournal,
+    store: SnapshotStore,
+    json_path: str = "data/intermediate/constitution.json",
+    enactment_date: str = "1988-10-05",
+    min_events: int = 1,
+) -> Optional[Path]:
+    """Snapshot the graph at the end of the journal.
+
+    Starts from the journal's latest snapshot (or the parsed constitution if
+    there is none) and replays the events after it.
+
+    Args:
+        journal: Amendment event log
+        store: Where snapshots are kept
+        json_path: Parsed constitution, used when there is no snapshot yet
+        enactment_date: Date the constitution was enacted
+        min_events: Only snapshot if at least this many events are new
+
+    Returns:
+        Path of the new snapshot, or None if it was not due
+    """
+    latest = store.latest(journal.journal_id)
+    if latest is not None:
+        model, seq, base_rows = store.load(latest[1])
+    else:
+        builder = OfflineHistoryBuilder(model=InMemoryGraph())
+        model = builder.load_base(json_path, enactment_date)
+        seq, base_rows = 0, builder.base_rows
+
+    events = list(journal.events(after_seq=seq))
+    if len(events) < min_events:
+        logger.info(f"{len(events)} new events since snapshot {seq}; not due")
+        return None
+
+    seq = replay_events(model, events) or seq
+    return store.save(model, seq, base_rows, journal.journal_id)
+
+
+def restore_from_snapshot(
+    journal: AmendmentJournal,
+    store: SnapshotStore,
+    conn: Optional[Neo4jConnection] = None,
+    write: bool = True,
+    batch_size: Optional[int] = None,
+) -> InMemoryGraph:
+    """Rebuild the graph from the journal's latest snapshot and the events after it.
+
+    Args:
+        journal: Amendment event log
+        store: Where snapshots are kept
+        conn: Connection to an empty database
+        write: Bulk-write the rebuilt graph (False only rebuilds it in memory)
+        batch_size: Rows per write transaction
+
+    Returns:
+        The rebuilt graph
+    """
+    latest = store.latest(journal.journal_id)
+    if latest is None:
+        raise ValueError(f"No snapshot of journal {journal.path} in {store.directory}")
+
+    graph, seq, base_rows = store.load(latest[1])
+    replayed = replay_events(graph, journal.events(after_seq=seq))
+    logger.info(f"Restored snapshot {seq} plus events up to {replayed or seq}")
+
+    if write:
+        builder = OfflineHistoryBuilder(conn, model=graph)
+        builder.base_rows = base_rows
+        builder.write(batch_size)
+    return graph
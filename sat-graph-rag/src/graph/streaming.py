@@ -0,0 +1,229 @@
+"""Streaming load of constitution.json into Neo4j.
+
+ConstitutionLoader reads the whole intermediate file with `json.load` before
+writing anything. StreamingConstitutionLoader instead walks the `components`
+array as a stream of JSON events, emits components depth-first together with
+their parent IDs, and writes them with the bulk UNWIND statements in bounded
+batches. Peak memory is one batch of rows plus the chain of open ancestors,
+independent of the size of the file.
+"""
+
+from typing import Any, Iterator, List, Optional, Tuple
+import logging
+
+from .connection import Neo4jConnection
+from .loader import ConstitutionLoader, build_component_row
+from ..utils.json_stream import JsonEventStream, read_value, skip_value
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class StreamingConstitutionLoader(ConstitutionLoader):
+    """Loads a parsed constitution incrementally, in bounded batches."""
+
+    # Component keys used to build a row; everything else is skipped unread
+    ROW_KEYS = {
+        "component_id", "component_type", "ordering_id", "header", "content",
+        "full_text", "is_original", "events",
+    }
+
+    # Keys that only affect the CTV/Component and may safely arrive after
+    # `children` (the parser dumps `is_original` and `events` last)
+    LATE_KEYS = {"component_type", "ordering_id", "is_original", "events"}
+
+    # Fixes up properties that were not yet known when a row was emitted
+    PATCH_QUERY = """
+    UNWIND $rows AS row
+    MATCH (c:Component {component_id: row.component_id})
+    MATCH (v:CTV {ctv_id: row.ctv_id})
+    SET c.component_type = row.component_type,
+        c.ordering_id = row.ordering_id,
+        v.is_original = row.is_original,
+        v.amendment_numbers = row.amendment_numbers
+    """
+
+    def __init__(self, conn: Optional[Neo4jConnection] = None):
+        super().__init__(conn)
+        self._rows: List[dict] = []
+        self._patches: List[dict] = []
+        self._session = None
+        self._batch_size = self.DEFAULT_BATCH_SIZE
+
+    def load_from_json(
+        self,
+        json_path: str = "data/intermediate/constitution.json",
+        enactment_date: str = "1988-10-05",
+        batch_size: Optional[int] = None,
+    ) -> dict:
+        """Stream a parsed constitution into the graph.
+
+        Args:
+            json_path: Path to parsed constitution JSON
+            enactment_date: Date the constitution was enacted
+            batch_size: Components per write transaction
+
+        Returns:
+            Statistics about loaded nodes and relationships
+        """
+        logger.info(f"Streaming constitution from {json_path}")
+        self._batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+
+        header = {}
+        norm_created = False
+        with open(json_path, "r", encoding="utf-8") as f, self.conn.session() as session:
+            self._session = session
+            events = iter(JsonEventStream(f))
+
+            event, _ = next(events)
+            if event != "start_map":
+                raise ValueError(f"{json_path} does not contain a JSON object")
+
+            for event, key in events:
+                if event == "end_map":
+                    break
+                if key != "components":
+                    header[key] = read_value(events)
+                    continue
+
+                # `name` and `official_id` precede `components` in parser output
+                norm_id = self._create_streamed_norm(header, enactment_date)
+                norm_created = True
+                self._walk_array(events, None, norm_id, enactment_date)
+
+            if not norm_created:
+                self._create_streamed_norm(header, enactment_date)
+            self._flush()
+            self._session = None
+
+        logger.info(f"Streaming load complete. Stats: {self.stats}")
+        return self.stats
+
+    def _create_streamed_norm(self, header: dict, enactment_date: str) -> str:
+        norm_id = header.get("official_id", "CF1988")
+        self._create_norm(
+            official_id=norm_id,
+            name=header.get("name", "Constituição da República Federativa do Brasil"),
+            enactment_date=enactment_date,
+        )
+        return norm_id
+
+    def _walk_array(
+        self,
+        events: Iterator[Tuple[str, Any]],
+        parent_row: Optional[dict],
+        norm_id: str,
+        enactment_date: str,
+    ):
+        """Walk a `components`/`children` array, one component at a time."""
+        event, _ = next(events)
+        if event != "start_array":
+            raise ValueError("Expected an array of components")
+
+        ordering = 0
+        for event, _ in events:
+            if event == "end_array":
+                return
+            if event != "start_map":
+                raise ValueError(f"Expected a component object, got {event}")
+            ordering += 1
+            self._walk_component(events, parent_row, norm_id, enactment_date, ordering)
+
+    def _walk_component(
+        self,
+        events: Iterator[Tuple[str, Any]],
+        parent_row: Optional[dict],
+        norm_id: str,
+        enactment_date: str,
+        ordering: int,
+    ):
+        """Emit one component (before its children) and recurse into children."""
+        fields = {}
+        row = None
+        seen_at_emit = set()
+
+        for event, key in events:
+            if event == "end_map":
+                break
+            if key == "children":
+                row = self._emit(fields, parent_row, norm_id, enactment_date, ordering)
+                seen_at_emit = set(fields)
+                self._walk_array(events, row, norm_id, enactment_date)
+            elif key in self.ROW_KEYS:
+                fields[key] = read_value(events)
+            else:
+                skip_value(events)
+
+        if row is None:
+            self._emit(fields, parent_row, norm_id, enactment_date, ordering)
+            return
+
+        late = set(fields) - seen_at_emit
+        if late - self.LATE_KEYS:
+            raise ValueError(
+                f"Component {row['component_id']}: {sorted(late - self.LATE_KEYS)} "
+                "must appear before 'children'"
+            )
+        if late:
+            patch = self._build_row(fields, parent_row, norm_id, enactment_date, ordering)
+            self._patches.append(patch)
+            self._maybe_flush()
+
+    def _build_row(
+        self,
+        fields: dict,
+        parent_row: Optional[dict],
+        norm_id: str,
+        enactment_date: str,
+        ordering: int,
+    ) -> dict:
+        if not fields.get("component_id"):
+            raise ValueError("Component is missing 'component_id' before its children")
+        return build_component_row(
+            component=fields,
+            norm_id=norm_id,
+            parent_id=parent_row["component_id"] if parent_row else None,
+            parent_ctv_id=parent_row["ctv_id"] if parent_row else None,
+            enactment_date=enactment_date,
+            ordering=ordering,
+        )
+
+    def _emit(
+        self,
+        fields: dict,
+        parent_row: Optional[dict],
+        norm_id: str,
+        enactment_date: str,
+        ordering: int,
+    ) -> dict:
+        row = self._build_row(fields, parent_row, norm_id, enactment_date, ordering)
+        self._rows.append(row)
+        self._maybe_flush()
+        return row
+
+    def _maybe_flush(self):
+        if len(self._rows) + len(self._patches) >= self._batch_size:
+            self._flush()
+
+    def _flush(self):
+        """Write buffered rows and patches in one explicit transaction."""
+        if not self._rows and not self._patches:
+            return
+        self._session.execute_write(self._write_stream_batch, self._rows, self._patches)
+        self._count_rows(self._rows)
+        logger.debug(f"Wrote {len(self._rows)} components, {len(self._patches)} patches")
+        self._rows = []
+        self._patches = []
+
+    @classmethod
+    def _write_stream_batch(cls, tx, rows: List[dict], patches: List[dict]):
+        if rows:
+            cls._write_rows(tx, rows)
+        if patches:
+            tx.run(cls.PATCH_QUERY, {"rows": [
+                {k: p[k] for k in (
+                    "component_id", "component_type", "ordering_id", "ctv_id",
+                    "is_original", "amendment_numbers",
+                )}
+                for p in patches
+            ]}).consume()
@@ -8,13 +8,28 @@ When an amendment changes a component:
 4. REUSE unchanged sibling CTVs (don't duplicate!)
 
 This ensures that unchanged components don't get duplicated across amendments.
+
+Each amendment is applied in a single write transaction, with every step
+batched per hierarchy level via UNWIND. Ancestors and depths come from an
+in-memory ComponentHierarchy loaded once per engine. Active versions are
+reached through the Component's CURRENT relationship (never by scanning
+HAS_VERSION), which is moved in the statement that closes the old version.
+Given an InMemoryGraph instead of a connection, the engine applies the same
+rules in memory.
 """
 
-from typing import List, Dict, Set, Optional
+from typing import Callable, List, Dict, Set, Optional, Union
 from datetime import date
 import logging
+import threading
 
 from .connection import get_connection, Neo4jConnection
+from .loader import compute_content_hash
+from .hierarchy import ComponentHierarchy
+from .model import change_rounds
+from .memory import InMemoryGraph
+from .planning import AmendmentPlan, plan_changes, plan_components
+from .journal import AmendmentJournal
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,8 +45,27 @@ class TemporalEngine:
     But REUSE unchanged sibling CTVs (don't duplicate!)
     """
 
-    def __init__(self, conn: Optional[Neo4jConnection] = None):
+    ACTION_STATUS_QUERY = """
+    MATCH (a:Action {action_id: $action_id})
+    RETURN a.status AS status
+    """
+
+    def __init__(
+        self,
+        conn: Optional[Union[Neo4jConnection, InMemoryGraph]] = None,
+        hierarchy: Optional[ComponentHierarchy] = None,
+        journal: Optional[AmendmentJournal] = None
+    ):
         self.conn = conn or get_connection()
+        # Optional durable record of committed amendments (for resuming)
+        self.journal = journal
+        # Amendments skipped because they were already committed
+        self.already_applied: List[int] = []
+        # The hierarchy does not change while amendments are replayed;
+        # call self.hierarchy.invalidate() after structural edits
+        if hierarchy is None and isinstance(self.conn, InMemoryGraph):
+            hierarchy = self.conn.hierarchy
+        self.hierarchy = hierarchy or ComponentHierarchy(self.conn)
         self.stats = {
             "new_ctvs": 0,
             "closed_ctvs": 0,
@@ -39,6 +73,31 @@ class TemporalEngine:
             "new_aggregations": 0,
             "actions_created": 0,
         }
+        # Amendments may be applied from several threads (AmendmentScheduler)
+        self._stats_lock = threading.Lock()
+        # Called with the EC number after an Action is created or reverted
+        # (None for changes made outside amendments, see graph_changed)
+        self.listeners: List[Callable[[Optional[int]], None]] = []
+
+    def add_listener(self, callback: Callable[[Optional[int]], None]):
+        """Call `callback(amendment_number)` whenever the graph changes.
+
+        Listeners (e.g. HybridRetriever.on_amendment) run after the
+        transaction commits, on the thread that applied the amendment.
+        """
+        self.listeners.append(callback)
+
+    def _notify(self, amendment_number: Optional[int]):
+        for callback in self.listeners:
+            callback(amendment_number)
+
+    def graph_changed(self):
+        """Report a change made outside the engine (e.g. a ConstitutionResync).
+
+        The cached hierarchy is dropped and listeners are called with None.
+        """
+        self.hierarchy.invalidate()
+        self._notify(None)
 
     def apply_amendment(
         self,
@@ -50,6 +109,13 @@ class TemporalEngine:
         """
         Apply an amendment that modifies one or more components.
 
+        The whole amendment runs in one explicit write transaction, so a
+        failure rolls back every closed, created and linked version. An
+        amendment whose Action is already committed in the graph is skipped,
+        so replays are idempotent. A journal entry alone is not enough: it is
+        confirmed with a read of the Action first (the database may have
+        been reset since), which skips the write transaction.
+
         Args:
             amendment_number: EC number (e.g., 45)
             amendment_date: Date string "YYYY-MM-DD"
@@ -59,60 +125,369 @@ class TemporalEngine:
         Returns:
             Statistics about the changes made
         """
+        if self.journal is not None and self.journal.is_committed(amendment_number):
+            if self._is_committed_in_graph(amendment_number):
+                logger.info(f"EC {amendment_number} already committed (journal), skipping")
+                self.already_applied.append(amendment_number)
+                return self.stats
+            logger.warning(
+                f"EC {amendment_number} is in the journal but not in the graph "
+                "(database reset?); applying it again"
+            )
+
         logger.info(f"Applying EC {amendment_number} ({amendment_date})")
 
-        # Create Action node
+        if isinstance(self.conn, InMemoryGraph):
+            result = None
+            if not self.conn.is_committed(amendment_number):
+                delta = {key: 0 for key in self.stats}
+                self.conn.apply_amendment(
+                    amendment_number, amendment_date, changes, description, stats=delta
+                )
+                result = delta, self.conn.created_ctvs[f"ec_{amendment_number}"]
+        else:
+            self.hierarchy.ensure_loaded()
+            with self.conn.session() as session:
+                result = session.execute_write(
+                    self._apply_amendment_tx,
+                    amendment_number,
+                    amendment_date,
+                    changes,
+                    description
+                )
+
+        if result is None:
+            logger.info(f"EC {amendment_number} already committed (graph), skipping")
+            self.already_applied.append(amendment_number)
+            if self.journal is not None:
+                self.journal.record(
+                    amendment_number, amendment_date, changes,
+                    recovered=True, description=description
+                )
+            return self.stats
+
+        # Only count what was committed (the tx function may be retried)
+        delta, ctv_ids = result
+        with self._stats_lock:
+            for key, value in delta.items():
+                self.stats[key] += value
+
+        if self.journal is not None:
+            self.journal.record(
+                amendment_number, amendment_date, changes, delta, ctv_ids,
+                description=description
+            )
+        self._notify(amendment_number)
+
+        logger.info(f"Amendment applied. Stats: {self.stats}")
+        return self.stats
+
+    def _is_committed_in_graph(self, amendment_number: int) -> bool:
+        """Whether the amendment's Action is committed (one read, no hierarchy)."""
+        if isinstance(self.conn, InMemoryGraph):
+            return self.conn.is_committed(amendment_number)
+        with self.conn.session() as session:
+            record = session.execute_read(
+                lambda tx: tx.run(
+                    self.ACTION_STATUS_QUERY, {"action_id": f"ec_{amendment_number}"}
+                ).single()
+            )
+        return self._is_committed_status(record)
+
+    @staticmethod
+    def _is_committed_status(record) -> bool:
+        """Whether an ACTION_STATUS_QUERY row is a committed Action.
+
+        Actions written before statuses were recorded have none; they were
+        only ever created for applied amendments, so they count as committed.
+        """
+        return record is not None and record["status"] in (None, "committed")
+
+    def revert_amendment(self, amendment_number: int) -> dict:
+        """
+        Undo an amendment: delete the CTVs it created (changed components and
+        propagated ancestors) and reopen the CTVs they superseded.
+
+        Only the amendment's footprint is read and written: the components
+        its Action RESULTED_IN, plus their ancestors. CLVs owned by deleted
+        CTVs are deleted, as are TextUnits no other CLV uses. The revert is
+        refused if a later amendment has already superseded one of its CTVs.
+
+        Args:
+            amendment_number: EC number
+
+        Returns:
+            {"deleted_ctvs", "reopened_ctvs", "deleted_text_units"}
+
+        Raises:
+            ValueError: The amendment is not applied or has been superseded
+        """
+        logger.info(f"Reverting EC {amendment_number}")
+
+        if isinstance(self.conn, InMemoryGraph):
+            result = self.conn.revert_amendment(amendment_number)
+        else:
+            self.hierarchy.ensure_loaded()
+            with self.conn.session() as session:
+                result = session.execute_write(self._revert_amendment_tx, amendment_number)
+
+        if self.journal is not None:
+            self.journal.record_revert(amendment_number)
+        self._notify(amendment_number)
+
+        logger.info(f"EC {amendment_number} reverted: {result}")
+        return result
+
+    def _revert_amendment_tx(self, tx, amendment_number: int) -> dict:
+        """Revert an amendment inside a transaction (reads before any write)."""
+        action_id = f"ec_{amendment_number}"
+        record = tx.run("""
+            MATCH (a:Action {action_id: $action_id})
+            OPTIONAL MATCH (a)-[:RESULTED_IN]->(v:CTV)
+            RETURN collect(DISTINCT v.component_id) AS components
+        """, {"action_id": action_id}).single()
+        if record is None:
+            raise ValueError(f"EC {amendment_number} is not applied")
+
+        changed = set(record["components"])
+        footprint = changed | self.hierarchy.ancestors_of(changed)
+        rows = [dict(r) for r in tx.run("""
+            UNWIND $comp_ids AS comp_id
+            MATCH (:Component {component_id: comp_id})-[:HAS_VERSION]->(v:CTV)
+            WHERE v.amendment_number = $amendment_number
+            OPTIONAL MATCH (v)-[:SUPERSEDES]->(prev:CTV)
+            OPTIONAL MATCH (next:CTV)-[:SUPERSEDES]->(v)
+            RETURN v.ctv_id AS ctv_id,
+                   prev.ctv_id AS prev_ctv_id,
+                   next.ctv_id AS next_ctv_id
+        """, {"comp_ids": sorted(footprint), "amendment_number": amendment_number})]
+
+        created = {r["ctv_id"] for r in rows}
+        for r in rows:
+            if r["next_ctv_id"] and r["next_ctv_id"] not in created:
+                raise ValueError(
+                    f"EC {amendment_number} is superseded by {r['next_ctv_id']}; "
+                    "revert the later amendments first"
+                )
+        reopened = sorted(
+            r["prev_ctv_id"] for r in rows
+            if r["prev_ctv_id"] and r["prev_ctv_id"] not in created
+        )
+
+        # Delete the new CTVs with the CLVs they own (shared CLVs stay)
+        record = tx.run("""
+            UNWIND $ctv_ids AS ctv_id
+            MATCH (v:CTV {ctv_id: ctv_id})
+            OPTIONAL MATCH (v)-[:EXPRESSED_IN]->(l:CLV {ctv_id: ctv_id})
+            OPTIONAL MATCH (l)-[:HAS_TEXT]->(t:TextUnit)
+            DETACH DELETE v, l
+            RETURN collect(DISTINCT t.content_hash) AS hashes
+        """, {"ctv_ids": sorted(created)}).single()
+        hashes = record["hashes"] if record else []
+
+        # TextUnits are content-addressed: keep those other CLVs still use
+        record = tx.run("""
+            UNWIND $hashes AS hash
+            MATCH (t:TextUnit {content_hash: hash})
+            WHERE NOT (t)<-[:HAS_TEXT]-()
+            DELETE t
+            RETURN count(t) AS deleted
+        """, {"hashes": hashes}).single()
+        deleted_text_units = record["deleted"] if record else 0
+
+        # (deleting the new CTVs removed their CURRENT links)
+        tx.run("""
+            UNWIND $ctv_ids AS ctv_id
+            MATCH (c:Component)-[:HAS_VERSION]->(v:CTV {ctv_id: ctv_id})
+            SET v.date_end = null,
+                v.is_active = true
+            CREATE (c)-[:CURRENT]->(v)
+        """, {"ctv_ids": reopened}).consume()
+
+        tx.run("""
+            MATCH (a:Action {action_id: $action_id})
+            DETACH DELETE a
+        """, {"action_id": action_id}).consume()
+
+        return {
+            "deleted_ctvs": len(created),
+            "reopened_ctvs": len(reopened),
+            "deleted_text_units": deleted_text_units,
+        }
+
+    def plan_amendment(
+        self,
+        amendment_number: int,
+        amendment_date: str,
+        changes: List[Dict]
+    ) -> AmendmentPlan:
+        """
+        Compute what apply_amendment would write, without writing anything.
+
+        Only the active versions of the changed components, their ancestors
+        and the ancestors' children are read.
+
+        Args:
+            amendment_number: EC number (e.g., 45)
+            amendment_date: Date string "YYYY-MM-DD"
+            changes: List of {component_id, new_content, change_type}
+
+        Returns:
+            AmendmentPlan with the CTVs, AGGREGATES edges and TextUnits that
+            would be created and an estimate of the write volume
+        """
+        comp_ids = plan_components(changes, self.hierarchy)
+        hashes = sorted({
+            compute_content_hash(c["new_content"])
+            for c in changes if c.get("new_content")
+        })
+
+        if isinstance(self.conn, InMemoryGraph):
+            active, orderings, existing = self._plan_state_in_memory(comp_ids, hashes)
+        else:
+            with self.conn.session() as session:
+                active, orderings, existing = session.execute_read(
+                    self._read_plan_state, sorted(comp_ids), hashes
+                )
+
+        plan = plan_changes(
+            amendment_number,
+            amendment_date,
+            changes,
+            hierarchy=self.hierarchy,
+            active=active,
+            orderings=orderings,
+            existing_hashes=existing,
+        )
+        logger.info(f"Plan for EC {amendment_number}: {plan.summary()}")
+        return plan
+
+    @staticmethod
+    def _read_plan_state(tx, comp_ids: List[str], hashes: List[str]):
+        """Read active versions, their AGGREGATES orderings and known hashes."""
+        active: Dict[str, dict] = {}
+        orderings: Dict[str, Dict[str, int]] = {}
+        result = tx.run("""
+            UNWIND $comp_ids AS comp_id
+            MATCH (:Component {component_id: comp_id})-[:CURRENT]->(v:CTV)
+            OPTIONAL MATCH (v)-[a:AGGREGATES]->(child:CTV)
+            RETURN comp_id,
+                   v.ctv_id AS ctv_id,
+                   v.version_number AS version_number,
+                   toString(v.date_start) AS date_start,
+                   collect([child.component_id, a.ordering]) AS children
+        """, {"comp_ids": comp_ids})
+        for r in result:
+            active[r["comp_id"]] = {
+                "ctv_id": r["ctv_id"],
+                "version_number": r["version_number"],
+                "date_start": r["date_start"],
+            }
+            orderings[r["ctv_id"]] = {
+                child_id: ordering for child_id, ordering in r["children"] if child_id
+            }
+
+        result = tx.run("""
+            UNWIND $hashes AS hash
+            MATCH (t:TextUnit {content_hash: hash})
+            RETURN DISTINCT t.content_hash AS content_hash
+        """, {"hashes": hashes})
+        existing = {r["content_hash"] for r in result}
+        return active, orderings, existing
+
+    def _plan_state_in_memory(self, comp_ids: Set[str], hashes: List[str]):
+        """Same snapshot as _read_plan_state, from an InMemoryGraph."""
+        graph = self.conn
+        active: Dict[str, dict] = {}
+        orderings: Dict[str, Dict[str, int]] = {}
+        for comp_id in comp_ids:
+            ctv = graph.active_version(comp_id)
+            if ctv is None:
+                continue
+            active[comp_id] = ctv
+            orderings[ctv["ctv_id"]] = {
+                graph.ctvs[child]["component_id"]: ordering
+                for ordering, child in graph.aggregates.get(ctv["ctv_id"], [])
+            }
+        existing = {h for h in hashes if h in graph.text_units}
+        return active, orderings, existing
+
+    def _apply_amendment_tx(
+        self,
+        tx,
+        amendment_number: int,
+        amendment_date: str,
+        changes: List[Dict],
+        description: str
+    ) -> Optional[tuple]:
+        """Apply an amendment inside a transaction.
+
+        Returns:
+            (stats, created CTV IDs), or None if the amendment was already
+            committed
+        """
+        stats = {key: 0 for key in self.stats}
         action_id = f"ec_{amendment_number}"
+
+        # An amendment is applied at most once
+        record = tx.run(self.ACTION_STATUS_QUERY, {"action_id": action_id}).single()
+        if self._is_committed_status(record):
+            return None
+
+        # Create Action node (marked committed by this same transaction)
         self._create_action(
+            tx,
             action_id=action_id,
             amendment_number=amendment_number,
             amendment_date=amendment_date,
             description=description,
             affected_components=[c["component_id"] for c in changes]
         )
+        stats["actions_created"] += 1
 
         # Track which components need new parent CTVs
         affected_ancestors: Set[str] = set()
-
-        # Process each changed component
-        for change in changes:
-            comp_id = change["component_id"]
-            new_content = change.get("new_content", "")
-            change_type = change.get("change_type", "modify")
-
-            # Create new CTV for the changed component
-            new_ctv_id = self._create_new_version(
-                component_id=comp_id,
+        ctv_ids: List[str] = []
+
+        # Process changed components; a component changed twice in the same
+        # amendment gets one new version per change, in order
+        for round_changes in self._change_rounds(changes):
+            created = self._create_new_versions(
+                tx,
+                changes=round_changes,
                 date_start=amendment_date,
-                new_content=new_content,
-                change_type=change_type,
-                amendment_number=amendment_number
+                amendment_number=amendment_number,
+                stats=stats
             )
+            if not created:
+                continue
 
-            if new_ctv_id:
-                # Link action to new CTV
-                self._link_action_to_ctv(action_id, new_ctv_id)
+            # Link action to new CTVs
+            self._link_action_to_ctvs(tx, action_id, list(created.values()))
+            ctv_ids.extend(created.values())
 
-                # Collect ancestors that need updating
-                ancestors = self._get_ancestor_chain(comp_id)
-                affected_ancestors.update(ancestors)
+            # Collect ancestors that need updating
+            affected_ancestors.update(self.hierarchy.ancestors_of(created))
 
-        # Process ancestors from bottom up
+        # Process ancestors from bottom up, one hierarchy level at a time
         # This ensures child CTVs exist before parent CTVs aggregate them
-        sorted_ancestors = self._sort_by_depth(affected_ancestors, reverse=True)
-
-        for ancestor_id in sorted_ancestors:
-            self._update_ancestor_aggregation(
-                component_id=ancestor_id,
+        for level in self.hierarchy.group_by_depth(affected_ancestors, reverse=True):
+            ctv_ids.extend(self._update_ancestor_aggregations(
+                tx,
+                component_ids=level,
                 amendment_date=amendment_date,
-                amendment_number=amendment_number
-            )
+                amendment_number=amendment_number,
+                stats=stats
+            ))
 
-        logger.info(f"Amendment applied. Stats: {self.stats}")
-        return self.stats
+        return stats, ctv_ids
+
+    # A component changed twice in one amendment gets one version per change
+    _change_rounds = staticmethod(change_rounds)
 
     def _create_action(
         self,
+        tx,
         action_id: str,
         amendment_number: int,
         amendment_date: str,
@@ -129,304 +504,214 @@ class TemporalEngine:
             a.description = $description,
             a.affected_components = $affected_components,
             a.created_at = datetime()
+        SET a.status = 'committed',
+            a.committed_at = datetime()
         """
-        with self.conn.session() as session:
-            session.run(query, {
-                "action_id": action_id,
-                "amendment_number": amendment_number,
-                "amendment_date": amendment_date,
-                "description": description,
-                "affected_components": affected_components
-            })
-        self.stats["actions_created"] += 1
-
-    def _create_new_version(
+        tx.run(query, {
+            "action_id": action_id,
+            "amendment_number": amendment_number,
+            "amendment_date": amendment_date,
+            "description": description,
+            "affected_components": affected_components
+        }).consume()
+
+    def _create_new_versions(
         self,
-        component_id: str,
+        tx,
+        changes: List[Dict],
         date_start: str,
-        new_content: str,
-        change_type: str,
-        amendment_number: int
-    ) -> Optional[str]:
+        amendment_number: int,
+        stats: Dict
+    ) -> Dict[str, str]:
         """
-        Create a new CTV for a changed component.
-        Also closes the previous version.
+        Create new CTVs for a batch of changed components (one per component).
+        Also closes the previous versions.
 
         Returns:
-            The new CTV ID, or None if failed
+            Mapping of component ID to new CTV ID (components without an
+            active version are skipped)
         """
-        # Get current version number
-        query = """
-        MATCH (c:Component {component_id: $comp_id})-[:HAS_VERSION]->(v:CTV)
-        WHERE v.is_active = true
-        RETURN v.ctv_id AS current_ctv, v.version_number AS version
-        LIMIT 1
-        """
-
-        with self.conn.session() as session:
-            result = list(session.run(query, {"comp_id": component_id}))
-
-        if not result:
-            logger.error(f"No active CTV found for {component_id}")
-            return None
-
-        current_ctv_id = result[0]["current_ctv"]
-        current_version = result[0]["version"]
-        new_version = current_version + 1
-        new_ctv_id = f"{component_id}_v{new_version}"
-
-        # Close the current version
-        with self.conn.session() as session:
-            session.run("""
-                MATCH (v:CTV {ctv_id: $ctv_id})
-                SET v.date_end = date($end_date),
-                    v.is_active = false
-            """, {"ctv_id": current_ctv_id, "end_date": date_start})
-        self.stats["closed_ctvs"] += 1
-
-        # Create new version
-        is_repeal = change_type == "repeal"
-
-        with self.conn.session() as session:
-            session.run("""
-                MATCH (c:Component {component_id: $comp_id})
-                CREATE (v:CTV {
-                    ctv_id: $ctv_id,
-                    component_id: $comp_id,
-                    version_number: $version,
-                    date_start: date($date_start),
-                    date_end: null,
-                    is_active: true,
-                    is_original: false,
-                    created_by_action: 'amendment',
-                    amendment_number: $amendment_number,
-                    is_repealed: $is_repeal,
-                    created_at: datetime()
-                })
-                CREATE (c)-[:HAS_VERSION]->(v)
-                WITH v
-                MATCH (prev:CTV {ctv_id: $prev_ctv})
-                CREATE (v)-[:SUPERSEDES]->(prev)
-            """, {
-                "ctv_id": new_ctv_id,
-                "comp_id": component_id,
-                "version": new_version,
-                "date_start": date_start,
-                "amendment_number": amendment_number,
-                "is_repeal": is_repeal,
-                "prev_ctv": current_ctv_id
+        rows = [
+            {
+                "component_id": c["component_id"],
+                "is_repeal": c.get("change_type", "modify") == "repeal",
+                "content": c.get("new_content", "") or "",
+            }
+            for c in changes
+        ]
+
+        # Close current versions and create the new ones
+        result = tx.run("""
+            UNWIND $rows AS row
+            MATCH (c:Component {component_id: row.component_id})-[current:CURRENT]->(cur:CTV)
+            SET cur.date_end = date($date_start),
+                cur.is_active = false
+            DELETE current
+            CREATE (v:CTV {
+                ctv_id: row.component_id + '_v' + toString(cur.version_number + 1),
+                component_id: row.component_id,
+                version_number: cur.version_number + 1,
+                date_start: date($date_start),
+                date_end: null,
+                is_active: true,
+                is_original: false,
+                created_by_action: 'amendment',
+                amendment_number: $amendment_number,
+                is_repealed: row.is_repeal,
+                created_at: datetime()
             })
-        self.stats["new_ctvs"] += 1
-
-        # Create CLV and TextUnit for new version (if not repealed)
-        if not is_repeal and new_content:
-            clv_id = f"{new_ctv_id}_pt"
-            text_id = f"{clv_id}_text"
-
-            with self.conn.session() as session:
-                session.run("""
-                    MATCH (v:CTV {ctv_id: $ctv_id})
-                    CREATE (l:CLV {
-                        clv_id: $clv_id,
-                        ctv_id: $ctv_id,
-                        language: 'pt',
-                        created_at: datetime()
-                    })
-                    CREATE (t:TextUnit {
-                        text_id: $text_id,
-                        clv_id: $clv_id,
-                        full_text: $content,
-                        char_count: size($content),
-                        created_at: datetime()
-                    })
-                    CREATE (v)-[:EXPRESSED_IN]->(l)
-                    CREATE (l)-[:HAS_TEXT]->(t)
-                """, {
-                    "ctv_id": new_ctv_id,
-                    "clv_id": clv_id,
-                    "text_id": text_id,
-                    "content": new_content
+            CREATE (c)-[:HAS_VERSION]->(v)
+            CREATE (c)-[:CURRENT]->(v)
+            CREATE (v)-[:SUPERSEDES]->(cur)
+            RETURN row.component_id AS component_id, v.ctv_id AS ctv_id
+        """, {
+            "rows": rows,
+            "date_start": date_start,
+            "amendment_number": amendment_number
+        })
+        created = {r["component_id"]: r["ctv_id"] for r in result}
+
+        for row in rows:
+            if row["component_id"] not in created:
+                logger.error(f"No active CTV found for {row['component_id']}")
+
+        stats["closed_ctvs"] += len(created)
+        stats["new_ctvs"] += len(created)
+
+        # Create CLV and TextUnit for new versions (if not repealed)
+        # TextUnits are content-addressed: unchanged text reuses the node
+        text_rows = [
+            {
+                "ctv_id": created[row["component_id"]],
+                "content": row["content"],
+                "content_hash": compute_content_hash(row["content"]),
+            }
+            for row in rows
+            if row["component_id"] in created and not row["is_repeal"] and row["content"]
+        ]
+        if text_rows:
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (v:CTV {ctv_id: row.ctv_id})
+                CREATE (l:CLV {
+                    clv_id: row.ctv_id + '_pt',
+                    ctv_id: row.ctv_id,
+                    language: 'pt',
+                    created_at: datetime()
                 })
-
-        return new_ctv_id
-
-    def _get_ancestor_chain(self, component_id: str) -> List[str]:
-        """Get all ancestors of a component up to root."""
-        query = """
-        MATCH (c:Component {component_id: $comp_id})
-        MATCH path = (c)<-[:HAS_CHILD*]-(ancestor:Component)
-        RETURN ancestor.component_id AS ancestor_id,
-               length(path) AS depth
-        ORDER BY depth ASC
-        """
-
-        with self.conn.session() as session:
-            result = list(session.run(query, {"comp_id": component_id}))
-
-        return [r["ancestor_id"] for r in result]
-
-    def _sort_by_depth(self, component_ids: Set[str], reverse: bool = False) -> List[str]:
-        """Sort components by their depth in hierarchy."""
-        if not component_ids:
-            return []
-
-        query = """
-        UNWIND $comp_ids AS comp_id
-        MATCH (c:Component {component_id: comp_id})
-        OPTIONAL MATCH path = (c)<-[:HAS_CHILD*]-(root:Component)
-        WHERE NOT (:Component)-[:HAS_CHILD]->(root)
-        RETURN comp_id,
-               CASE WHEN path IS NULL THEN 0 ELSE length(path) END AS depth
-        ORDER BY depth
-        """
-
-        with self.conn.session() as session:
-            result = list(session.run(query, {"comp_ids": list(component_ids)}))
-
-        sorted_ids = [r["comp_id"] for r in result]
-        if reverse:
-            sorted_ids.reverse()
-        return sorted_ids
-
-    def _update_ancestor_aggregation(
+                MERGE (t:TextUnit {content_hash: row.content_hash})
+                ON CREATE SET
+                    t.text_id = row.ctv_id + '_pt_text',
+                    t.clv_id = row.ctv_id + '_pt',
+                    t.full_text = row.content,
+                    t.char_count = size(row.content),
+                    t.created_at = datetime()
+                CREATE (v)-[:EXPRESSED_IN]->(l)
+                CREATE (l)-[:HAS_TEXT]->(t)
+            """, {"rows": text_rows}).consume()
+
+        return created
+
+    def _update_ancestor_aggregations(
         self,
-        component_id: str,
+        tx,
+        component_ids: List[str],
         amendment_date: str,
-        amendment_number: int
-    ):
+        amendment_number: int,
+        stats: Dict
+    ) -> List[str]:
         """
-        Update an ancestor's aggregation by creating a new CTV
-        that aggregates the new child CTVs while REUSING unchanged ones.
+        Update the aggregation of one level of ancestors by creating new CTVs
+        that aggregate the new child CTVs while REUSING unchanged ones.
 
         This is the KEY INNOVATION - unchanged children are reused!
-        """
-        # Get current version
-        query = """
-        MATCH (c:Component {component_id: $comp_id})-[:HAS_VERSION]->(v:CTV)
-        WHERE v.is_active = true
-        RETURN v.ctv_id AS current_ctv, v.version_number AS version
-        LIMIT 1
-        """
-
-        with self.conn.session() as session:
-            result = list(session.run(query, {"comp_id": component_id}))
-
-        if not result:
-            logger.warning(f"No active CTV for ancestor {component_id}")
-            return
 
-        current_ctv_id = result[0]["current_ctv"]
-        current_version = result[0]["version"]
-        new_version = current_version + 1
-        new_ctv_id = f"{component_id}_v{new_version}"
-
-        # Close current version
-        with self.conn.session() as session:
-            session.run("""
-                MATCH (v:CTV {ctv_id: $ctv_id})
-                SET v.date_end = date($end_date),
-                    v.is_active = false
-            """, {"ctv_id": current_ctv_id, "end_date": amendment_date})
-        self.stats["closed_ctvs"] += 1
-
-        # Create new ancestor CTV
-        with self.conn.session() as session:
-            session.run("""
-                MATCH (c:Component {component_id: $comp_id})
-                CREATE (v:CTV {
-                    ctv_id: $ctv_id,
-                    component_id: $comp_id,
-                    version_number: $version,
-                    date_start: date($date_start),
-                    date_end: null,
-                    is_active: true,
-                    is_original: false,
-                    created_by_action: 'amendment_propagation',
-                    amendment_number: $amendment_number,
-                    created_at: datetime()
-                })
-                CREATE (c)-[:HAS_VERSION]->(v)
-                WITH v
-                MATCH (prev:CTV {ctv_id: $prev_ctv})
-                CREATE (v)-[:SUPERSEDES]->(prev)
-            """, {
-                "ctv_id": new_ctv_id,
-                "comp_id": component_id,
-                "version": new_version,
-                "date_start": amendment_date,
-                "amendment_number": amendment_number,
-                "prev_ctv": current_ctv_id
+        Returns:
+            IDs of the new ancestor CTVs
+        """
+        # Close current versions and create new ancestor CTVs
+        result = tx.run("""
+            UNWIND $comp_ids AS comp_id
+            MATCH (c:Component {component_id: comp_id})-[current:CURRENT]->(cur:CTV)
+            SET cur.date_end = date($date_start),
+                cur.is_active = false
+            DELETE current
+            CREATE (v:CTV {
+                ctv_id: comp_id + '_v' + toString(cur.version_number + 1),
+                component_id: comp_id,
+                version_number: cur.version_number + 1,
+                date_start: date($date_start),
+                date_end: null,
+                is_active: true,
+                is_original: false,
+                created_by_action: 'amendment_propagation',
+                amendment_number: $amendment_number,
+                created_at: datetime()
             })
-        self.stats["new_ctvs"] += 1
+            CREATE (c)-[:HAS_VERSION]->(v)
+            CREATE (c)-[:CURRENT]->(v)
+            CREATE (v)-[:SUPERSEDES]->(cur)
+            RETURN comp_id AS component_id, v.ctv_id AS ctv_id, cur.ctv_id AS prev_ctv_id
+        """, {
+            "comp_ids": component_ids,
+            "date_start": amendment_date,
+            "amendment_number": amendment_number
+        })
+        rows = [dict(r) for r in result]
+
+        missing = set(component_ids) - {r["component_id"] for r in rows}
+        for comp_id in sorted(missing):
+            logger.warning(f"No active CTV for ancestor {comp_id}")
+        if not rows:
+            return []
 
-        # Copy CLV and TextUnit from previous version (content unchanged for ancestor)
-        with self.conn.session() as session:
-            session.run("""
-                MATCH (prev:CTV {ctv_id: $prev_ctv})-[:EXPRESSED_IN]->(prev_clv:CLV)-[:HAS_TEXT]->(prev_text:TextUnit)
-                MATCH (new:CTV {ctv_id: $new_ctv})
-                CREATE (new_clv:CLV {
-                    clv_id: $new_ctv + '_pt',
-                    ctv_id: $new_ctv,
-                    language: prev_clv.language,
-                    created_at: datetime()
-                })
-                CREATE (new_text:TextUnit {
-                    text_id: $new_ctv + '_pt_text',
-                    clv_id: $new_ctv + '_pt',
-                    full_text: prev_text.full_text,
-                    header: prev_text.header,
-                    content: prev_text.content,
-                    char_count: prev_text.char_count,
-                    created_at: datetime()
-                })
-                CREATE (new)-[:EXPRESSED_IN]->(new_clv)
-                CREATE (new_clv)-[:HAS_TEXT]->(new_text)
-            """, {"prev_ctv": current_ctv_id, "new_ctv": new_ctv_id})
+        stats["closed_ctvs"] += len(rows)
+        stats["new_ctvs"] += len(rows)
+
+        # Content is unchanged for ancestors, so the new version is expressed
+        # by the previous version's CLV (and TextUnit) instead of a copy
+        tx.run("""
+            UNWIND $rows AS row
+            MATCH (prev:CTV {ctv_id: row.prev_ctv_id})-[:EXPRESSED_IN]->(prev_clv:CLV)
+            MATCH (new:CTV {ctv_id: row.ctv_id})
+            CREATE (new)-[:EXPRESSED_IN]->(prev_clv)
+        """, {"rows": rows}).consume()
 
         # KEY: Create aggregation relationships
         # For each child, use the ACTIVE version (which may be new or old)
-        with self.conn.session() as session:
-            result = session.run("""
-                MATCH (new_parent:CTV {ctv_id: $new_ctv})
-                MATCH (parent_comp:Component {component_id: $comp_id})
-                MATCH (parent_comp)-[:HAS_CHILD]->(child_comp:Component)
-                MATCH (child_comp)-[:HAS_VERSION]->(child_ctv:CTV {is_active: true})
-
-                // Get ordering from old relationship or default
-                OPTIONAL MATCH (old_parent:CTV {ctv_id: $old_ctv})-[old_rel:AGGREGATES]->(old_child:CTV)
-                WHERE old_child.component_id = child_comp.component_id
-
-                WITH new_parent, child_ctv, COALESCE(old_rel.ordering, 0) AS ordering
-                CREATE (new_parent)-[:AGGREGATES {ordering: ordering}]->(child_ctv)
-                RETURN count(*) AS created
-            """, {
-                "new_ctv": new_ctv_id,
-                "comp_id": component_id,
-                "old_ctv": current_ctv_id
-            })
-
-            aggregations_created = result.single()["created"]
-            self.stats["new_aggregations"] += aggregations_created
-
-        # Count reused CTVs (children that weren't changed)
-        with self.conn.session() as session:
-            result = list(session.run("""
-                MATCH (v:CTV {ctv_id: $new_ctv})-[:AGGREGATES]->(child:CTV)
-                WHERE child.date_start < date($date_start)
-                RETURN count(child) AS reused
-            """, {"new_ctv": new_ctv_id, "date_start": amendment_date}))
-
-        if result:
-            self.stats["reused_ctvs"] += result[0]["reused"]
-
-    def _link_action_to_ctv(self, action_id: str, ctv_id: str):
-        """Link Action to resulting CTV."""
-        with self.conn.session() as session:
-            session.run("""
-                MATCH (a:Action {action_id: $action_id})
-                MATCH (v:CTV {ctv_id: $ctv_id})
-                MERGE (a)-[:RESULTED_IN]->(v)
-            """, {"action_id": action_id, "ctv_id": ctv_id})
+        # and count the reused CTVs (children that weren't changed)
+        result = tx.run("""
+            UNWIND $rows AS row
+            MATCH (new_parent:CTV {ctv_id: row.ctv_id})
+            MATCH (parent_comp:Component {component_id: row.component_id})
+            MATCH (parent_comp)-[:HAS_CHILD]->(child_comp:Component)
+            MATCH (child_comp)-[:CURRENT]->(child_ctv:CTV)
+
+            // Get ordering from old relationship or default
+            OPTIONAL MATCH (old_parent:CTV {ctv_id: row.prev_ctv_id})
+                           -[old_rel:AGGREGATES]->(old_child:CTV)
+            WHERE old_child.component_id = child_comp.component_id
+
+            WITH new_parent, child_ctv, COALESCE(old_rel.ordering, 0) AS ordering
+            CREATE (new_parent)-[:AGGREGATES {ordering: ordering}]->(child_ctv)
+            RETURN count(*) AS created,
+                   sum(CASE WHEN child_ctv.date_start < date($date_start)
+                            THEN 1 ELSE 0 END) AS reused
+        """, {"rows": rows, "date_start": amendment_date}).single()
+
+        stats["new_aggregations"] += result["created"]
+        stats["reused_ctvs"] += result["reused"] or 0
+
+        return [r["ctv_id"] for r in rows]
+
+    def _link_action_to_ctvs(self, tx, action_id: str, ctv_ids: List[str]):
+        """Link Action to resulting CTVs."""
+        tx.run("""
+            MATCH (a:Action {action_id: $action_id})
+            UNWIND $ctv_ids AS ctv_id
+            MATCH (v:CTV {ctv_id: ctv_id})
+            MERGE (a)-[:RESULTED_IN]->(v)
+        """, {"action_id": action_id, "ctv_ids": ctv_ids}).consume()
 
 
 def apply_amendment(
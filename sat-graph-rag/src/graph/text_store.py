@@ -0,0 +1,181 @@
+"""Content-addressed TextUnit store maintenance.
+
+TextUnits are keyed by `content_hash`: every CLV whose text is unchanged
+points at the same TextUnit node. Graphs built before this was enforced
+contain one TextUnit per CLV (and engine-created units without a hash at
+all). `collapse_duplicate_text_units` migrates such a graph in place, and
+`share_propagated_clvs` drops the per-version CLVs of propagated ancestor
+versions, which now share their predecessor's CLV.
+"""
+
+from typing import List, Optional
+import logging
+
+from .connection import get_connection, Neo4jConnection
+from .loader import compute_content_hash
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def backfill_content_hashes(
+    conn: Optional[Neo4jConnection] = None,
+    batch_size: int = 1000,
+) -> int:
+    """Compute content_hash for TextUnits that do not have one.
+
+    Args:
+        conn: Neo4j connection (uses global if not provided)
+        batch_size: TextUnits hashed per transaction
+
+    Returns:
+        Number of TextUnits updated
+    """
+    conn = conn or get_connection()
+    updated = 0
+
+    with conn.session() as session:
+        while True:
+            # By element ID: text_id may be missing or shared on old graphs
+            rows = session.run("""
+                MATCH (t:TextUnit)
+                WHERE t.content_hash IS NULL
+                RETURN elementId(t) AS element_id, t.full_text AS full_text
+                LIMIT $limit
+            """, {"limit": batch_size}).data()
+            if not rows:
+                break
+
+            count = session.execute_write(_set_hashes, [
+                {
+                    "element_id": r["element_id"],
+                    "content_hash": compute_content_hash(r["full_text"] or ""),
+                }
+                for r in rows
+            ])
+            if not count:
+                logger.warning(f"{len(rows)} TextUnits without content_hash could not be updated")
+                break
+            updated += count
+
+    logger.info(f"Backfilled content_hash on {updated} TextUnits")
+    return updated
+
+
+def _set_hashes(tx, rows: List[dict]) -> int:
+    result = tx.run("""
+        UNWIND $rows AS row
+        MATCH (t:TextUnit)
+        WHERE elementId(t) = row.element_id
+        SET t.content_hash = row.content_hash
+        RETURN count(t) AS updated
+    """, {"rows": rows})
+    return result.single()["updated"]
+
+
+def collapse_duplicate_text_units(
+    conn: Optional[Neo4jConnection] = None,
+    batch_size: int = 500,
+) -> dict:
+    """Merge TextUnits that share a content_hash into a single node.
+
+    For each hash the oldest TextUnit is kept; HAS_TEXT links of the
+    duplicates are moved onto it and the duplicates are deleted.
+
+    Args:
+        conn: Neo4j connection (uses global if not provided)
+        batch_size: Distinct hashes collapsed per transaction
+
+    Returns:
+        Migration statistics
+    """
+    conn = conn or get_connection()
+    stats = {
+        "hashes_backfilled": backfill_content_hashes(conn),
+        "duplicate_hashes": 0,
+        "text_units_removed": 0,
+    }
+
+    with conn.session() as session:
+        while True:
+            hashes = [r["hash"] for r in session.run("""
+                MATCH (t:TextUnit)
+                WITH t.content_hash AS hash, count(t) AS copies
+                WHERE copies > 1
+                RETURN hash
+                LIMIT $limit
+            """, {"limit": batch_size})]
+            if not hashes:
+                break
+
+            removed = session.execute_write(_collapse_hashes, hashes)
+            stats["duplicate_hashes"] += len(hashes)
+            stats["text_units_removed"] += removed
+            logger.info(f"Collapsed {len(hashes)} hashes ({removed} duplicate TextUnits)")
+
+    logger.info(f"TextUnit deduplication complete. Stats: {stats}")
+    return stats
+
+
+def _collapse_hashes(tx, hashes: List[str]) -> int:
+    result = tx.run("""
+        UNWIND $hashes AS hash
+        MATCH (t:TextUnit {content_hash: hash})
+        WITH hash, t ORDER BY t.created_at, t.text_id
+        WITH hash, collect(t) AS units
+        WITH head(units) AS keep, tail(units) AS duplicates
+        UNWIND duplicates AS dup
+        CALL {
+            WITH keep, dup
+            MATCH (l:CLV)-[r:HAS_TEXT]->(dup)
+            MERGE (l)-[:HAS_TEXT]->(keep)
+            DELETE r
+        }
+        DETACH DELETE dup
+        RETURN count(*) AS removed
+    """, {"hashes": hashes})
+    return result.single()["removed"]
+
+
+def share_propagated_clvs(conn: Optional[Neo4jConnection] = None) -> int:
+    """Point propagated ancestor versions at their predecessor's CLV.
+
+    Older graphs gave every propagated CTV its own CLV (and TextUnit copy).
+    Versions are processed in ascending version_number so that each
+    predecessor already expresses its final, shared CLV.
+
+    Args:
+        conn: Neo4j connection (uses global if not provided)
+
+    Returns:
+        Number of CLVs removed
+    """
+    conn = conn or get_connection()
+    removed = 0
+
+    with conn.session() as session:
+        version_numbers = [r["version_number"] for r in session.run("""
+            MATCH (v:CTV {created_by_action: 'amendment_propagation'})-[:EXPRESSED_IN]->(l:CLV)
+            WHERE l.ctv_id = v.ctv_id
+            RETURN DISTINCT v.version_number AS version_number
+            ORDER BY version_number
+        """)]
+        for version_number in version_numbers:
+            removed += session.execute_write(_share_clvs, version_number)
+
+    logger.info(f"Propagated versions now share CLVs ({removed} CLVs removed)")
+    return removed
+
+
+def _share_clvs(tx, version_number: int) -> int:
+    result = tx.run("""
+        MATCH (v:CTV {created_by_action: 'amendment_propagation', version_number: $n})
+              -[e:EXPRESSED_IN]->(own:CLV)
+        WHERE own.ctv_id = v.ctv_id
+        MATCH (v)-[:SUPERSEDES]->(:CTV)-[:EXPRESSED_IN]->(shared:CLV)
+        DELETE e
+        CREATE (v)-[:EXPRESSED_IN]->(shared)
+        DETACH DELETE own
+        RETURN count(*) AS removed
+    """, {"n": version_number})
+    return result.single()["removed"]
@@ -0,0 +1,129 @@
+"""In-memory index of CTV validity intervals.
+
+For every Component the index keeps its versions sorted by `date_start`
+(ties by version number), so the version valid at a date is found with a
+binary search instead of filtering every CTV on
+`date_start <= d AND (date_end IS NULL OR date_end > d)`.
+
+Several versions can start on the same day (amendments of the same date);
+only the last of them is open after that day, which is exactly the one
+`bisect_right` lands on. Dates are ISO strings, which sort like dates.
+
+Like ComponentHierarchy, the index is loaded once and not refreshed
+automatically: call `invalidate()` (or `set_versions` for the components an
+amendment touched) after writing new versions.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+from .connection import get_connection, Neo4jConnection
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# (date_start, date_end, ctv_id, version_number)
+Version = Tuple[str, Optional[str], str, int]
+
+
+class ValidityIndex:
+    """Sorted version start dates per component, loaded lazily from the graph."""
+
+    VERSIONS_QUERY = """
+    MATCH (c:Component)
+    OPTIONAL MATCH (c)-[:HAS_VERSION]->(v:CTV)
+    RETURN c.component_id AS component_id,
+           c.parent_id IS NULL AS is_root,
+           collect([toString(v.date_start), toString(v.date_end),
+                    v.ctv_id, v.version_number]) AS versions
+    """
+
+    def __init__(self, conn: Optional[Neo4jConnection] = None):
+        self.conn = conn
+        self._starts: Optional[Dict[str, List[str]]] = None
+        self._versions: Dict[str, List[Version]] = {}
+        self._roots: List[str] = []
+
+    @classmethod
+    def from_versions(
+        cls,
+        versions: Dict[str, Iterable[Sequence]],
+        roots: Iterable[str] = (),
+    ) -> "ValidityIndex":
+        """Build an index from component_id -> [(start, end, ctv_id, version_number)]."""
+        index = cls()
+        index._index(versions, roots)
+        return index
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._starts is not None
+
+    def load(self) -> "ValidityIndex":
+        """Read every component's versions from the graph (replacing the cache)."""
+        conn = self.conn or get_connection()
+        with conn.session() as session:
+            records = session.run(self.VERSIONS_QUERY).data()
+        self._index(
+            {r["component_id"]: [v for v in r["versions"] if v[2] is not None] for r in records},
+            [r["component_id"] for r in records if r["is_root"]],
+        )
+        logger.info(f"Loaded validity index of {len(self._starts)} components")
+        return self
+
+    def ensure_loaded(self) -> "ValidityIndex":
+        if not self.is_loaded:
+            self.load()
+        return self
+
+    def invalidate(self):
+        """Drop the cached index; it is reloaded on next use."""
+        self._starts = None
+        self._versions = {}
+        self._roots = []
+
+    def _index(self, versions: Dict[str, Iterable[Sequence]], roots: Iterable[str]):
+        self._starts = {}
+        self._versions = {}
+        for comp_id, comp_versions in versions.items():
+            self.set_versions(comp_id, comp_versions)
+        self._roots = sorted(roots)
+
+    def set_versions(self, component_id: str, versions: Iterable[Sequence]):
+        """Replace the versions of one component (e.g. after an amendment)."""
+        if self._starts is None:
+            return  # not loaded: the next load reads them anyway
+        ordered = sorted((tuple(v) for v in versions), key=lambda v: (v[0], v[3]))
+        self._versions[component_id] = ordered
+        self._starts[component_id] = [v[0] for v in ordered]
+
+    def version_at(self, component_id: str, date_str: str) -> Optional[str]:
+        """ID of the CTV of a component valid at a date, if any."""
+        self.ensure_loaded()
+        starts = self._starts.get(component_id)
+        if not starts:
+            return None
+        i = bisect_right(starts, date_str) - 1
+        if i < 0:
+            return None
+        _, date_end, ctv_id, _ = self._versions[component_id][i]
+        if date_end is not None and date_end <= date_str:
+            return None  # repealed/removed before the date
+        return ctv_id
+
+    def match(self, component_id: str) -> List[str]:
+        """Components whose ID equals or ends with `component_id` (exact first)."""
+        self.ensure_loaded()
+        if component_id in self._starts:
+            return [component_id]
+        return sorted(c for c in self._starts if c.endswith(component_id))
+
+    def roots(self) -> List[str]:
+        """Top-level components, by ID."""
+        self.ensure_loaded()
+        return list(self._roots)
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return len(self._starts)
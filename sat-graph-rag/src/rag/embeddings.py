@@ -0,0 +1,342 @@
+"""Dense embeddings of TextUnits and vectorized cosine search.
+
+TextUnits are content-addressed, so each distinct text is embedded once,
+whatever the number of versions sharing it. Vectors are L2-normalized
+rows of a NumPy matrix indexed by `content_hash`; a query is one
+embedding plus one matrix-vector product, so its latency depends only on
+the number of TextUnits.
+
+Embedders are pluggable (anything with `dimensions` and `embed(texts)`):
+
+- HashingEmbedder: deterministic feature hashing of the lexical tokens,
+  with no model or network (tests, air-gapped deployments)
+- OpenAIEmbedder: the OpenAI embeddings API (EMBEDDING_MODEL)
+
+The store can be saved as .npz and pushed to the `text_embedding` vector
+index created by SchemaManager.create_vector_index.
+
+EpochMasks restricts a search to one state of the constitution: for each
+epoch it keeps the sorted indices of the CTVs valid during it, and the
+query vector is multiplied with only their rows (pre-filtering), so a
+search in the past keeps its full top-k and its cost scales with the
+number of versions valid in that epoch, not with the whole store.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import hashlib
+import logging
+import os
+
+import numpy as np
+
+from ..graph.connection import get_connection, Neo4jConnection
+from ..graph.memory import InMemoryGraph
+from .lexical import tokenize
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Matches the dimensions of SchemaManager.create_vector_index
+DEFAULT_DIMENSIONS = 1536
+
+# date_end of open versions, for interval comparisons on ISO strings
+OPEN_END = "9999-12-31"
+
+
+@lru_cache(maxsize=100_000)
+def _bucket(token: str, dimensions: int) -> Tuple[int, float]:
+    digest = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+    return digest % dimensions, 1.0 if digest >> 63 else -1.0
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first."""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, k)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedding by signed feature hashing."""
+
+    name = "hashing"
+
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS):
+        self.dimensions = dimensions
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for token in tokenize(text):
+                bucket, sign = _bucket(token, self.dimensions)
+                matrix[i, bucket] += sign
+        return normalize_rows(matrix)
+
+
+class OpenAIEmbedder:
+    """Embeddings from the OpenAI API."""
+
+    name = "openai"
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        dimensions: int = DEFAULT_DIMENSIONS,
+        client=None
+    ):
+        if client is None:
+            from openai import OpenAI  # only needed for this embedder
+
+            client = OpenAI()
+        self.client = client
+        self.model = model or os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+        self.dimensions = dimensions
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        kwargs = {}
+        if self.model.startswith("text-embedding-3"):
+            kwargs["dimensions"] = self.dimensions  # older models have a fixed size
+        # The API rejects empty strings
+        response = self.client.embeddings.create(
+            model=self.model, input=[text or " " for text in texts], **kwargs
+        )
+        return np.array([item.embedding for item in response.data], dtype=np.float32)
+
+
+def get_embedder(name: str = "hashing", dimensions: int = DEFAULT_DIMENSIONS):
+    """Embedder by name ("hashing" or "openai")."""
+    if name == "hashing":
+        return HashingEmbedder(dimensions)
+    if name == "openai":
+        return OpenAIEmbedder(dimensions=dimensions)
+    raise ValueError(f"Unknown embedder: {name}")
+
+
+class EmbeddingStore:
+    """Normalized TextUnit embeddings in a NumPy matrix, by content hash."""
+
+    TEXT_UNITS_QUERY = """
+    MATCH (t:TextUnit)
+    RETURN t.content_hash AS content_hash, t.full_text AS text
+    """
+
+    PUSH_QUERY = """
+    UNWIND $rows AS row
+    MATCH (t:TextUnit {content_hash: row.content_hash})
+    SET t.embedding = row.embedding
+    """
+
+    def __init__(self, embedder, batch_size: int = 64):
+        self.embedder = embedder
+        self.batch_size = batch_size
+        self._hashes: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self.matrix = np.zeros((0, embedder.dimensions), dtype=np.float32)
+
+    @property
+    def dimensions(self) -> int:
+        return self.embedder.dimensions
+
+    def row(self, content_hash: str) -> Optional[int]:
+        """Matrix row of a TextUnit, if embedded."""
+        return self._rows.get(content_hash)
+
+    def add(self, items: Iterable[Tuple[str, str]]) -> int:
+        """Embed (content_hash, text) pairs not in the store yet, in batches.
+
+        Returns:
+            Number of texts embedded
+        """
+        missing: Dict[str, str] = {}
+        for content_hash, text in items:
+            if content_hash not in self._rows:
+                missing.setdefault(content_hash, text)
+        if not missing:
+            return 0
+
+        hashes = list(missing)
+        blocks = []
+        for start in range(0, len(hashes), self.batch_size):
+            batch = hashes[start:start + self.batch_size]
+            blocks.append(self.embedder.embed([missing[h] for h in batch]))
+        self.matrix = np.vstack([self.matrix, normalize_rows(np.vstack(blocks))])
+        for content_hash in hashes:
+            self._rows[content_hash] = len(self._hashes)
+            self._hashes.append(content_hash)
+        logger.info(f"Embedded {len(hashes)} texts ({len(self._hashes)} in store)")
+        return len(hashes)
+
+    def sync(self, conn: Optional[Union[Neo4jConnection, InMemoryGraph]] = None) -> int:
+        """Embed every TextUnit of the graph that is not in the store yet."""
+        if isinstance(conn, InMemoryGraph):
+            records = [
+                {"content_hash": h, "text": t["full_text"]} for h, t in conn.text_units.items()
+            ]
+        else:
+            conn = conn or get_connection()
+            with conn.session() as session:
+                records = session.run(self.TEXT_UNITS_QUERY).data()
+        return self.add((r["content_hash"], r["text"]) for r in records)
+
+    def query_vector(self, query: str) -> np.ndarray:
+        """Normalized embedding of a query."""
+        return normalize_rows(self.embedder.embed([query]))[0]
+
+    def scores(self, query: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine similarity of a query with the stored TextUnits (all, or the given rows)."""
+        vector = self.query_vector(query)
+        if rows is None:
+            return self.matrix @ vector
+        return self.matrix[rows] @ vector
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """(content_hash, cosine) of the TextUnits closest to a query."""
+        if not self._hashes:
+            return []
+        scores = self.scores(query)
+        return [(self._hashes[i], float(scores[i])) for i in top_k_indices(scores, top_k)]
+
+    def save(self, path: str = "data/embeddings/text_units.npz") -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            matrix=self.matrix,
+            hashes=np.array(self._hashes, dtype=str),
+            embedder=np.array(self.embedder.name),
+        )
+        logger.info(f"Saved {len(self._hashes)} embeddings to {path}")
+        return path
+
+    def load(self, path: str = "data/embeddings/text_units.npz") -> "EmbeddingStore":
+        """Replace the store's content with a saved one (same embedder and size)."""
+        with np.load(path) as data:
+            if str(data["embedder"]) != self.embedder.name:
+                raise ValueError(f"{path} was embedded with {data['embedder']}")
+            if data["matrix"].shape[1] != self.dimensions:
+                raise ValueError(f"{path} has {data['matrix'].shape[1]} dimensions")
+            self.matrix = data["matrix"].astype(np.float32)
+            self._hashes = [str(h) for h in data["hashes"]]
+        self._rows = {h: i for i, h in enumerate(self._hashes)}
+        return self
+
+    def push_to_neo4j(
+        self,
+        conn: Optional[Neo4jConnection] = None,
+        batch_size: int = 500
+    ) -> int:
+        """Write the vectors to TextUnit.embedding (the `text_embedding` index).
+
+        Returns:
+            Number of TextUnits written
+        """
+        conn = conn or get_connection()
+        with conn.session() as session:
+            for start in range(0, len(self._hashes), batch_size):
+                rows = [
+                    {"content_hash": h, "embedding": self.matrix[start + i].tolist()}
+                    for i, h in enumerate(self._hashes[start:start + batch_size])
+                ]
+                session.run(self.PUSH_QUERY, {"rows": rows}).consume()
+        logger.info(f"Pushed {len(self._hashes)} embeddings to Neo4j")
+        return len(self._hashes)
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+
+class EpochMasks:
+    """Per-epoch sorted arrays of valid CTVs over an EmbeddingStore."""
+
+    # Every CTV with text, with its validity interval
+    VERSIONS_QUERY = """
+    MATCH (v:CTV)-[:EXPRESSED_IN]->(:CLV)-[:HAS_TEXT]->(t:TextUnit)
+    RETURN v.ctv_id AS ctv_id,
+           toString(v.date_start) AS start,
+           toString(v.date_end) AS end,
+           t.content_hash AS content_hash
+    """
+
+    def __init__(
+        self,
+        store: EmbeddingStore,
+        conn: Optional[Union[Neo4jConnection, InMemoryGraph]] = None
+    ):
+        self.store = store
+        self.conn = conn
+        self._ctv_ids: Optional[List[str]] = None
+        self._rows = np.zeros(0, dtype=np.int64)
+        self._starts = np.zeros(0, dtype=str)
+        self._ends = np.zeros(0, dtype=str)
+        # epoch -> (indices of the CTVs valid during it, their embedding rows)
+        self._masks: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._ctv_ids is not None
+
+    def load(self) -> "EpochMasks":
+        """Read every CTV's interval and TextUnit (embedding missing texts)."""
+        if isinstance(self.conn, InMemoryGraph):
+            records = self.conn.version_texts()
+        else:
+            conn = self.conn or get_connection()
+            with conn.session() as session:
+                records = session.run(self.VERSIONS_QUERY).data()
+        if any(self.store.row(r["content_hash"]) is None for r in records):
+            self.store.sync(self.conn)
+
+        self._ctv_ids = [r["ctv_id"] for r in records]
+        self._rows = np.array([self.store.row(r["content_hash"]) for r in records], dtype=np.int64)
+        self._starts = np.array([r["start"] for r in records], dtype=str)
+        self._ends = np.array([r["end"] or OPEN_END for r in records], dtype=str)
+        self._masks = {}
+        logger.info(f"Loaded {len(self._ctv_ids)} CTVs for temporal vector search")
+        return self
+
+    def ensure_loaded(self) -> "EpochMasks":
+        if not self.is_loaded:
+            self.load()
+        return self
+
+    def invalidate(self):
+        """Drop the versions and masks; they are reloaded on next use."""
+        self._ctv_ids = None
+        self._masks = {}
+
+    def mask(self, epoch: int, date_str: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(CTV indices, embedding rows) of the CTVs valid at an epoch's start.
+
+        Versions are valid on [date_start, date_end), so of several versions
+        started on the same day only the last (still open) one is kept.
+        """
+        self.ensure_loaded()
+        if epoch not in self._masks:
+            valid = np.flatnonzero((self._starts <= date_str) & (self._ends > date_str))
+            self._masks[epoch] = valid, self._rows[valid]
+        return self._masks[epoch]
+
+    def search(
+        self,
+        query: str,
+        epoch: int,
+        date_str: str,
+        top_k: int = 10
+    ) -> List[Tuple[str, float]]:
+        """(ctv_id, cosine) of the best CTVs among those valid in an epoch."""
+        valid, rows = self.mask(epoch, date_str)
+        if not len(valid):
+            return []
+        scores = self.store.scores(query, rows)
+        return [
+            (self._ctv_ids[valid[i]], float(scores[i])) for i in top_k_indices(scores, top_k)
+        ]
@@ -0,0 +1,247 @@
+"""BM25 inverted index over the current text of every component.
+
+Replaces the regex full scan of keyword search: each component's active
+TextUnit is tokenized once (accents folded, Portuguese stopwords removed)
+into an inverted index, and a query only reads the postings of its own
+terms, scored with Okapi BM25. Terms match in any order.
+
+The index is loaded once and then re-indexed per component: after
+`invalidate()` (HybridRetriever calls it when the engine reports a
+change) the next search reads the (CTV, TextUnit hash) pair of every
+component's current version, one query without any text, and re-reads
+and re-tokenizes only the components whose pair changed. A new version
+and a resync's in-place text correction are both detected. Loading,
+refreshing and searching hold a lock, so HybridRetriever's source threads
+never read a half-updated index.
+
+Only current text is indexed: text a component had before its latest
+amendment cannot be found here (HybridRetriever leaves past text to its
+vector source).
+"""
+
+from collections import Counter
+from heapq import nlargest
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import logging
+import math
+import re
+import threading
+import unicodedata
+
+from ..graph.connection import get_connection, Neo4jConnection
+from ..graph.memory import InMemoryGraph
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Ordinal indicators ("Art. 5º", "1ª") are dropped so "5º" matches "5"
+ORDINALS = str.maketrans("", "", "º°ª")
+
+# Common Portuguese function words (accents folded)
+STOPWORDS = frozenset("""
+    a ao aos aquela aquelas aquele aqueles as ate com como da das de dela delas dele
+    deles depois do dos e ela elas ele eles em entre era essa essas esse esses esta
+    estas este estes eu foi foram ha isso isto ja la lhe lhes mais mas me mesmo meu
+    na nas nao nem no nos num numa o os ou para pela pelas pelo pelos por qual quais
+    quando que quem se sem ser seu seus sua suas so sob sobre tambem te tem ter um
+    uma umas uns
+""".split())
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip accents ("Órgãos" -> "orgaos")."""
+    decomposed = unicodedata.normalize("NFKD", text.translate(ORDINALS))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """Folded terms of a text, without stopwords."""
+    return [t for t in TOKEN_PATTERN.findall(fold(text or "")) if t not in STOPWORDS]
+
+
+class LexicalIndex:
+    """Inverted index with BM25 scoring, one document per component."""
+
+    # Active version and text of components (all of them if $comp_ids is null)
+    DOCUMENTS_QUERY = """
+    MATCH (c:Component)-[:CURRENT]->(v:CTV)
+          -[:EXPRESSED_IN]->(:CLV)-[:HAS_TEXT]->(t:TextUnit)
+    WHERE $comp_ids IS NULL OR c.component_id IN $comp_ids
+    RETURN c.component_id AS component_id,
+           c.component_type AS component_type,
+           v.ctv_id AS ctv_id,
+           v.version_number AS version_number,
+           t.content_hash AS content_hash,
+           t.full_text AS text
+    """
+
+    CURRENT_QUERY = """
+    MATCH (c:Component)-[:CURRENT]->(v:CTV)-[:EXPRESSED_IN]->(:CLV)-[:HAS_TEXT]->(t:TextUnit)
+    RETURN c.component_id AS component_id,
+           v.ctv_id AS ctv_id,
+           t.content_hash AS content_hash
+    """
+
+    def __init__(
+        self,
+        conn: Optional[Union[Neo4jConnection, InMemoryGraph]] = None,
+        k1: float = 1.2,
+        b: float = 0.75
+    ):
+        self.conn = conn
+        self.k1 = k1
+        self.b = b
+        self._documents: Optional[Dict[str, dict]] = None
+        # term -> {component_id: term frequency}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+        self._stale = False
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[dict], **kwargs) -> "LexicalIndex":
+        """Build an index from DOCUMENTS_QUERY-shaped records."""
+        index = cls(**kwargs)
+        index._index(documents)
+        return index
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._documents is not None
+
+    def load(self) -> "LexicalIndex":
+        """Index the current text of every component (replacing the index)."""
+        with self._lock:
+            self._index(self._read_documents())
+            self._stale = False
+        logger.info(
+            f"Indexed {len(self._documents)} components, {len(self._postings)} terms"
+        )
+        return self
+
+    def ensure_loaded(self) -> "LexicalIndex":
+        with self._lock:
+            if not self.is_loaded:
+                self.load()
+            elif self._stale:
+                self.refresh()
+        return self
+
+    def invalidate(self):
+        """Mark the index stale; the next search re-indexes changed components."""
+        self._stale = True
+
+    def _index(self, documents: Iterable[dict]):
+        self._documents = {}
+        self._postings = {}
+        self._lengths = {}
+        self._total_length = 0
+        for doc in documents:
+            self.add(doc)
+
+    def _read_documents(self, component_ids: Optional[List[str]] = None) -> List[dict]:
+        if isinstance(self.conn, InMemoryGraph):
+            return self.conn.current_documents(component_ids)
+        conn = self.conn or get_connection()
+        with conn.session() as session:
+            return session.run(self.DOCUMENTS_QUERY, {"comp_ids": component_ids}).data()
+
+    def _read_current(self) -> Dict[str, Tuple[str, str]]:
+        """component_id -> (ctv_id, content_hash) of every current version with text."""
+        if isinstance(self.conn, InMemoryGraph):
+            records = self.conn.current_documents()
+        else:
+            conn = self.conn or get_connection()
+            with conn.session() as session:
+                records = session.run(self.CURRENT_QUERY).data()
+        return {r["component_id"]: (r["ctv_id"], r["content_hash"]) for r in records}
+
+    def refresh(self) -> int:
+        """Re-index the components whose active version or its text changed.
+
+        Every component's (ctv_id, content_hash) is compared with the indexed
+        document; only the differing ones are re-read and re-tokenized.
+
+        Returns:
+            Number of components re-indexed or removed
+        """
+        with self._lock:
+            current = self._read_current()
+            changed = []
+            for comp_id, key in current.items():
+                doc = self._documents.get(comp_id)
+                if doc is None or (doc["ctv_id"], doc.get("content_hash")) != key:
+                    changed.append(comp_id)
+            removed = [comp_id for comp_id in self._documents if comp_id not in current]
+            for comp_id in changed + removed:
+                self.remove(comp_id)
+            if changed:
+                for doc in self._read_documents(changed):
+                    self.add(doc)
+            self._stale = False
+        logger.debug(f"Lexical index refreshed: {len(changed)} changed, {len(removed)} removed")
+        return len(changed) + len(removed)
+
+    def add(self, doc: dict):
+        """Index (or re-index) one component's document."""
+        comp_id = doc["component_id"]
+        if comp_id in self._documents:
+            self.remove(comp_id)
+        terms = Counter(tokenize(doc["text"]))
+        self._documents[comp_id] = doc
+        length = sum(terms.values())
+        self._lengths[comp_id] = length
+        self._total_length += length
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[comp_id] = tf
+
+    def remove(self, component_id: str):
+        """Drop a component's document, if indexed."""
+        doc = self._documents.pop(component_id, None)
+        if doc is None:
+            return
+        self._total_length -= self._lengths.pop(component_id)
+        for term in set(tokenize(doc["text"])):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(component_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def documents(self) -> List[dict]:
+        """Every indexed document (the current text of each component)."""
+        with self._lock:
+            self.ensure_loaded()
+            return list(self._documents.values())
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[dict, float]]:
+        """(document, BM25 score) of the best matches, best first."""
+        with self._lock:
+            self.ensure_loaded()
+            n_docs = len(self._documents)
+            if not n_docs:
+                return []
+            avg_length = self._total_length / n_docs
+
+            scores: Dict[str, float] = {}
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for comp_id, tf in postings.items():
+                    length = self._lengths[comp_id]
+                    norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+                    scores[comp_id] = (
+                        scores.get(comp_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+                    )
+
+            best = nlargest(top_k, scores.items(), key=lambda item: item[1])
+            return [(self._documents[comp_id], score) for comp_id, score in best]
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return len(self._documents)
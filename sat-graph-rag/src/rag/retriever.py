@@ -4,15 +4,29 @@ This module implements the retrieval strategies from the paper:
 - Point-in-time: Graph traversal with date filtering (time-travel)
 - Provenance: Graph traversal on amendment chains
 - Semantic: Vector similarity search (when embeddings available)
+- Hybrid: Date-filtered graph, keyword and vector search run concurrently
+  and merged with weighted reciprocal rank fusion
 """
 
-from typing import List, Dict, Optional
+from typing import Callable, Hashable, List, Dict, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from copy import deepcopy
+from functools import partial
 from datetime import date
 import logging
-import re
+import time
+
+import numpy as np
 
 from ..graph.connection import get_connection, Neo4jConnection
+from ..graph.memory import InMemoryGraph
+from ..graph.epochs import EpochIndex
+from ..graph.temporal_engine import TemporalEngine
+from ..graph.validity import ValidityIndex
+from .cache import ResultCache
+from .embeddings import EmbeddingStore, EpochMasks, top_k_indices
+from .lexical import LexicalIndex
 from .planner import QueryPlan, QueryType
 
 logging.basicConfig(level=logging.INFO)
@@ -41,8 +55,136 @@ class HybridRetriever:
     - Hybrid: Combine date filtering with semantic search
     """
 
-    def __init__(self, conn: Optional[Neo4jConnection] = None):
+    # Versions (found with the ValidityIndex) with their text, in the given order
+    POINT_IN_TIME_QUERY = """
+    UNWIND range(0, size($ctv_ids) - 1) AS i
+    MATCH (v:CTV {ctv_id: $ctv_ids[i]})-[:EXPRESSED_IN]->(:CLV)-[:HAS_TEXT]->(t:TextUnit)
+    MATCH (c:Component {component_id: v.component_id})
+    RETURN c.component_id AS component_id,
+           c.component_type AS component_type,
+           v.ctv_id AS ctv_id,
+           t.full_text AS text,
+           CASE WHEN $with_status THEN {
+               version: v.version_number,
+               start: toString(v.date_start),
+               end: toString(v.date_end),
+               is_active: v.is_active,
+               is_original: v.is_original
+           } ELSE {
+               version: v.version_number,
+               start: toString(v.date_start),
+               end: toString(v.date_end)
+           } END AS version_info
+    ORDER BY i
+    LIMIT $limit
+    """
+
+    # Strategies whose answer is fixed by the cache key (not by free text)
+    CACHED_STRATEGIES = (QueryType.POINT_IN_TIME, QueryType.PROVENANCE)
+
+    # Hybrid sources and their weight in the rank fusion (0 disables one)
+    DEFAULT_FUSION_WEIGHTS = {"graph": 1.0, "lexical": 1.0, "vector": 1.0}
+    # Reciprocal rank fusion constant: score = weight / (RRF_K + rank)
+    RRF_K = 60
+
+    def __init__(
+        self,
+        conn: Optional[Union[Neo4jConnection, InMemoryGraph]] = None,
+        cache_size: int = 1024,
+        embeddings: Optional[EmbeddingStore] = None,
+        fusion_weights: Optional[Dict[str, float]] = None,
+        engine: Optional[TemporalEngine] = None
+    ):
         self.conn = conn or get_connection()
+        # Loaded on the first point-in-time query; invalidate() after amendments
+        self.validity = ValidityIndex(self.conn)
+        self._epochs = EpochIndex(self.conn)
+        # (epoch, component_id) -> CTVs valid during the epoch
+        self._valid_at: Dict[Tuple[int, Optional[str]], List[str]] = {}
+        # Results by (strategy, component, epoch, amendment, top_k); 0 disables it
+        self.cache = ResultCache(cache_size)
+        # Keyword search; changed components re-indexed after invalidate()
+        self.lexical = LexicalIndex(self.conn)
+        # Vector search (semantic queries fall back to keywords without it)
+        self.embeddings = embeddings
+        # CTVs valid per epoch, for date-filtered vector search
+        self.epoch_masks = EpochMasks(embeddings, self.conn) if embeddings is not None else None
+        # Current documents and the embedding rows of their text
+        self._semantic_docs: Optional[Tuple[List[dict], np.ndarray]] = None
+        self.fusion_weights = {**self.DEFAULT_FUSION_WEIGHTS, **(fusion_weights or {})}
+        # Hybrid sources run concurrently; threads are started on first use
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.DEFAULT_FUSION_WEIGHTS), thread_name_prefix="hybrid"
+        )
+        # Milliseconds per source (and fusion, total) of the last hybrid query
+        self.last_timings: Dict[str, float] = {}
+        # Caches and indexes are cleared whenever this engine changes the graph
+        if engine is not None:
+            engine.add_listener(self.on_amendment)
+
+    @property
+    def epochs(self) -> EpochIndex:
+        """Epoch index (an InMemoryGraph keeps its own up to date)."""
+        if isinstance(self.conn, InMemoryGraph):
+            return self.conn.epochs
+        return self._epochs
+
+    def invalidate(self):
+        """Forget cached versions, epochs and results (call after applying amendments).
+
+        The keyword index is not dropped: its next search re-reads only the
+        components whose current version or text changed.
+        """
+        self.validity.invalidate()
+        self._epochs.invalidate()
+        self._valid_at.clear()
+        self.cache.clear()
+        self.lexical.invalidate()
+        self._semantic_docs = None
+        if self.epoch_masks is not None:
+            self.epoch_masks.invalidate()
+
+    def close(self):
+        """Stop the hybrid source threads (the connection is left open)."""
+        self._executor.shutdown(wait=True)
+
+    def on_amendment(self, amendment_number: Optional[int]):
+        """TemporalEngine listener (registered by passing `engine=` to the constructor).
+
+        `amendment_number` is None for changes made outside amendments (resync).
+        """
+        logger.debug(f"EC {amendment_number} changed the graph, clearing caches")
+        self.invalidate()
+
+    def _cache_key(self, plan: QueryPlan, top_k: int) -> Optional[Hashable]:
+        """Key of a plan's results, or None if they are not cached.
+
+        Point-in-time dates are replaced by their epoch, so every date of an
+        epoch shares one entry (dates before enactment are kept as is).
+        """
+        if plan.query_type not in self.CACHED_STRATEGIES:
+            return None
+        epoch = None
+        if plan.query_type == QueryType.POINT_IN_TIME:
+            date_str = plan.target_date.isoformat()
+            epoch = self.epochs.epoch_of(date_str)
+            if epoch is None:
+                epoch = date_str
+        return (
+            plan.query_type.value, plan.target_component, epoch, plan.amendment_number, top_k
+        )
+
+    def _records(
+        self,
+        query: str,
+        params: Dict,
+        in_memory: Callable[[InMemoryGraph], List[Dict]]
+    ) -> List[Dict]:
+        """Run a query, or its in-memory equivalent on an InMemoryGraph."""
+        if isinstance(self.conn, InMemoryGraph):
+            return in_memory(self.conn)
+        with self.conn.session() as session:
+            return list(session.run(query, params))
 
     def retrieve(
         self,
@@ -59,14 +201,26 @@ class HybridRetriever:
         Returns:
             List of RetrievalResult objects
         """
+        # Repeated plans are answered from the cache until the next amendment
+        key = self._cache_key(plan, top_k)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return deepcopy(cached)
+
         if plan.query_type == QueryType.POINT_IN_TIME:
-            return self._retrieve_point_in_time(plan, top_k)
+            results = self._retrieve_point_in_time(plan, top_k)
         elif plan.query_type == QueryType.PROVENANCE:
-            return self._retrieve_provenance(plan, top_k)
+            results = self._retrieve_provenance(plan, top_k)
         elif plan.query_type == QueryType.SEMANTIC:
-            return self._retrieve_semantic(plan, top_k)
+            results = self._retrieve_semantic(plan, top_k)
         else:  # HYBRID
-            return self._retrieve_hybrid(plan, top_k)
+            results = self._retrieve_hybrid(plan, top_k)
+
+        if key is not None:
+            # Callers may edit their results; the cache keeps its own copy
+            self.cache.put(key, deepcopy(results))
+        return results
 
     def _retrieve_point_in_time(
         self,
@@ -76,62 +230,34 @@ class HybridRetriever:
         """
         Retrieve the exact state of law at a specific date.
 
-        This is the "time-travel" query from the paper.
+        This is the "time-travel" query from the paper. Every date of an
+        epoch has the same answer, so the query runs at the epoch's start.
         """
         date_str = plan.target_date.isoformat()
+        epoch = self.epochs.epoch_of(date_str)
+        if epoch is not None:
+            date_str = self.epochs.start(epoch)
 
         if plan.target_component:
             # Specific component requested
             # Try exact match first, then partial match
-            query = """
-            MATCH (c:Component)
-            WHERE c.component_id = $comp_id OR c.component_id ENDS WITH $comp_id
-            MATCH (c)-[:HAS_VERSION]->(v:CTV)
-            WHERE v.date_start <= date($query_date)
-              AND (v.date_end IS NULL OR v.date_end > date($query_date))
-            MATCH (v)-[:EXPRESSED_IN]->(:CLV)-[:HAS_TEXT]->(t:TextUnit)
-            RETURN c.component_id AS component_id,
-                   c.component_type AS component_type,
-                   t.full_text AS text,
-                   {
-                       version: v.version_number,
-                       start: toString(v.date_start),
-                       end: toString(v.date_end),
-                       is_active: v.is_active,
-                       is_original: v.is_original
-                   } AS version_info
-            LIMIT 1
-            """
-            params = {
-                "comp_id": plan.target_component,
-                "query_date": date_str
-            }
+            limit = 1
+            in_memory = partial(
+                InMemoryGraph.point_in_time, date_str=date_str, component_id=plan.target_component
+            )
         else:
             # Get entire constitution state at date
-            query = """
-            MATCH (n:Norm)-[:HAS_COMPONENT]->(c:Component)
-            MATCH (c)-[:HAS_VERSION]->(v:CTV)
-            WHERE v.date_start <= date($query_date)
-              AND (v.date_end IS NULL OR v.date_end > date($query_date))
-            MATCH (v)-[:EXPRESSED_IN]->(:CLV)-[:HAS_TEXT]->(t:TextUnit)
-            RETURN c.component_id AS component_id,
-                   c.component_type AS component_type,
-                   t.full_text AS text,
-                   {
-                       version: v.version_number,
-                       start: toString(v.date_start),
-                       end: toString(v.date_end)
-                   } AS version_info
-            ORDER BY c.component_id
-            LIMIT $limit
-            """
+            limit = top_k
+            in_memory = partial(InMemoryGraph.point_in_time, date_str=date_str, limit=top_k)
+
+        params = {}
+        if not isinstance(self.conn, InMemoryGraph):
             params = {
-                "query_date": date_str,
-                "limit": top_k
+                "ctv_ids": self._valid_ctv_ids(date_str, plan.target_component, epoch),
+                "limit": limit,
+                "with_status": bool(plan.target_component),
             }
-
-        with self.conn.session() as session:
-            results = list(session.run(query, params))
+        results = self._records(self.POINT_IN_TIME_QUERY, params, in_memory)
 
         return [
             RetrievalResult(
@@ -144,6 +270,30 @@ class HybridRetriever:
             for r in results
         ]
 
+    def _valid_ctv_ids(
+        self,
+        date_str: str,
+        component_id: Optional[str] = None,
+        epoch: Optional[int] = None
+    ) -> List[str]:
+        """CTVs valid at a date, of the matching components or of the roots.
+
+        Each component's version is found by binary search in the
+        ValidityIndex, so only those CTVs are read from the graph. Results
+        are shared by all dates of the same epoch.
+        """
+        if epoch is not None and (epoch, component_id) in self._valid_at:
+            return self._valid_at[(epoch, component_id)]
+        if component_id:
+            comp_ids = self.validity.match(component_id)
+        else:
+            comp_ids = self.validity.roots()
+        ctv_ids = (self.validity.version_at(comp_id, date_str) for comp_id in comp_ids)
+        valid = [ctv_id for ctv_id in ctv_ids if ctv_id is not None]
+        if epoch is not None:
+            self._valid_at[(epoch, component_id)] = valid
+        return valid
+
     def _retrieve_provenance(
         self,
         plan: QueryPlan,
@@ -175,6 +325,11 @@ class HybridRetriever:
                 "amend_num": plan.amendment_number,
                 "limit": top_k
             }
+            in_memory = partial(
+                InMemoryGraph.amendment_changes,
+                amendment_number=plan.amendment_number,
+                limit=top_k
+            )
 
         elif plan.target_component:
             # Get version history of a component
@@ -199,6 +354,11 @@ class HybridRetriever:
                 "comp_id": plan.target_component,
                 "limit": top_k
             }
+            in_memory = partial(
+                InMemoryGraph.component_history,
+                component_id=plan.target_component,
+                limit=top_k
+            )
 
         else:
             # General provenance - recent changes
@@ -218,9 +378,9 @@ class HybridRetriever:
             LIMIT $limit
             """
             params = {"limit": top_k}
+            in_memory = partial(InMemoryGraph.recent_changes, limit=top_k)
 
-        with self.conn.session() as session:
-            results = list(session.run(query, params))
+        results = self._records(query, params, in_memory)
 
         return [
             RetrievalResult(
@@ -244,51 +404,186 @@ class HybridRetriever:
 
         Falls back to text search if embeddings not available.
         """
-        # For now, use text search as fallback
-        # TODO: Implement vector search when embeddings are generated
-        return self._retrieve_text_search(plan, top_k)
+        if self.embeddings is None:
+            return self._retrieve_text_search(plan, top_k)
+        if not (plan.semantic_query or "").strip():
+            return []
+
+        docs, rows = self._semantic_candidates()
+        if not docs:
+            return []
+        scores = self.embeddings.scores(plan.semantic_query)[rows]
+        return [
+            RetrievalResult(
+                component_id=docs[i]["component_id"],
+                component_type=docs[i]["component_type"],
+                text=docs[i]["text"],
+                version_info={"version": docs[i]["version_number"]},
+                relevance_score=float(scores[i])
+            )
+            for i in top_k_indices(scores, top_k)
+        ]
+
+    def _semantic_candidates(self) -> Tuple[List[dict], np.ndarray]:
+        """Current documents and the embedding rows of their TextUnits.
+
+        Texts new since the last call (amended versions) are embedded here,
+        so only they cost an embedding call.
+        """
+        if self._semantic_docs is None:
+            docs = self.lexical.documents()
+            self.embeddings.add((d["content_hash"], d["text"]) for d in docs)
+            rows = np.array([self.embeddings.row(d["content_hash"]) for d in docs], dtype=np.int64)
+            self._semantic_docs = docs, rows
+        return self._semantic_docs
 
     def _retrieve_hybrid(
         self,
         plan: QueryPlan,
         top_k: int
     ) -> List[RetrievalResult]:
-        """Combine date filtering with semantic search."""
-        # For now, fall back to point-in-time
-        # TODO: Add semantic filtering
-        return self._retrieve_point_in_time(plan, top_k)
+        """
+        Combine date filtering with semantic search.
+
+        Keyword search, (with embeddings) vector search and, when the plan
+        targets a component, its date-filtered graph retrieval run
+        concurrently, each restricted to the versions valid at the date,
+        and their rankings are merged with
+        weighted reciprocal rank fusion. The keyword source only knows
+        current text, so without embeddings a component amended since the
+        date is only found when targeted. Per-source timings are left in
+        `last_timings`. Without a semantic query, falls back to
+        point-in-time.
+        """
+        if not (plan.semantic_query or "").strip():
+            return self._retrieve_point_in_time(plan, top_k)
 
-    def _retrieve_text_search(
+        total_start = time.perf_counter()
+        date_str = plan.target_date.isoformat()
+        # Load the shared indexes once, before the sources race for them
+        epoch = self.epochs.epoch_of(date_str)
+        if epoch is None:
+            return []  # before enactment
+        date_str = self.epochs.start(epoch)
+        if not isinstance(self.conn, InMemoryGraph):
+            self.validity.ensure_loaded()
+
+        # Each source ranks more candidates than needed, so fusion can reorder them
+        depth = 2 * top_k
+        sources = {}
+        if plan.target_component:
+            # Without a target the graph source would only list the roots,
+            # which say nothing about the query
+            sources["graph"] = partial(self._retrieve_point_in_time, plan, depth)
+        sources["lexical"] = partial(
+            self._retrieve_lexical_at, plan.semantic_query, date_str, depth
+        )
+        if self.epoch_masks is not None:
+            sources["vector"] = partial(
+                self._retrieve_vector_at, plan.semantic_query, epoch, date_str, depth
+            )
+
+        timings: Dict[str, float] = {}
+        futures = {
+            name: self._executor.submit(self._timed, timings, name, source)
+            for name, source in sources.items()
+            if self.fusion_weights.get(name, 0) > 0
+        }
+        rankings = {name: future.result() for name, future in futures.items()}
+
+        fusion_start = time.perf_counter()
+        results = self._fuse(rankings, top_k)
+        timings["fusion"] = (time.perf_counter() - fusion_start) * 1000
+        timings["total"] = (time.perf_counter() - total_start) * 1000
+        self.last_timings = timings
+        return results
+
+    @staticmethod
+    def _timed(timings: Dict[str, float], name: str, source: Callable[[], List]) -> List:
+        start = time.perf_counter()
+        try:
+            return source()
+        finally:
+            timings[name] = (time.perf_counter() - start) * 1000
+
+    def _fuse(
         self,
-        plan: QueryPlan,
+        rankings: Dict[str, List[RetrievalResult]],
         top_k: int
     ) -> List[RetrievalResult]:
-        """Fallback text search using CONTAINS."""
+        """Weighted reciprocal rank fusion of per-source rankings, by component.
 
-        # Extract keywords (simple approach)
-        keywords = plan.semantic_query.split()[:3]  # First 3 words
-        if not keywords:
-            return []
+        The result of the first source that found a component is kept
+        (graph, then lexical, then vector), scored with the fused score.
+        """
+        scores: Dict[str, float] = {}
+        chosen: Dict[str, RetrievalResult] = {}
+        for name, results in rankings.items():
+            weight = self.fusion_weights[name]
+            for rank, result in enumerate(results, start=1):
+                comp_id = result.component_id
+                scores[comp_id] = scores.get(comp_id, 0.0) + weight / (self.RRF_K + rank)
+                chosen.setdefault(comp_id, result)
+
+        best = sorted(scores, key=lambda comp_id: -scores[comp_id])[:top_k]
+        return [
+            RetrievalResult(
+                component_id=comp_id,
+                component_type=chosen[comp_id].component_type,
+                text=chosen[comp_id].text,
+                version_info=chosen[comp_id].version_info,
+                relevance_score=scores[comp_id]
+            )
+            for comp_id in best
+        ]
 
-        # Build regex pattern
-        pattern = ".*" + ".*".join(re.escape(k) for k in keywords) + ".*"
-
-        query = """
-        MATCH (c:Component)-[:HAS_VERSION]->(v:CTV {is_active: true})
-              -[:EXPRESSED_IN]->(:CLV)-[:HAS_TEXT]->(t:TextUnit)
-        WHERE t.full_text =~ $pattern
-        RETURN c.component_id AS component_id,
-               c.component_type AS component_type,
-               t.full_text AS text,
-               {version: v.version_number} AS version_info
-        LIMIT $limit
+    def _retrieve_lexical_at(
+        self,
+        query: str,
+        date_str: str,
+        top_k: int
+    ) -> List[RetrievalResult]:
+        """Keyword search, keeping components whose current text was valid at the date.
+
+        The keyword index only holds current text, so a component amended
+        since the date is never found here, even if its text at the date
+        matches: past text is only searched by the vector source (and by
+        the graph source, for a targeted component).
         """
+        validity = self.conn.validity if isinstance(self.conn, InMemoryGraph) else self.validity
+        return [
+            RetrievalResult(
+                component_id=doc["component_id"],
+                component_type=doc["component_type"],
+                text=doc["text"],
+                version_info={"version": doc["version_number"]},
+                relevance_score=score
+            )
+            for doc, score in self.lexical.search(query, top_k)
+            if validity.version_at(doc["component_id"], date_str) == doc["ctv_id"]
+        ]
 
-        with self.conn.session() as session:
-            results = list(session.run(query, {
-                "pattern": f"(?i){pattern}",
-                "limit": top_k
-            }))
+    def _retrieve_vector_at(
+        self,
+        query: str,
+        epoch: int,
+        date_str: str,
+        top_k: int
+    ) -> List[RetrievalResult]:
+        """
+        Vector search among the versions valid during an epoch.
+
+        Only the CTVs valid during the epoch are ranked (a pre-filter), so
+        past dates get a full top-k of their own text at the cost of a
+        current-version search.
+        """
+        hits = self.epoch_masks.search(query, epoch, date_str, top_k)
+        # A CTV without text has no record, so scores are matched by ID
+        scores = dict(hits)
+        ctv_ids = list(scores)
+        params = {"ctv_ids": ctv_ids, "limit": top_k, "with_status": False}
+        in_memory = partial(InMemoryGraph.ctv_records, ctv_ids=ctv_ids, limit=top_k)
+        results = self._records(self.POINT_IN_TIME_QUERY, params, in_memory)
 
         return [
             RetrievalResult(
@@ -296,11 +591,28 @@ class HybridRetriever:
                 component_type=r["component_type"],
                 text=r["text"],
                 version_info=r["version_info"],
-                relevance_score=0.5
+                relevance_score=scores[r["ctv_id"]]
             )
             for r in results
         ]
 
+    def _retrieve_text_search(
+        self,
+        plan: QueryPlan,
+        top_k: int
+    ) -> List[RetrievalResult]:
+        """Keyword search ranked by BM25 over the current text (LexicalIndex)."""
+        return [
+            RetrievalResult(
+                component_id=doc["component_id"],
+                component_type=doc["component_type"],
+                text=doc["text"],
+                version_info={"version": doc["version_number"]},
+                relevance_score=score
+            )
+            for doc, score in self.lexical.search(plan.semantic_query, top_k)
+        ]
+
 
 def retrieve(query: str, date_str: Optional[str] = None, top_k: int = 10) -> List[RetrievalResult]:
     """Convenience function for retrieval."""
@@ -310,4 +622,7 @@ def retrieve(query: str, date_str: Optional[str] = None, top_k: int = 10) -> Lis
     plan = planner.plan(query)
 
     retriever = HybridRetriever()
-    return retriever.retrieve(plan, top_k)
+    try:
+        return retriever.retrieve(plan, top_k)
+    finally:
+        retriever.close()
@@ -0,0 +1,177 @@
+"""Incremental JSON reading utilities.
+
+Provides an event stream over a JSON file (similar to a SAX parser) so that
+large intermediate files can be walked without materializing the whole
+document. Events are `(event, value)` tuples where event is one of:
+`start_map`, `map_key`, `end_map`, `start_array`, `end_array`, `string`,
+`number`, `boolean` or `null`.
+"""
+
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Iterator, TextIO, Tuple
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?")
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_LITERALS = {"true": ("boolean", True), "false": ("boolean", False), "null": ("null", None)}
+
+
+class JsonEventStream:
+    """Tokenizes a JSON text stream into parse events.
+
+    Only the current chunk (plus any token spanning a chunk boundary) is held
+    in memory, so memory use is bounded by the chunk size and the longest
+    single string in the document.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return self._events()
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping consumed input.
+
+        Returns:
+            True if more input was read
+        """
+        if self._eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return
+
+    def _read_string(self) -> str:
+        while True:
+            try:
+                value, end = scanstring(self._buf, self._pos + 1)
+            except json.JSONDecodeError:
+                # String (or escape) continues in the next chunk
+                if not self._fill():
+                    raise
+                continue
+            self._pos = end
+            return value
+
+    def _read_number(self):
+        while True:
+            end = self._pos
+            while end < len(self._buf) and self._buf[end] in _NUMBER_CHARS:
+                end += 1
+            # The number may continue in the next chunk
+            if end < len(self._buf) or not self._fill():
+                break
+        match = _NUMBER.fullmatch(self._buf, self._pos, end)
+        if match is None:
+            raise ValueError(f"Invalid JSON number at offset {self._pos}")
+        self._pos = end
+        if match.group(1) or match.group(2):
+            return float(match.group(0))
+        return int(match.group(0))
+
+    def _read_literal(self) -> Tuple[str, Any]:
+        while len(self._buf) - self._pos < 5 and self._fill():
+            pass
+        for literal, event in _LITERALS.items():
+            if self._buf.startswith(literal, self._pos):
+                self._pos += len(literal)
+                return event
+        raise ValueError(f"Invalid JSON literal at offset {self._pos}")
+
+    def _events(self) -> Iterator[Tuple[str, Any]]:
+        containers = []
+        expect_key = False
+
+        while True:
+            self._skip_whitespace()
+            if self._pos >= len(self._buf):
+                return
+
+            ch = self._buf[self._pos]
+            if ch == "{":
+                self._pos += 1
+                containers.append("map")
+                expect_key = True
+                yield ("start_map", None)
+            elif ch == "}":
+                self._pos += 1
+                containers.pop()
+                expect_key = False
+                yield ("end_map", None)
+            elif ch == "[":
+                self._pos += 1
+                containers.append("array")
+                expect_key = False
+                yield ("start_array", None)
+            elif ch == "]":
+                self._pos += 1
+                containers.pop()
+                yield ("end_array", None)
+            elif ch == ",":
+                self._pos += 1
+                expect_key = bool(containers) and containers[-1] == "map"
+            elif ch == ":":
+                self._pos += 1
+                expect_key = False
+            elif ch == '"':
+                value = self._read_string()
+                yield ("map_key" if expect_key else "string", value)
+                expect_key = False
+            elif ch == "-" or ch.isdigit():
+                yield ("number", self._read_number())
+            else:
+                yield self._read_literal()
+
+
+def read_value(events: Iterator[Tuple[str, Any]]) -> Any:
+    """Materialize the next complete JSON value from an event iterator."""
+    event, value = next(events)
+    return _build_value(events, event, value)
+
+
+def _build_value(events: Iterator[Tuple[str, Any]], event: str, value: Any) -> Any:
+    if event == "start_map":
+        obj = {}
+        for event, key in events:
+            if event == "end_map":
+                return obj
+            obj[key] = read_value(events)
+    elif event == "start_array":
+        arr = []
+        for event, value in events:
+            if event == "end_array":
+                return arr
+            arr.append(_build_value(events, event, value))
+    return value
+
+
+def skip_value(events: Iterator[Tuple[str, Any]]) -> None:
+    """Consume the next JSON value without building it."""
+    depth = 0
+    for event, _ in events:
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if depth == 0:
+            return
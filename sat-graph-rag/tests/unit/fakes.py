@@ -0,0 +1,73 @@
+"""In-process stand-ins for the Neo4j driver used by unit tests."""
+
+from contextlib import contextmanager
+
+
+class FakeResult:
+    """Result of a recorded query (records come from the responder)."""
+
+    def __init__(self, records=None):
+        self.records = list(records or [])
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def single(self):
+        return self.records[0] if self.records else None
+
+    def data(self):
+        return [dict(r) for r in self.records]
+
+    def consume(self):
+        return None
+
+
+class FakeTx:
+    """Records queries run inside a transaction."""
+
+    def __init__(self, log, responder=None):
+        self.log = log
+        self.responder = responder
+
+    def run(self, query, params=None):
+        self.log.append((query, params))
+        records = self.responder(query, params or {}) if self.responder else None
+        return FakeResult(records)
+
+    def consume(self):
+        return None
+
+
+class FakeSession:
+    """Minimal stand-in for a neo4j Session."""
+
+    def __init__(self, log, responder=None):
+        self.log = log
+        self.responder = responder
+        self.transactions = 0
+
+    def run(self, query, params=None):
+        return FakeTx(self.log, self.responder).run(query, params)
+
+    def execute_write(self, fn, *args):
+        self.transactions += 1
+        return fn(FakeTx(self.log, self.responder), *args)
+
+    def execute_read(self, fn, *args):
+        return fn(FakeTx(self.log, self.responder), *args)
+
+
+class FakeConnection:
+    """Connection handing out a single shared FakeSession.
+
+    Args:
+        responder: Optional callable (query, params) -> list of record dicts
+    """
+
+    def __init__(self, responder=None):
+        self.log = []
+        self.fake_session = FakeSession(self.log, responder)
+
+    @contextmanager
+    def session(self):
+        yield self.fake_session
@@ -0,0 +1,151 @@
+"""Unit tests for the neo4j-admin CSV exporter."""
+
+import csv
+import json
+
+from src.graph.admin_import import AdminImportExporter
+from src.graph.loader import ConstitutionLoader, compute_content_hash
+from tests.unit.fakes import FakeConnection
+
+
+CONSTITUTION = {
+    "official_id": "CF1988",
+    "name": "Constituição da República Federativa do Brasil",
+    "components": [
+        {
+            "component_type": "title",
+            "component_id": "tit_01",
+            "ordering_id": "01",
+            "full_text": "TÍTULO I",
+            "children": [
+                {
+                    "component_type": "article",
+                    "component_id": "tit_01_art_1",
+                    "ordering_id": "1",
+                    "header": "Art. 1º",
+                    "content": "A República Federativa do Brasil,\nformada pela união...",
+                    "full_text": "Art. 1º A República Federativa do Brasil,\nformada pela união...",
+                    "events": [{"amendment_number": 1}, {"amendment_number": 45}],
+                },
+            ],
+        },
+    ],
+}
+
+
+def _read(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))
+
+
+def _export(tmp_path):
+    json_path = tmp_path / "constitution.json"
+    json_path.write_text(json.dumps(CONSTITUTION, ensure_ascii=False), encoding="utf-8")
+    exporter = AdminImportExporter(str(tmp_path / "import"))
+    stats = exporter.export([str(json_path)])
+    return exporter, stats
+
+
+def test_headers_are_annotated(tmp_path):
+    exporter, _ = _export(tmp_path)
+    for name, header in {**exporter.NODE_FILES, **exporter.RELATIONSHIP_FILES}.items():
+        rows = _read(exporter.output_dir / f"{name}.csv")
+        assert rows[0] == header
+
+
+def test_ids_and_hash_match_online_loader(tmp_path):
+    exporter, _ = _export(tmp_path)
+    text_units = _read(exporter.output_dir / "text_units.csv")[1:]
+    article = next(r for r in text_units if r[0] == "tit_01_art_1_v1_pt_text")
+    assert article[1] == "tit_01_art_1_v1_pt"
+    source = CONSTITUTION["components"][0]["children"][0]
+    assert article[6] == compute_content_hash(source["full_text"])
+    assert "\n" in article[4]
+
+    ctvs = _read(exporter.output_dir / "ctvs.csv")[1:]
+    assert [r[0] for r in ctvs] == ["tit_01_v1", "tit_01_art_1_v1"]
+    assert ctvs[1][6] == "1;45"
+
+
+def test_relationships(tmp_path):
+    exporter, stats = _export(tmp_path)
+    assert _read(exporter.output_dir / "has_component.csv")[1:] == [
+        ["CF1988", "tit_01", "HAS_COMPONENT"]
+    ]
+    assert _read(exporter.output_dir / "aggregates.csv")[1:] == [
+        ["tit_01_v1", "tit_01_art_1_v1", "1", "AGGREGATES"]
+    ]
+    assert stats["components"] == 2
+    assert _read(exporter.output_dir / "current.csv")[1:] == [
+        ["tit_01", "tit_01_v1", "CURRENT"], ["tit_01_art_1", "tit_01_art_1_v1", "CURRENT"]
+    ]
+    assert stats["relationships"] == 9
+
+
+def test_stats_match_the_online_loader(tmp_path):
+    _, stats = _export(tmp_path)
+    loader = ConstitutionLoader(FakeConnection())
+    assert loader.load_from_json(str(tmp_path / "constitution.json")) == stats
+
+
+def test_import_command_lists_every_file(tmp_path):
+    exporter, _ = _export(tmp_path)
+    command = exporter.import_command()
+    assert command.startswith("neo4j-admin database import full neo4j")
+    assert command.count("--nodes=") == len(exporter.NODE_FILES)
+    assert command.count("--relationships=") == len(exporter.RELATIONSHIP_FILES)
+
+
+def test_identical_text_shares_one_text_unit(tmp_path):
+    constitution = {
+        "official_id": "CF1988",
+        "components": [
+            {"component_id": "tit_01", "component_type": "title", "full_text": "(Revogado)"},
+            {"component_id": "tit_02", "component_type": "title", "full_text": "(Revogado)"},
+        ],
+    }
+    json_path = tmp_path / "constitution.json"
+    json_path.write_text(json.dumps(constitution), encoding="utf-8")
+    exporter = AdminImportExporter(str(tmp_path / "import"))
+    stats = exporter.export([str(json_path)])
+
+    assert len(_read(exporter.output_dir / "text_units.csv")[1:]) == 1
+    assert _read(exporter.output_dir / "has_text.csv")[1:] == [
+        ["tit_01_v1_pt", "tit_01_v1_pt_text", "HAS_TEXT"],
+        ["tit_02_v1_pt", "tit_01_v1_pt_text", "HAS_TEXT"],
+    ]
+    assert stats["text_units"] == 1
+    assert stats["clvs"] == 2
+
+
+def test_empty_amendment_list_is_an_empty_array(tmp_path):
+    exporter, _ = _export(tmp_path)
+    lines = (exporter.output_dir / "ctvs.csv").read_text(encoding="utf-8").splitlines()
+    title = next(line for line in lines if line.startswith('"tit_01_v1"'))
+    # a quoted empty field is an empty array; an unquoted one would drop the property
+    assert '"true","true","",' in title
+
+
+def test_several_norms_get_prefixed_ids(tmp_path):
+    paths = []
+    for norm_id in ("CF1988", "ADCT"):
+        path = tmp_path / f"{norm_id}.json"
+        path.write_text(json.dumps({**CONSTITUTION, "official_id": norm_id}), encoding="utf-8")
+        paths.append(str(path))
+    exporter = AdminImportExporter(str(tmp_path / "import"))
+    exporter.export(paths)
+
+    components = [r[0] for r in _read(exporter.output_dir / "components.csv")[1:]]
+    assert components == [
+        "CF1988_tit_01", "CF1988_tit_01_art_1", "ADCT_tit_01", "ADCT_tit_01_art_1",
+    ]
+    assert ["ADCT", "ADCT_tit_01", "HAS_COMPONENT"] in _read(
+        exporter.output_dir / "has_component.csv"
+    )
+    assert ["ADCT_tit_01_v1", "ADCT_tit_01_art_1_v1", "1", "AGGREGATES"] in _read(
+        exporter.output_dir / "aggregates.csv"
+    )
+    # identical texts still share the first norm's TextUnit
+    assert ["ADCT_tit_01_v1_pt", "CF1988_tit_01_v1_pt_text", "HAS_TEXT"] in _read(
+        exporter.output_dir / "has_text.csv"
+    )
@@ -0,0 +1,98 @@
+"""Unit tests for the retrieval result cache."""
+
+import json
+from datetime import date
+
+from src.graph.memory import InMemoryGraph
+from src.graph.temporal_engine import TemporalEngine
+from src.rag.cache import ResultCache
+from src.rag.planner import QueryPlan, QueryType
+from src.rag.retriever import HybridRetriever
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+from tests.unit.test_validity import VERSIONS
+
+
+def _plan(day, component="art_1"):
+    return QueryPlan(
+        query_type=QueryType.POINT_IN_TIME, original_query="",
+        target_date=day, target_component=component,
+    )
+
+
+def test_lru_eviction_and_counters():
+    cache = ResultCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats() == {
+        "size": 2, "maxsize": 2, "hits": 2, "misses": 1, "evictions": 1, "hit_rate": 2 / 3,
+    }
+
+
+def test_dates_in_one_epoch_hit_the_cache():
+    def responder(query, params):
+        if "AS is_root" in query:
+            return [
+                {"component_id": c, "is_root": c in ("tit_01", "tit_02"), "versions": v}
+                for c, v in VERSIONS.items()
+            ]
+        if "UNION" in query:
+            return [{"date": "1988-10-05"}, {"date": "1992-03-31"}]
+        if "$ctv_ids[i]" in query:
+            return [{"component_id": "tit_01_art_1", "component_type": "article",
+                     "text": "Art. 1º", "version_info": {}}]
+        return []
+
+    conn = FakeConnection(responder)
+    retriever = HybridRetriever(conn)
+    first = retriever.retrieve(_plan(date(1993, 1, 1)))
+    first[0].version_info["edited"] = True
+    hit = retriever.retrieve(_plan(date(1999, 6, 30)))
+    assert hit[0].version_info == {}  # callers get their own copies
+    assert hit[0] is not retriever.retrieve(_plan(date(1999, 6, 30)))[0]
+    retriever.retrieve(_plan(date(1990, 1, 1)))  # another epoch
+
+    assert len([q for q, _ in conn.log if "$ctv_ids[i]" in q]) == 2
+    assert retriever.cache.hits == 2 and retriever.cache.misses == 2
+
+
+def test_engine_amendments_invalidate_the_cache(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    engine = TemporalEngine(graph)
+    retriever = HybridRetriever(graph, engine=engine)
+
+    plan = _plan(date(2020, 1, 1), "tit_01_art_2")
+    assert retriever.retrieve(plan)[0].text == "Art. 2º São Poderes da União..."
+    assert len(retriever.cache) == 1
+
+    engine.apply_amendment(1, "1992-03-31", [
+        {"component_id": "tit_01_art_2", "new_content": "Art. 2º novo", "change_type": "modify"},
+    ])
+    assert len(retriever.cache) == 0
+    assert retriever.retrieve(plan)[0].text == "Art. 2º novo"
+
+    engine.revert_amendment(1)
+    assert retriever.retrieve(plan)[0].text == "Art. 2º São Poderes da União..."
+
+
+def test_resync_notifies_the_engine_listeners():
+    engine = TemporalEngine(FakeConnection())
+    engine.hierarchy.load()
+    retriever = HybridRetriever(engine.conn, engine=engine)
+    retriever.cache.put("key", [])
+    seen = []
+    engine.add_listener(seen.append)
+
+    engine.graph_changed()
+    assert seen == [None]
+    assert len(retriever.cache) == 0
+    assert not engine.hierarchy.is_loaded
@@ -0,0 +1,160 @@
+"""Unit tests for TextUnit embeddings and semantic search."""
+
+import json
+from datetime import date
+
+import numpy as np
+
+from src.graph.memory import InMemoryGraph
+from src.graph.temporal_engine import TemporalEngine
+from src.rag.embeddings import EmbeddingStore, EpochMasks, HashingEmbedder, top_k_indices
+from src.rag.planner import QueryPlan, QueryType
+from src.rag.retriever import HybridRetriever
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+class CountingEmbedder(HashingEmbedder):
+    """HashingEmbedder that records the size of each batch."""
+
+    def __init__(self, dimensions=64):
+        super().__init__(dimensions)
+        self.batches = []
+
+    def embed(self, texts):
+        self.batches.append(len(texts))
+        return super().embed(texts)
+
+
+def test_hashing_embedder_is_deterministic_and_normalized():
+    vectors = HashingEmbedder(64).embed(["Direitos sociais", "direitos SOCIAIS", ""])
+    assert np.allclose(vectors[0], vectors[1])
+    assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+    assert not vectors[2].any()
+
+
+def test_top_k_indices():
+    scores = np.array([0.1, 0.9, 0.5, 0.7])
+    assert top_k_indices(scores, 2).tolist() == [1, 3]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 2, 0]
+
+
+def test_store_embeds_new_texts_once_in_batches():
+    embedder = CountingEmbedder()
+    store = EmbeddingStore(embedder, batch_size=2)
+    items = [("h1", "a saúde"), ("h2", "a educação"), ("h1", "a saúde"), ("h3", "lazer")]
+    assert store.add(items) == 3
+    assert store.add([("h2", "a educação"), ("h4", "moradia")]) == 1
+    assert embedder.batches == [2, 1, 1]
+    assert store.search("moradia", top_k=1)[0][0] == "h4"
+
+
+def test_save_load_and_push(tmp_path):
+    store = EmbeddingStore(HashingEmbedder(8))
+    store.add([("h1", "saude"), ("h2", "educacao")])
+    path = store.save(str(tmp_path / "vectors.npz"))
+
+    loaded = EmbeddingStore(HashingEmbedder(8)).load(str(path))
+    assert np.allclose(loaded.matrix, store.matrix)
+    assert loaded.row("h2") == 1
+
+    conn = FakeConnection()
+    assert loaded.push_to_neo4j(conn, batch_size=1) == 2
+    pushes = [p["rows"] for q, p in conn.log if "SET t.embedding" in q]
+    assert [rows[0]["content_hash"] for rows in pushes] == ["h1", "h2"]
+    assert len(pushes[0][0]["embedding"]) == 8
+
+
+def test_semantic_retrieval_ranks_current_text(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    store = EmbeddingStore(HashingEmbedder(256))
+    assert store.sync(graph) == len(graph.text_units)
+
+    retriever = HybridRetriever(graph, embeddings=store)
+
+    def semantic(query):
+        plan = QueryPlan(query_type=QueryType.SEMANTIC, original_query=query,
+                         semantic_query=query)
+        return retriever.retrieve(plan, top_k=2)
+
+    results = semantic("soberania")
+    assert results[0].component_id == "tit_01_art_1_inc_I"
+    assert results[0].relevance_score > results[1].relevance_score
+
+    engine = TemporalEngine(graph)
+    engine.add_listener(retriever.on_amendment)
+    engine.apply_amendment(1, "1992-03-31", [
+        {"component_id": "tit_01_art_2", "new_content": "Art. 2º A soberania popular",
+         "change_type": "modify"},
+    ])
+    assert "tit_01_art_2" in [r.component_id for r in semantic("soberania popular")]
+    assert len(store) == len(graph.text_units)  # only the new text was embedded
+
+
+def test_hybrid_search_ranks_only_versions_valid_at_the_date(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    engine = TemporalEngine(graph)
+    engine.apply_amendment(1, "1992-03-31", [
+        {"component_id": "tit_01_art_1_inc_I", "new_content": "I - a cidadania;",
+         "change_type": "modify"},
+    ])
+    retriever = HybridRetriever(
+        graph, embeddings=EmbeddingStore(HashingEmbedder(256)),
+        fusion_weights={"graph": 0, "lexical": 0},  # vector source only
+    )
+
+    def hybrid(day, top_k=10):
+        plan = QueryPlan(query_type=QueryType.HYBRID, original_query="", target_date=day,
+                         semantic_query="soberania cidadania")
+        return retriever.retrieve(plan, top_k=top_k)
+
+    old, new = hybrid(date(1990, 1, 1)), hybrid(date(2020, 1, 1))
+    assert old[0].text == "I - a soberania;" and old[0].version_info["version"] == 1
+    assert new[0].text == "I - a cidadania;" and new[0].version_info["end"] is None
+    # one version per component: the full state of each date, nothing filtered after ranking
+    assert len(old) == len(new) == len(graph.components)
+    assert hybrid(date(1980, 1, 1)) == []
+
+    valid, _ = retriever.epoch_masks.mask(0, "1988-10-05")
+    assert len(valid) == len(graph.components)
+    assert len(hybrid(date(1990, 1, 1), top_k=2)) == 2
+
+
+def test_epoch_masks_keep_the_open_version_of_same_day_amendments():
+    versions = [
+        {"ctv_id": "a_v1", "start": "1988-10-05", "end": "1992-03-31", "content_hash": "h1"},
+        {"ctv_id": "a_v2", "start": "1992-03-31", "end": "1992-03-31", "content_hash": "h2"},
+        {"ctv_id": "a_v3", "start": "1992-03-31", "end": None, "content_hash": "h3"},
+    ]
+    store = EmbeddingStore(HashingEmbedder(16))
+    store.add([("h1", "um"), ("h2", "dois"), ("h3", "tres")])
+    masks = EpochMasks(store, FakeConnection(lambda query, params: versions))
+
+    assert [ctv_id for ctv_id, _ in masks.search("tres", 1, "1992-03-31")] == ["a_v3"]
+    assert [ctv_id for ctv_id, _ in masks.search("tres", 0, "1988-10-05")] == ["a_v1"]
+
+
+def test_epoch_masks_score_only_the_epoch_rows():
+    versions = [
+        {"ctv_id": "a_v1", "start": "1988-10-05", "end": "1992-03-31", "content_hash": "h1"},
+        {"ctv_id": "a_v2", "start": "1992-03-31", "end": None, "content_hash": "h2"},
+    ]
+    store = EmbeddingStore(HashingEmbedder(16))
+    store.add([("h1", "um"), ("h2", "dois")])
+    masks = EpochMasks(store, FakeConnection(lambda query, params: versions))
+    full = store.scores("dois")
+    scored = []
+    store.scores = lambda query, rows=None: scored.append(rows) or full[rows]
+
+    assert [ctv_id for ctv_id, _ in masks.search("dois", 1, "1992-03-31")] == ["a_v2"]
+    assert scored[0].tolist() == [1]
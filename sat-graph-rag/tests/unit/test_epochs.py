@@ -0,0 +1,99 @@
+"""Unit tests for the epoch index."""
+
+import json
+from datetime import date
+
+from src.graph.epochs import EpochIndex
+from src.graph.memory import InMemoryGraph
+from src.rag.planner import QueryPlan, QueryType
+from src.rag.retriever import HybridRetriever
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+from tests.unit.test_validity import VERSIONS
+
+DATES = ["1988-10-05", "1992-03-31", "1992-03-31", "1995-08-15", None]
+
+
+def test_epoch_of_bisects_boundaries():
+    epochs = EpochIndex.from_dates(DATES)
+    assert len(epochs) == 3
+    assert epochs.epoch_of("1988-10-04") is None
+    assert epochs.epoch_of("1988-10-05") == 0
+    assert epochs.epoch_of("1992-03-30") == 0
+    assert epochs.epoch_of("1992-03-31") == 1
+    assert epochs.epoch_of("2015-03-02") == epochs.epoch_of("2015-12-31") == epochs.current == 2
+
+
+def test_epoch_bounds():
+    epochs = EpochIndex.from_dates(DATES)
+    assert epochs.canonical_date("1993-06-01") == "1992-03-31"
+    assert epochs.canonical_date("1980-01-01") == "1980-01-01"
+    assert epochs.epochs() == [
+        (0, "1988-10-05", "1992-03-31"),
+        (1, "1992-03-31", "1995-08-15"),
+        (2, "1995-08-15", None),
+    ]
+
+
+def test_loaded_from_enactment_and_version_dates():
+    def responder(query, params):
+        if "UNION" in query:
+            return [{"date": "1988-10-05"}, {"date": "1992-03-31"}]
+        return []
+
+    conn = FakeConnection(responder)
+    epochs = EpochIndex(conn)
+    assert epochs.epoch_of("2000-01-01") == 1
+    assert "v.date_end" in conn.log[0][0]
+
+
+def test_dates_in_one_epoch_share_the_version_lookup():
+    def responder(query, params):
+        if "AS is_root" in query:
+            return [
+                {"component_id": c, "is_root": c in ("tit_01", "tit_02"), "versions": v}
+                for c, v in VERSIONS.items()
+            ]
+        if "UNION" in query:
+            return [{"date": "1988-10-05"}, {"date": "1992-03-31"}]
+        return []
+
+    conn = FakeConnection(responder)
+    retriever = HybridRetriever(conn, cache_size=0)
+    for day in (date(1993, 1, 1), date(1999, 6, 30)):
+        retriever.retrieve(QueryPlan(
+            query_type=QueryType.POINT_IN_TIME, original_query="",
+            target_date=day, target_component="art_1",
+        ))
+
+    assert list(retriever._valid_at) == [(1, "art_1")]
+    lookups = [p for q, p in conn.log if "$ctv_ids[i]" in q]
+    assert lookups[0] == lookups[1]
+
+
+def test_in_memory_epochs_follow_amendments(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    assert len(graph.epochs) == 1
+
+    change = {"component_id": "tit_01_art_1", "new_content": "novo", "change_type": "modify"}
+    graph.apply_amendment(1, "1992-03-31", [change])
+    assert graph.epochs.epoch_of("2015-03-02") == 1
+
+    # Versions written without an Action (a resync) open an epoch too
+    graph.ctvs["tit_02_v1"]["date_end"] = "2010-01-01"
+    graph._epochs = None
+    assert graph.epochs.epoch_of("2015-03-02") == 2
+
+    results = [
+        HybridRetriever(graph).retrieve(QueryPlan(
+            query_type=QueryType.POINT_IN_TIME, original_query="",
+            target_date=day, target_component="tit_01_art_1",
+        ))[0]
+        for day in (date(2015, 1, 1), date(2015, 3, 2))
+    ]
+    assert results[0] == results[1]
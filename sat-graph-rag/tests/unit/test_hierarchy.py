@@ -0,0 +1,57 @@
+"""Unit tests for the in-memory component hierarchy cache."""
+
+from src.graph.hierarchy import ComponentHierarchy
+from tests.unit.fakes import FakeConnection
+
+PARENTS = {
+    "tit_01": None,
+    "art_1": "tit_01",
+    "art_1_par_1": "art_1",
+    "art_1_par_1_inc_I": "art_1_par_1",
+    "art_2": "tit_01",
+    "tit_02": None,
+}
+
+
+def _hierarchy():
+    return ComponentHierarchy.from_parent_map(PARENTS)
+
+
+def test_ancestors_nearest_first():
+    assert _hierarchy().ancestors("art_1_par_1_inc_I") == ["art_1_par_1", "art_1", "tit_01"]
+    assert _hierarchy().ancestors("tit_01") == []
+
+
+def test_depth():
+    hierarchy = _hierarchy()
+    assert hierarchy.depth("tit_02") == 0
+    assert hierarchy.depth("art_2") == 1
+    assert hierarchy.depth("art_1_par_1_inc_I") == 3
+
+
+def test_subtree_preorder():
+    assert _hierarchy().subtree("tit_01") == [
+        "tit_01", "art_1", "art_1_par_1", "art_1_par_1_inc_I", "art_2",
+    ]
+
+
+def test_group_by_depth_deepest_first():
+    levels = _hierarchy().group_by_depth(["tit_01", "art_1_par_1", "art_1", "art_2"], reverse=True)
+    assert levels == [["art_1_par_1"], ["art_1", "art_2"], ["tit_01"]]
+
+
+def test_loads_lazily_and_reloads_after_invalidate():
+    conn = FakeConnection(lambda query, params: [
+        {"component_id": c, "parent_id": p} for c, p in PARENTS.items()
+    ])
+    hierarchy = ComponentHierarchy(conn)
+    assert not hierarchy.is_loaded
+
+    hierarchy.ancestors("art_1")
+    hierarchy.depth("art_1_par_1")
+    assert len(conn.log) == 1
+
+    hierarchy.invalidate()
+    assert not hierarchy.is_loaded
+    assert hierarchy.parent("art_2") == "tit_01"
+    assert len(conn.log) == 2
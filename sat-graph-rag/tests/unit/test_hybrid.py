@@ -0,0 +1,129 @@
+"""Unit tests for hybrid retrieval with reciprocal rank fusion."""
+
+import json
+from datetime import date
+
+import pytest
+
+from src.graph.memory import InMemoryGraph
+from src.graph.temporal_engine import TemporalEngine
+from src.rag.embeddings import EmbeddingStore, HashingEmbedder
+from src.rag.planner import QueryPlan, QueryType
+from src.rag.retriever import HybridRetriever, RetrievalResult
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+@pytest.fixture
+def graph(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    TemporalEngine(graph).apply_amendment(1, "1992-03-31", [
+        {"component_id": "tit_01_art_1_inc_I", "new_content": "I - a cidadania;",
+         "change_type": "modify"},
+    ])
+    return graph
+
+
+def _hybrid(day, query):
+    return QueryPlan(query_type=QueryType.HYBRID, original_query=query, target_date=day,
+                     semantic_query=query)
+
+
+def _result(comp_id):
+    return RetrievalResult(component_id=comp_id, component_type="article", text=comp_id,
+                           version_info={})
+
+
+def test_rrf_rewards_agreement_between_sources(graph):
+    retriever = HybridRetriever(graph)
+    fused = retriever._fuse({
+        "graph": [_result("a"), _result("b")],
+        "lexical": [_result("b"), _result("c")],
+    }, top_k=3)
+    assert [r.component_id for r in fused] == ["b", "a", "c"]
+    assert fused[0].relevance_score == pytest.approx(1 / 62 + 1 / 61)
+
+    retriever.fusion_weights["lexical"] = 3.0
+    fused = retriever._fuse({"graph": [_result("a")], "lexical": [_result("c")]}, top_k=2)
+    assert [r.component_id for r in fused] == ["c", "a"]
+
+
+def test_sources_only_see_versions_valid_at_the_date(graph):
+    retriever = HybridRetriever(graph, embeddings=EmbeddingStore(HashingEmbedder(256)))
+
+    past = retriever.retrieve(_hybrid(date(1990, 1, 1), "cidadania soberania"))
+    assert "I - a soberania;" in [r.text for r in past]
+    assert not any("cidadania" in r.text for r in past)
+    assert set(retriever.last_timings) == {"lexical", "vector", "fusion", "total"}
+
+    current = retriever.retrieve(_hybrid(date(2020, 1, 1), "cidadania"))
+    assert current[0].text == "I - a cidadania;"
+
+
+def test_disabled_sources_are_not_run(graph):
+    retriever = HybridRetriever(graph, fusion_weights={"graph": 0})
+    plan = _hybrid(date(2020, 1, 1), "cidadania")
+    plan.target_component = "art_1_inc_I"
+    results = retriever.retrieve(plan, top_k=1)
+    assert [r.component_id for r in results] == ["tit_01_art_1_inc_I"]
+    # no embeddings: no vector source either
+    assert set(retriever.last_timings) == {"lexical", "fusion", "total"}
+
+
+def test_graph_source_needs_a_target_component(graph):
+    retriever = HybridRetriever(graph)
+    results = retriever.retrieve(_hybrid(date(2020, 1, 1), "cidadania"))
+    # the roots listed by point-in-time retrieval are not fused with the hits
+    assert [r.component_id for r in results] == ["tit_01_art_1_inc_I"]
+    assert "graph" not in retriever.last_timings
+
+    plan = _hybrid(date(1990, 1, 1), "soberania")
+    plan.target_component = "art_1_inc_I"
+    results = retriever.retrieve(plan)
+    assert [r.component_id for r in results] == ["tit_01_art_1_inc_I"]
+    assert "graph" in retriever.last_timings
+
+
+def test_close_shuts_down_the_source_threads(graph):
+    retriever = HybridRetriever(graph)
+    retriever.retrieve(_hybrid(date(2020, 1, 1), "cidadania"))
+    retriever.close()
+    with pytest.raises(RuntimeError):
+        retriever.retrieve(_hybrid(date(2020, 1, 1), "soberania"))
+
+
+class _Hits:
+    """Epoch masks returning fixed (ctv_id, score) hits."""
+
+    def __init__(self, hits):
+        self.hits = hits
+
+    def search(self, *args):
+        return self.hits
+
+
+def test_vector_scores_follow_their_ctv(graph):
+    graph.expressed_in.pop("tit_01_v1")  # a version without text has no record
+    retriever = HybridRetriever(graph)
+    retriever.epoch_masks = _Hits(
+        [("tit_01_v1", 0.9), ("tit_02_v1", 0.5), ("tit_01_art_2_v1", 0.1)]
+    )
+
+    results = retriever._retrieve_vector_at("x", 0, "1988-10-05", 10)
+    assert [(r.component_id, r.relevance_score) for r in results] == [
+        ("tit_02", 0.5), ("tit_01_art_2", 0.1),
+    ]
+
+
+def test_keyword_source_misses_text_amended_since_the_date(graph):
+    # Only current text is indexed: the 1988 item is left to the vector source
+    retriever = HybridRetriever(graph)
+    assert retriever.retrieve(_hybrid(date(1990, 1, 1), "soberania")) == []
+
+    retriever = HybridRetriever(graph, embeddings=EmbeddingStore(HashingEmbedder(256)))
+    results = retriever.retrieve(_hybrid(date(1990, 1, 1), "soberania"))
+    assert results[0].text == "I - a soberania;"
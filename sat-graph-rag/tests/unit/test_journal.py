@@ -0,0 +1,151 @@
+"""Unit tests for resumable, idempotent amendment replay."""
+
+import json
+
+from src.graph.hierarchy import ComponentHierarchy
+from src.graph.journal import AmendmentJournal
+from src.graph.memory import InMemoryGraph
+from src.graph.temporal_engine import TemporalEngine
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+from tests.unit.test_temporal_engine import PARENTS, _responder
+
+CHANGES = [{"component_id": "art_1_par_1", "new_content": "novo", "change_type": "modify"}]
+
+
+def _engine(tmp_path, responder=_responder):
+    conn = FakeConnection(responder)
+    journal = AmendmentJournal(str(tmp_path / "journal.jsonl"))
+    engine = TemporalEngine(conn, ComponentHierarchy.from_parent_map(PARENTS), journal)
+    return conn, engine
+
+
+def test_journal_round_trip(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    AmendmentJournal(str(path)).record(1, "1992-03-31", CHANGES, {"new_ctvs": 3}, ["a_v2"])
+
+    journal = AmendmentJournal(str(path))
+    assert journal.is_committed(1)
+    assert not journal.is_committed(2)
+    entry = journal.entries()[1]
+    assert entry["changes"] == CHANGES
+    assert entry["ctv_ids"] == ["a_v2"]
+
+
+def test_journal_ignores_truncated_entry(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    path.write_text(
+        json.dumps({"amendment_number": 1}) + "\n" + '{"amendment_number": 2, "amen',
+        encoding="utf-8",
+    )
+    assert set(AmendmentJournal(str(path)).entries()) == {1}
+
+
+def test_engine_records_committed_amendment(tmp_path):
+    _, engine = _engine(tmp_path)
+    engine.apply_amendment(1, "1992-03-31", CHANGES, "EC 1")
+
+    entry = AmendmentJournal(str(tmp_path / "journal.jsonl")).entries()[1]
+    assert entry["stats"]["new_ctvs"] == 3
+    # changed component first, then its ancestors deepest first
+    assert entry["ctv_ids"] == ["art_1_par_1_v2", "art_1_v2", "tit_01_v2"]
+    assert not entry["recovered"]
+
+
+def _committed(query, params):
+    if "RETURN a.status AS status" in query:
+        return [{"status": "committed"}]
+    return _responder(query, params)
+
+
+def test_journaled_amendment_skips_the_write(tmp_path):
+    conn, engine = _engine(tmp_path, _committed)
+    engine.journal.record(1, "1992-03-31", CHANGES)
+
+    engine.apply_amendment(1, "1992-03-31", CHANGES, "EC 1")
+    # One read confirms the Action; no write transaction is opened
+    assert [q for q, _ in conn.log] == [TemporalEngine.ACTION_STATUS_QUERY]
+    assert conn.fake_session.transactions == 0
+    assert engine.already_applied == [1]
+    assert engine.stats["new_ctvs"] == 0
+
+
+def test_journaled_amendment_missing_from_graph_is_applied(tmp_path):
+    # e.g. the database was reset but the journal was kept
+    conn, engine = _engine(tmp_path)
+    engine.journal.record(1, "1992-03-31", CHANGES)
+
+    engine.apply_amendment(1, "1992-03-31", CHANGES, "EC 1")
+    assert engine.already_applied == []
+    assert engine.stats["new_ctvs"] == 3
+    assert conn.fake_session.transactions == 1
+
+
+def test_rotate_starts_an_empty_journal(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = AmendmentJournal(str(path))
+    assert journal.rotate() is None
+    journal.record(1, "1992-03-31", CHANGES)
+
+    old_id = journal.journal_id
+
+    rotated = journal.rotate()
+    assert rotated.parent == tmp_path and rotated.name.startswith("journal.")
+    assert AmendmentJournal(str(path)).journal_id == journal.journal_id != old_id
+    assert not journal.is_committed(1)
+    assert AmendmentJournal(str(rotated)).is_committed(1)
+    assert journal.record(2, "1995-08-15", CHANGES)["seq"] == 1
+
+
+def test_amendment_committed_in_graph_is_not_reapplied(tmp_path):
+    conn, engine = _engine(tmp_path, _committed)
+    engine.apply_amendment(1, "1992-03-31", CHANGES, "EC 1")
+
+    # Only the status check ran; the journal entry is backfilled
+    assert len(conn.log) == 1
+    assert engine.stats["new_ctvs"] == 0
+    assert engine.journal.entries()[1]["recovered"]
+
+
+def test_legacy_action_without_status_is_not_reapplied(tmp_path):
+    # Actions written before statuses were recorded have none
+    def responder(query, params):
+        if "RETURN a.status AS status" in query:
+            return [{"status": None}]
+        return _responder(query, params)
+
+    conn, engine = _engine(tmp_path, responder)
+    engine.journal.record(1, "1992-03-31", CHANGES)
+    engine.apply_amendment(1, "1992-03-31", CHANGES, "EC 1")
+    engine.apply_amendment(2, "1995-08-15", CHANGES, "EC 2")
+
+    assert engine.already_applied == [1, 2]
+    assert engine.stats["new_ctvs"] == 0
+    assert not any("CREATE (v:CTV" in query for query, _ in conn.log)
+
+
+def test_action_is_marked_committed_in_its_transaction(tmp_path):
+    conn, engine = _engine(tmp_path)
+    engine.apply_amendment(1, "1992-03-31", CHANGES, "EC 1")
+    assert any("a.status = 'committed'" in query for query, _ in conn.log)
+    assert conn.fake_session.transactions == 1
+
+
+def test_in_memory_reapply_is_a_no_op(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    engine = TemporalEngine(graph)
+    changes = [{"component_id": "tit_01_art_1", "new_content": "novo", "change_type": "modify"}]
+
+    engine.apply_amendment(1, "1992-03-31", changes)
+    ctvs = len(graph.ctvs)
+    engine.apply_amendment(1, "1992-03-31", changes)
+
+    assert len(graph.ctvs) == ctvs
+    assert engine.stats["actions_created"] == 1
+    assert engine.already_applied == [1]
+    assert graph.created_ctvs["ec_1"] == ["tit_01_art_1_v2", "tit_01_v2"]
@@ -0,0 +1,110 @@
+"""Unit tests for incremental JSON reading and the streaming loader."""
+
+import io
+import json
+
+import pytest
+
+from src.graph.loader import ConstitutionLoader
+from src.graph.streaming import StreamingConstitutionLoader
+from src.utils.json_stream import JsonEventStream, read_value, skip_value
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+DOCUMENT = {
+    "name": "Constituição",
+    "official_id": "CF1988",
+    "components": [
+        {"id": "a", "text": "Olá \"mundo\" \\ ção é", "n": -12.5e3, "k": 0},
+        {"flags": [True, False, None], "nested": {"x": [], "y": {}}},
+    ],
+    "total": 2,
+}
+
+
+class TestJsonEventStream:
+    """Tests for the JSON tokenizer."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+    def test_roundtrip_across_chunk_boundaries(self, chunk_size):
+        text = json.dumps(DOCUMENT, ensure_ascii=False, indent=2)
+        events = iter(JsonEventStream(io.StringIO(text), chunk_size=chunk_size))
+        assert read_value(events) == DOCUMENT
+
+    def test_event_sequence(self):
+        events = list(JsonEventStream(io.StringIO('{"a": [1, "b"]}')))
+        assert events == [
+            ("start_map", None),
+            ("map_key", "a"),
+            ("start_array", None),
+            ("number", 1),
+            ("string", "b"),
+            ("end_array", None),
+            ("end_map", None),
+        ]
+
+    def test_skip_value(self):
+        events = iter(JsonEventStream(io.StringIO('[{"a": [1, {"b": 2}]}, 3]'), chunk_size=2))
+        assert next(events) == ("start_array", None)
+        skip_value(events)
+        assert next(events) == ("number", 3)
+
+
+class TestStreamingLoader:
+    """Tests for the streaming constitution loader."""
+
+    def _write(self, tmp_path, components):
+        path = tmp_path / "constitution.json"
+        path.write_text(
+            json.dumps({"official_id": "CF1988", "components": components}, indent=2),
+            encoding="utf-8",
+        )
+        return str(path)
+
+    def test_stats_match_per_node_path(self, tmp_path):
+        path = self._write(tmp_path, SAMPLE_COMPONENTS)
+        expected = ConstitutionLoader(FakeConnection()).load_from_json(path)
+        streamed = StreamingConstitutionLoader(FakeConnection()).load_from_json(path, batch_size=2)
+        assert streamed == expected
+
+    def test_rows_stream_depth_first_with_parents(self, tmp_path):
+        path = self._write(tmp_path, SAMPLE_COMPONENTS)
+        conn = FakeConnection()
+        StreamingConstitutionLoader(conn).load_from_json(path, batch_size=100)
+        rows = next(p["rows"] for q, p in conn.log if "MERGE (c:Component" in q)
+        assert [(r["component_id"], r["parent_id"]) for r in rows] == [
+            ("tit_01", None),
+            ("tit_01_art_1", "tit_01"),
+            ("tit_01_art_1_inc_I", "tit_01_art_1"),
+            ("tit_01_art_2", "tit_01"),
+            ("tit_02", None),
+        ]
+
+    def test_fields_after_children_are_patched(self, tmp_path):
+        components = [{
+            "component_id": "tit_01",
+            "component_type": "title",
+            "full_text": "TÍTULO I",
+            "children": [],
+            "is_original": False,
+            "events": [{"amendment_number": 19}],
+        }]
+        conn = FakeConnection()
+        StreamingConstitutionLoader(conn).load_from_json(self._write(tmp_path, components))
+        patches = [p["rows"] for q, p in conn.log if q == StreamingConstitutionLoader.PATCH_QUERY]
+        assert patches == [[{
+            "component_id": "tit_01",
+            "component_type": "title",
+            "ordering_id": "",
+            "ctv_id": "tit_01_v1",
+            "is_original": False,
+            "amendment_numbers": [19],
+        }]]
+
+    def test_text_after_children_is_rejected(self, tmp_path):
+        components = [{"component_id": "tit_01", "children": [], "full_text": "late"}]
+        with pytest.raises(ValueError):
+            StreamingConstitutionLoader(FakeConnection()).load_from_json(
+                self._write(tmp_path, components)
+            )
@@ -0,0 +1,90 @@
+"""Unit tests for the BM25 keyword index."""
+
+import json
+
+from src.graph.memory import InMemoryGraph
+from src.rag.lexical import LexicalIndex, tokenize
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+DOCUMENTS = [
+    {"component_id": "art_5", "component_type": "article", "ctv_id": "art_5_v1",
+     "version_number": 1, "text": "Art. 5º Todos são iguais perante a lei."},
+    {"component_id": "art_6", "component_type": "article", "ctv_id": "art_6_v1",
+     "version_number": 1, "text": "Art. 6º São direitos sociais a educação, a saúde."},
+    {"component_id": "art_7", "component_type": "article", "ctv_id": "art_7_v1",
+     "version_number": 1, "text": "Art. 7º São direitos dos trabalhadores urbanos e rurais."},
+]
+
+
+def test_tokenize_folds_accents_and_drops_stopwords():
+    assert tokenize("Art. 5º São direitos da Saúde") == ["art", "5", "sao", "direitos", "saude"]
+
+
+def test_bm25_ranks_rarer_terms_higher():
+    index = LexicalIndex.from_documents(DOCUMENTS)
+    hits = index.search("saude direitos", top_k=10)
+    assert [doc["component_id"] for doc, _ in hits] == ["art_6", "art_7"]
+    assert hits[0][1] > hits[1][1] > 0
+    # any order, any accents
+    assert index.search("direitos SAÚDE")[0][0]["component_id"] == "art_6"
+    assert index.search("educação inexistente")[0][0]["component_id"] == "art_6"
+    assert index.search("de a") == []
+
+
+def test_add_and_remove_update_postings():
+    index = LexicalIndex.from_documents(DOCUMENTS)
+    index.add({**DOCUMENTS[1], "ctv_id": "art_6_v2", "text": "Art. 6º alimentação e moradia"})
+    assert index.search("educacao") == []
+    assert index.search("moradia")[0][0]["ctv_id"] == "art_6_v2"
+    index.remove("art_6")
+    assert index.search("moradia") == []
+    assert len(index) == 2
+
+
+def test_refresh_reads_only_changed_components():
+    # component_id -> (ctv_id, content_hash)
+    current = {d["component_id"]: (d["ctv_id"], "h1") for d in DOCUMENTS}
+
+    def responder(query, params):
+        if "$comp_ids" in query:
+            ids = params["comp_ids"] or list(current)
+            docs = {d["component_id"]: d for d in DOCUMENTS}
+            return [
+                {**docs[c], "ctv_id": current[c][0], "content_hash": current[c][1],
+                 "text": f"{c} {current[c][0]} {current[c][1]}"}
+                for c in ids
+            ]
+        return [{"component_id": c, "ctv_id": v, "content_hash": h}
+                for c, (v, h) in current.items()]
+
+    conn = FakeConnection(responder)
+    index = LexicalIndex(conn).load()
+    current["art_6"] = ("art_6_v2", "h1")
+    current["art_5"] = ("art_5_v1", "republished")  # text relinked, same version
+    del current["art_7"]
+    index.invalidate()
+
+    assert index.search("art_6_v2")[0][0]["component_id"] == "art_6"
+    assert index.search("republished")[0][0]["component_id"] == "art_5"
+    reads = [p["comp_ids"] for q, p in conn.log if "$comp_ids" in q]
+    assert reads == [None, ["art_5", "art_6"]]
+    assert len(index) == 2  # art_7 no longer has a current version
+
+
+def test_in_memory_index_follows_amendments(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    index = LexicalIndex(graph)
+    assert index.search("soberania")[0][0]["component_id"] == "tit_01_art_1_inc_I"
+
+    change = {"component_id": "tit_01_art_1_inc_I", "new_content": "I - a cidadania;",
+              "change_type": "modify"}
+    graph.apply_amendment(1, "1992-03-31", [change])
+    index.invalidate()
+    assert index.search("soberania") == []
+    assert index.search("cidadania")[0][0]["ctv_id"] == "tit_01_art_1_inc_I_v2"
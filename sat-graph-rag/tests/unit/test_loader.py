@@ -0,0 +1,172 @@
+"""Unit tests for the constitution loader's bulk path."""
+
+from src.graph.loader import (
+    ConstitutionLoader,
+    balance_shards,
+    compute_content_hash,
+    iter_component_rows,
+)
+from tests.unit.fakes import FakeConnection
+
+
+SAMPLE_COMPONENTS = [
+    {
+        "component_type": "title",
+        "component_id": "tit_01",
+        "ordering_id": "01",
+        "full_text": "TÍTULO I Dos Princípios Fundamentais",
+        "children": [
+            {
+                "component_type": "article",
+                "component_id": "tit_01_art_1",
+                "ordering_id": "1",
+                "header": "Art. 1º",
+                "content": "A República Federativa do Brasil...",
+                "full_text": "Art. 1º A República Federativa do Brasil...",
+                "children": [
+                    {
+                        "component_type": "item",
+                        "component_id": "tit_01_art_1_inc_I",
+                        "ordering_id": "I",
+                        "full_text": "I - a soberania;",
+                    },
+                ],
+            },
+            {
+                "component_type": "article",
+                "component_id": "tit_01_art_2",
+                "ordering_id": "2",
+                "full_text": "Art. 2º São Poderes da União...",
+                "is_original": False,
+                "events": [{"amendment_number": 45}],
+            },
+        ],
+    },
+    {
+        "component_type": "title",
+        "component_id": "tit_02",
+        "ordering_id": "02",
+        "full_text": "TÍTULO II",
+    },
+]
+
+
+class TestComponentRows:
+    """Tests for tree flattening."""
+
+    def test_rows_are_depth_first(self):
+        rows = list(iter_component_rows(SAMPLE_COMPONENTS, "CF1988", "1988-10-05"))
+        assert [r["component_id"] for r in rows] == [
+            "tit_01",
+            "tit_01_art_1",
+            "tit_01_art_1_inc_I",
+            "tit_01_art_2",
+            "tit_02",
+        ]
+
+    def test_row_ids_match_per_node_path(self):
+        rows = list(iter_component_rows(SAMPLE_COMPONENTS, "CF1988", "1988-10-05"))
+        item = rows[2]
+        assert item["ctv_id"] == "tit_01_art_1_inc_I_v1"
+        assert item["clv_id"] == "tit_01_art_1_inc_I_v1_pt"
+        assert item["text_id"] == "tit_01_art_1_inc_I_v1_pt_text"
+        assert item["parent_id"] == "tit_01_art_1"
+        assert item["parent_ctv_id"] == "tit_01_art_1_v1"
+        assert item["content_hash"] == compute_content_hash("I - a soberania;")
+
+    def test_ordering_and_events(self):
+        rows = list(iter_component_rows(SAMPLE_COMPONENTS, "CF1988", "1988-10-05"))
+        by_id = {r["component_id"]: r for r in rows}
+        assert by_id["tit_01_art_2"]["ordering"] == 2
+        assert by_id["tit_01_art_2"]["amendment_numbers"] == [45]
+        assert by_id["tit_01_art_2"]["is_original"] is False
+        assert by_id["tit_02"]["parent_ctv_id"] is None
+
+
+class TestBulkLoad:
+    """Tests for the batched UNWIND load."""
+
+    def _load(self, bulk, batch_size=None, tmp_path=None):
+        import json
+
+        path = tmp_path / "constitution.json"
+        path.write_text(
+            json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+            encoding="utf-8",
+        )
+        conn = FakeConnection()
+        loader = ConstitutionLoader(conn)
+        stats = loader.load_from_json(str(path), bulk=bulk, batch_size=batch_size)
+        return stats, conn
+
+    def test_bulk_stats_match_per_node_stats(self, tmp_path):
+        per_node, _ = self._load(bulk=False, tmp_path=tmp_path)
+        bulk, _ = self._load(bulk=True, batch_size=2, tmp_path=tmp_path)
+        assert bulk == per_node
+
+    def test_bulk_uses_one_transaction_per_batch(self, tmp_path):
+        _, conn = self._load(bulk=True, batch_size=2, tmp_path=tmp_path)
+        # 5 components in batches of 2
+        assert conn.fake_session.transactions == 3
+
+    def test_bulk_sends_all_rows(self, tmp_path):
+        _, conn = self._load(bulk=True, batch_size=100, tmp_path=tmp_path)
+        unwinds = [p for q, p in conn.log if "UNWIND $rows" in q]
+        assert len(unwinds) == len(ConstitutionLoader.BULK_STATEMENTS)
+        assert all(len(p["rows"]) == 5 for p in unwinds)
+
+    def test_parallel_stats_match_per_node_stats(self, tmp_path):
+        per_node, _ = self._load(bulk=False, tmp_path=tmp_path)
+        conn = FakeConnection()
+        parallel = ConstitutionLoader(conn).load_parallel(
+            str(tmp_path / "constitution.json"), max_workers=2, batch_size=2
+        )
+        assert parallel == per_node
+
+    def test_parallel_workers_skip_norm_links(self, tmp_path):
+        self._load(bulk=False, tmp_path=tmp_path)
+        conn = FakeConnection()
+        ConstitutionLoader(conn).load_parallel(str(tmp_path / "constitution.json"), max_workers=2)
+        norm_links = [p for q, p in conn.log if "MATCH (n:Norm" in q and "UNWIND" in q]
+        assert len(norm_links) == 1
+        assert [r["component_id"] for r in norm_links[0]["rows"]] == ["tit_01", "tit_02"]
+
+
+class TestTextUnitDeduplication:
+    """Tests for content-addressed TextUnits."""
+
+    def test_identical_text_counted_once(self, tmp_path):
+        import json
+
+        components = [
+            {"component_id": "tit_01", "full_text": "(Revogado)"},
+            {"component_id": "tit_02", "full_text": "(Revogado)"},
+        ]
+        path = tmp_path / "constitution.json"
+        path.write_text(json.dumps({"components": components}), encoding="utf-8")
+
+        per_node = ConstitutionLoader(FakeConnection()).load_from_json(str(path))
+        bulk = ConstitutionLoader(FakeConnection()).load_from_json(str(path), bulk=True)
+        assert per_node["text_units"] == 1
+        assert per_node["clvs"] == 2
+        assert bulk == per_node
+
+    def test_text_units_merge_on_hash(self):
+        query = dict((n, q) for n, q, _ in ConstitutionLoader.BULK_STATEMENTS)["text_units"]
+        assert "MERGE (t:TextUnit {content_hash: row.content_hash})" in query
+
+
+class TestBalanceShards:
+    """Tests for splitting Titles across workers."""
+
+    def test_largest_subtrees_spread_across_shards(self):
+        shards = balance_shards(SAMPLE_COMPONENTS, 2)
+        assert [[o for o, _ in shard] for shard in shards] == [[1], [2]]
+
+    def test_more_shards_than_titles(self):
+        shards = balance_shards(SAMPLE_COMPONENTS, 8)
+        assert len(shards) == 2
+
+    def test_orderings_preserved(self):
+        shards = balance_shards(SAMPLE_COMPONENTS, 1)
+        assert sorted(o for o, _ in shards[0]) == [1, 2]
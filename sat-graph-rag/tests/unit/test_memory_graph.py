@@ -0,0 +1,106 @@
+"""Unit tests for the in-memory graph backend."""
+
+import json
+from datetime import date
+
+import pytest
+
+from src.baseline.flat_rag import FlatChunkRAG
+from src.graph.memory import InMemoryGraph
+from src.graph.temporal_engine import TemporalEngine
+from src.rag.planner import QueryPlan, QueryType
+from src.rag.retriever import HybridRetriever
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+@pytest.fixture
+def graph(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    engine = TemporalEngine(graph)
+    engine.apply_amendment(1, "1992-03-31", [
+        {"component_id": "tit_01_art_1", "new_content": "Art. 1º novo", "change_type": "modify"},
+    ])
+    engine.apply_amendment(2, "1995-08-15", [
+        {"component_id": "tit_01_art_1", "new_content": "Art. 1º de 1995", "change_type": "modify"},
+    ])
+    return graph
+
+
+def _plan(query_type, **kwargs):
+    return QueryPlan(query_type=query_type, original_query="", **kwargs)
+
+
+def test_engine_counts_per_amendment_stats(graph):
+    engine = TemporalEngine(graph)
+    stats = engine.apply_amendment(3, "2000-01-01", [
+        {"component_id": "tit_01_art_2", "new_content": "Art. 2º novo", "change_type": "modify"},
+    ])
+    assert stats["new_ctvs"] == 2
+    assert stats["reused_ctvs"] == 1  # tit_01_art_1_v3 from 1995
+    assert stats["actions_created"] == 1
+
+
+def test_point_in_time_component(graph):
+    retriever = HybridRetriever(graph)
+    for day, version, text in [
+        (date(1990, 1, 1), 1, "Art. 1º A República Federativa do Brasil..."),
+        (date(1993, 1, 1), 2, "Art. 1º novo"),
+        (date(2020, 1, 1), 3, "Art. 1º de 1995"),
+    ]:
+        results = retriever.retrieve(_plan(
+            QueryType.POINT_IN_TIME, target_date=day, target_component="art_1",
+        ))
+        assert len(results) == 1
+        assert results[0].component_id == "tit_01_art_1"
+        assert results[0].version_info["version"] == version
+        assert results[0].text == text
+
+
+def test_point_in_time_roots(graph):
+    results = HybridRetriever(graph).retrieve(
+        _plan(QueryType.POINT_IN_TIME, target_date=date(1993, 1, 1))
+    )
+    assert [r.component_id for r in results] == ["tit_01", "tit_02"]
+    assert results[0].version_info == {"version": 2, "start": "1992-03-31", "end": "1995-08-15"}
+
+
+def test_provenance_by_amendment_includes_previous_text(graph):
+    results = HybridRetriever(graph).retrieve(_plan(QueryType.PROVENANCE, amendment_number=2))
+    assert [r.component_id for r in results] == ["tit_01_art_1"]
+    assert results[0].provenance["previous_text"] == "Art. 1º novo"
+    assert results[0].provenance["date"] == "1995-08-15"
+
+
+def test_provenance_history_newest_first(graph):
+    results = HybridRetriever(graph).retrieve(
+        _plan(QueryType.PROVENANCE, target_component="tit_01_art_1")
+    )
+    assert [r.version_info["version"] for r in results] == [3, 2, 1]
+    assert results[0].version_info["previous_version"] == 2
+
+
+def test_text_search_ranks_active_versions_only(graph):
+    retriever = HybridRetriever(graph)
+    results = retriever.retrieve(_plan(QueryType.SEMANTIC, semantic_query="1995 art"))
+    assert results[0].component_id == "tit_01_art_1"
+    assert results[0].relevance_score > results[1].relevance_score
+    assert retriever.retrieve(_plan(QueryType.SEMANTIC, semantic_query="novo")) == []
+
+
+def test_flat_baseline_indexes_current_text(graph):
+    baseline = FlatChunkRAG(graph)
+    texts = {c["id"]: c["text"] for c in baseline.chunks}
+    assert texts["tit_01_art_1"] == "Art. 1º de 1995"
+    assert "tit_01" not in texts
+    assert baseline.retrieve("1995")[0].component_id == "tit_01_art_1"
+
+
+def test_session_is_not_supported(graph):
+    with pytest.raises(TypeError, match="does not run Cypher"):
+        with graph.session():
+            pass
@@ -0,0 +1,153 @@
+"""Unit tests for the in-memory aggregation model and offline history build."""
+
+import json
+
+from src.graph.amendments import build_article_mapping, changes_for_amendment
+from src.graph.loader import iter_component_rows
+from src.graph.model import TemporalGraphModel
+from src.graph.offline_builder import OfflineHistoryBuilder
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+AMENDMENTS = [
+    {"number": 1, "date": "1992-03-31", "articles_modified": ["1"]},
+    {"number": 2, "date": "1992-08-25", "articles_repealed": ["2"]},
+    {"number": 3, "date": "1993-03-17", "articles_modified": ["999"]},
+]
+
+
+def _model():
+    model = TemporalGraphModel()
+    model.add_rows(iter_component_rows(SAMPLE_COMPONENTS, "CF1988", "1988-10-05"))
+    return model
+
+
+def _modify(comp_id, content="novo"):
+    return {"component_id": comp_id, "new_content": content, "change_type": "modify"}
+
+
+class TestAmendmentHelpers:
+    """Tests for the shared article mapping and change lists."""
+
+    def test_mapping_uses_ordering_and_id(self):
+        mapping = build_article_mapping([
+            {"component_id": "tit_01_art_5", "ordering_id": "5º"},
+        ])
+        assert mapping == {"5º": "tit_01_art_5", "5": "tit_01_art_5"}
+
+    def test_changes_in_modify_add_repeal_order(self):
+        changes = changes_for_amendment(
+            {"number": 7, "articles_repealed": ["2"], "articles_added": ["1"],
+             "articles_modified": ["9"]},
+            {"1": "art_1", "2": "art_2"},
+        )
+        assert [(c["component_id"], c["change_type"]) for c in changes] == [
+            ("art_1", "modify"), ("art_2", "repeal"),
+        ]
+        assert changes[0]["new_content"] == "Added/Modified by EC 7"
+
+
+class TestTemporalGraphModel:
+    """Tests for amendments applied with the engine's rules."""
+
+    def test_changed_component_and_ancestors_get_new_versions(self):
+        model = _model()
+        stats = model.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1_inc_I")])
+
+        assert stats["new_ctvs"] == 3  # item, article, title
+        assert stats["closed_ctvs"] == 3
+        assert stats["actions_created"] == 1
+        assert model.active_version("tit_01")["ctv_id"] == "tit_01_v2"
+        assert model.ctvs["tit_01_art_1_v1"]["date_end"] == "1992-03-31"
+        assert model.supersedes["tit_01_art_1_inc_I_v2"] == "tit_01_art_1_inc_I_v1"
+        assert model.resulted_in["ec_1"] == ["tit_01_art_1_inc_I_v2"]
+
+    def test_unchanged_siblings_are_reused(self):
+        model = _model()
+        stats = model.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1_inc_I")])
+
+        # art_1 aggregates the new item; tit_01 aggregates new art_1 + reused art_2
+        assert stats["new_aggregations"] == 3
+        assert stats["reused_ctvs"] == 1
+        assert model.aggregates["tit_01_v2"] == [
+            (1, "tit_01_art_1_v2"), (2, "tit_01_art_2_v1"),
+        ]
+
+    def test_ancestors_share_previous_text(self):
+        model = _model()
+        model.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1")])
+
+        assert model.text_for("tit_01_v2") is model.text_for("tit_01_v1")
+        # No new CLV: the propagated version is expressed by the previous one
+        assert model.expressed_in["tit_01_v2"] == "tit_01_v1_pt"
+        assert "tit_01_v2_pt" not in model.clvs
+        assert model.text_for("tit_01_art_1_v2")["full_text"] == "novo"
+
+    def test_repeal_has_no_text(self):
+        model = _model()
+        model.apply_amendment(1, "1992-03-31", [
+            {"component_id": "tit_01_art_2", "new_content": "", "change_type": "repeal"},
+        ])
+        assert model.ctvs["tit_01_art_2_v2"]["is_repealed"] is True
+        assert model.text_for("tit_01_art_2_v2") is None
+
+    def test_repeated_change_creates_one_version_each(self):
+        model = _model()
+        model.apply_amendment(1, "1992-03-31", [
+            _modify("tit_01_art_2", "a"), _modify("tit_01_art_2", "b"),
+        ])
+        assert model.active_version("tit_01_art_2")["ctv_id"] == "tit_01_art_2_v3"
+        # The title is still only updated once per amendment
+        assert model.active_version("tit_01")["ctv_id"] == "tit_01_v2"
+
+    def test_missing_component_is_skipped(self):
+        model = _model()
+        stats = model.apply_amendment(1, "1992-03-31", [_modify("tit_09_art_9")])
+        assert stats["new_ctvs"] == 0
+        assert stats["actions_created"] == 1
+
+
+class TestOfflineHistoryBuilder:
+    """Tests for the replay and bulk write."""
+
+    def _build(self, tmp_path, conn=None):
+        constitution = tmp_path / "constitution.json"
+        constitution.write_text(
+            json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+            encoding="utf-8",
+        )
+        amendments = tmp_path / "parsed_amendments.json"
+        amendments.write_text(json.dumps(AMENDMENTS), encoding="utf-8")
+
+        builder = OfflineHistoryBuilder(conn)
+        builder.build(str(constitution), str(amendments))
+        return builder
+
+    def test_replay_skips_amendments_without_changes(self, tmp_path):
+        builder = self._build(tmp_path)
+        assert builder.summary == {"amendments": 3, "applied": 2, "skipped": 1}
+        assert builder.model.stats["actions_created"] == 2
+        assert builder.model.active_version("tit_01")["ctv_id"] == "tit_01_v3"
+
+    def test_write_emits_every_new_node_once(self, tmp_path):
+        conn = FakeConnection()
+        builder = self._build(tmp_path, conn)
+        written = builder.write(batch_size=2)
+        model = builder.model
+
+        assert written["base"] == len(model.components)
+        assert written["new_ctvs"] == model.stats["new_ctvs"]
+        assert written["closed_ctvs"] == model.stats["closed_ctvs"]
+        # CURRENT moves to the latest version of every changed component
+        assert written["current"] == len(
+            {v["component_id"] for v in model.ctvs.values() if v["version_number"] > 1}
+        )
+        assert written["supersedes"] == model.stats["new_ctvs"]
+        assert written["aggregates"] == model.stats["new_aggregations"]
+        assert written["actions"] == 2
+        # Both tit_01 versions reuse v1's CLV; only the modified article has new text
+        assert written["shared_clvs"] == 2
+        assert written["texts"] == 1
+        # One transaction per batch of 2 rows
+        assert conn.fake_session.transactions == sum((n + 1) // 2 for n in written.values())
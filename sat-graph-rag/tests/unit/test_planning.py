@@ -0,0 +1,101 @@
+"""Unit tests for dry-run amendment planning."""
+
+import copy
+
+import pytest
+
+from src.graph.loader import compute_content_hash, iter_component_rows
+from src.graph.memory import InMemoryGraph
+from src.graph.temporal_engine import TemporalEngine
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+@pytest.fixture
+def engine():
+    graph = InMemoryGraph()
+    graph.add_rows(iter_component_rows(SAMPLE_COMPONENTS, "CF1988", "1988-10-05"))
+    return TemporalEngine(graph)
+
+
+CHANGES = [
+    {"component_id": "tit_01_art_1_inc_I", "new_content": "I - nova", "change_type": "modify"},
+    {"component_id": "tit_01_art_2", "new_content": "", "change_type": "repeal"},
+]
+
+
+def test_plan_matches_applied_stats(engine):
+    plan = engine.plan_amendment(1, "1992-03-31", CHANGES)
+    stats = engine.apply_amendment(1, "1992-03-31", CHANGES)
+
+    assert len(plan.new_ctvs) == stats["new_ctvs"]
+    assert len(plan.closed_ctvs) == stats["closed_ctvs"]
+    assert len(plan.new_aggregations) == stats["new_aggregations"]
+    assert plan.reused_ctvs == stats["reused_ctvs"]
+    assert set(plan.new_ctvs) == {
+        "tit_01_art_1_inc_I_v2", "tit_01_art_2_v2", "tit_01_art_1_v2", "tit_01_v2",
+    }
+
+
+def test_plan_writes_nothing(engine):
+    before = copy.deepcopy(engine.conn.ctvs)
+    engine.plan_amendment(1, "1992-03-31", CHANGES)
+    assert engine.conn.ctvs == before
+    assert engine.conn.actions == {}
+
+
+def test_plan_lists_edges_and_new_text(engine):
+    plan = engine.plan_amendment(1, "1992-03-31", CHANGES)
+    assert ("tit_01_v2", "tit_01_art_2_v2", 2) in plan.new_aggregations
+    assert plan.new_text_units == [compute_content_hash("I - nova")]
+    assert plan.affected_ancestors == ["tit_01_art_1", "tit_01"]
+
+    # Existing text is not counted as a new TextUnit
+    plan = engine.plan_amendment(1, "1992-03-31", [
+        {"component_id": "tit_01_art_2", "new_content": "I - a soberania;"},
+    ])
+    assert plan.new_text_units == []
+    assert plan.new_clvs == 1
+
+
+def test_estimate_and_budget(engine):
+    plan = engine.plan_amendment(1, "1992-03-31", CHANGES)
+    writes = plan.estimated_writes
+    # Action + 4 CTVs + 1 CLV + 1 TextUnit
+    assert writes["nodes"] == 7
+    assert writes["properties"] == 8
+    assert writes["total"] == writes["nodes"] + writes["relationships"] + writes["properties"]
+    assert plan.exceeds(max_new_ctvs=3)
+    assert not plan.exceeds(max_new_ctvs=4, max_writes=writes["total"])
+
+
+def test_missing_components_reported(engine):
+    plan = engine.plan_amendment(1, "1992-03-31", [{"component_id": "tit_09"}])
+    assert plan.missing_components == ["tit_09"]
+    assert plan.new_ctvs == []
+
+
+def test_neo4j_plan_uses_read_transaction_only():
+    parents = {"tit_01": None, "art_1": "tit_01", "art_2": "tit_01"}
+
+    def responder(query, params):
+        if "AS parent_id" in query:
+            return [{"component_id": c, "parent_id": p} for c, p in parents.items()]
+        if "AS children" in query:
+            return [
+                {
+                    "comp_id": c, "ctv_id": f"{c}_v1", "version_number": 1,
+                    "date_start": "1988-10-05",
+                    "children": [["art_1", 1], ["art_2", 2]] if c == "tit_01" else [],
+                }
+                for c in params["comp_ids"]
+            ]
+        return []
+
+    conn = FakeConnection(responder)
+    plan = TemporalEngine(conn).plan_amendment(1, "1992-03-31", [
+        {"component_id": "art_1", "new_content": "novo", "change_type": "modify"},
+    ])
+    assert conn.fake_session.transactions == 0
+    assert plan.new_aggregations == [("tit_01_v2", "art_1_v2", 1), ("tit_01_v2", "art_2_v1", 2)]
+    assert plan.reused_ctvs == 1
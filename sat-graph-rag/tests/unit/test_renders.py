@@ -0,0 +1,67 @@
+"""Unit tests for the per-epoch constitution renders."""
+
+import json
+
+from src.graph.memory import InMemoryGraph
+from src.graph.renders import EpochRenderer, RenderStore
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+def _graph(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    graph.apply_amendment(1, "1992-03-31", [
+        {"component_id": "tit_01_art_2", "new_content": "Art. 2º novo", "change_type": "modify"},
+    ])
+    return graph
+
+
+def test_renders_follow_aggregation_order(tmp_path):
+    graph = _graph(tmp_path)
+    stats = EpochRenderer(graph, str(tmp_path / "renders")).build()
+    assert stats["epochs"] == 2
+    store = RenderStore(str(tmp_path / "renders"))
+
+    assert store.read_at("1988-10-04") is None
+    assert store.read_at("1990-01-01").splitlines() == [
+        "TÍTULO I Dos Princípios Fundamentais",
+        "Art. 1º A República Federativa do Brasil...",
+        "I - a soberania;",
+        "Art. 2º São Poderes da União...",
+        "TÍTULO II",
+    ]
+    assert "Art. 2º novo" in store.read_at("2020-01-01")
+
+
+def test_unchanged_subtrees_are_shared(tmp_path):
+    graph = _graph(tmp_path)
+    stats = EpochRenderer(graph, str(tmp_path / "renders")).build()
+    store = RenderStore(str(tmp_path / "renders"))
+
+    old, new = (dict(store.manifest(epoch)["parts"]) for epoch in (0, 1))
+    # only the amended article gets a new part; the Title's own text is unchanged
+    assert old["tit_01_art_1_v1"] == new["tit_01_art_1_v1"]
+    assert old["tit_01_v1"] == new["tit_01_v2"]
+    assert "tit_01_art_2_v2" in new
+    assert stats["parts"] == len(set(old.values()) | set(new.values()))
+
+    diff = store.diff(0, 1)
+    assert "-Art. 2º São Poderes da União..." in diff
+    assert "+Art. 2º novo" in diff
+    assert not any("soberania" in line for line in diff)
+
+
+def test_rebuild_writes_only_new_parts(tmp_path):
+    graph = _graph(tmp_path)
+    directory = str(tmp_path / "renders")
+    EpochRenderer(graph, directory).build()
+
+    graph.revert_amendment(1)
+    stats = EpochRenderer(graph, directory).build()
+    assert stats == {"epochs": 1, "parts": 4, "parts_written": 0, "parts_pruned": 1}
+    assert not (tmp_path / "renders" / "epochs" / "1.json").exists()
+    assert RenderStore(directory).read_at("2020-01-01").endswith("TÍTULO II")
@@ -0,0 +1,169 @@
+"""Unit tests for diff-based constitution resync."""
+
+import pytest
+
+from src.graph.hierarchy import ComponentHierarchy
+from src.graph.journal import AmendmentJournal
+from src.graph.loader import compute_content_hash, iter_component_rows
+from src.graph.resync import ConstitutionResync, diff_components
+from src.graph.temporal_engine import TemporalEngine
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+def _rows(components=SAMPLE_COMPONENTS):
+    return list(iter_component_rows(components, "CF1988", "1988-10-05"))
+
+
+def _state(rows):
+    """Graph state as it looks right after loading these rows."""
+    return {
+        r["component_id"]: {
+            "active": True,
+            "content_hash": r["content_hash"],
+            "parent_id": r["parent_id"],
+            "ordering": r["ordering"] if r["parent_id"] else None,
+            "component_type": r["component_type"],
+            "ordering_id": r["ordering_id"],
+            "date_start": "1988-10-05",
+            "date_end": None,
+        }
+        for r in rows
+    }
+
+
+def test_identical_tree_has_no_changes():
+    rows = _rows()
+    state = _state(rows)
+    diff = diff_components(state, rows)
+    assert diff.is_empty
+    assert diff.unchanged == len(rows)
+
+
+def test_text_change_detected_by_hash():
+    rows = _rows()
+    state = _state(rows)
+    rows[1]["full_text"] = "Art. 1º texto republicado"
+    rows[1]["content_hash"] = compute_content_hash(rows[1]["full_text"])
+
+    diff = diff_components(state, rows)
+    assert [r["component_id"] for r in diff.text_changed] == ["tit_01_art_1"]
+    assert diff.structure_changed == []
+    assert diff.summary()["changed"] == ["tit_01_art_1"]
+
+
+def test_added_removed_and_moved():
+    rows = _rows()
+    state = _state(rows)
+    state["tit_01_art_99"] = {"active": True, "content_hash": "x", "parent_id": "tit_01"}
+    state["tit_01_art_2"]["ordering"] = 5
+    state.pop("tit_01_art_1_inc_I")
+
+    diff = diff_components(state, rows)
+    assert [r["component_id"] for r in diff.added] == ["tit_01_art_1_inc_I"]
+    assert diff.removed == ["tit_01_art_99"]
+    assert [r["component_id"] for r in diff.structure_changed] == ["tit_01_art_2"]
+
+
+def test_previously_removed_component_is_reactivated():
+    rows = _rows()
+    state = _state(rows)
+    state["tit_02"]["active"] = False
+    state["tit_old"] = {"active": False}
+
+    diff = diff_components(state, rows)
+    assert diff.reactivated == ["tit_02"]
+    # Components already closed are not reported as removed again
+    assert diff.removed == []
+
+
+def test_parents_of_structural_changes_get_new_versions():
+    rows = _rows()
+    state = _state(rows)
+    state["tit_01_art_99"] = {"active": True, "content_hash": "x", "parent_id": "tit_01_art_1"}
+    state.pop("tit_01_art_1_inc_I")
+
+    diff = diff_components(state, rows)
+    # deepest first: the article that lost and gained an item, then its title
+    assert diff.levels == [["tit_01_art_1"], ["tit_01"]]
+    assert diff.orderings == {"tit_01_art_1_inc_I": 1}
+    assert diff.summary()["propagated"] == 2
+
+
+def test_text_changes_are_versioned():
+    rows = _rows()
+    state = _state(rows)
+    rows[3]["content_hash"] = "republished"
+    state["tit_01_art_1"]["component_type"] = "paragraph"  # no new parent version
+
+    diff = diff_components(state, rows)
+    assert diff.levels == [["tit_01_art_2"], ["tit_01"]]
+    assert diff.summary()["propagated"] == 1
+    assert diff.latest_start == "1988-10-05"
+
+
+def test_text_change_writes_a_new_version_with_its_own_text(tmp_path):
+    rows = _rows()
+    state = _state(rows)
+    rows[3]["content_hash"] = "republished"
+    conn = FakeConnection()
+
+    resync = ConstitutionResync(conn)
+    resync.diff = lambda *args: diff_components(state, rows)
+    resync.resync(effective_date="2024-01-01")
+
+    queries = [q for q, _ in conn.log]
+    # closed and succeeded before the new version gets its own CLV and text
+    assert queries.index(ConstitutionResync.PROPAGATE_QUERY) < \
+        queries.index(ConstitutionResync.SPLIT_SHARED_CLV_QUERY) < \
+        queries.index(ConstitutionResync.TEXT_QUERY)
+    assert "DETACH DELETE old_text" in ConstitutionResync.TEXT_QUERY
+
+
+def test_effective_date_must_follow_the_superseded_versions():
+    rows = _rows()
+    state = _state(rows)
+    state["tit_01_art_2"]["date_start"] = "2024-01-01"
+    rows[3]["content_hash"] = "republished"
+
+    resync = ConstitutionResync(FakeConnection())
+    resync.diff = lambda *args: diff_components(state, rows)
+    with pytest.raises(ValueError, match="not after 2024-01-01"):
+        resync.resync(effective_date="2024-01-01")
+    resync.resync(effective_date="2024-01-02")
+
+
+def test_version_without_text_is_not_reported_as_changed():
+    rows = _rows()
+    state = _state(rows)
+    state["tit_01_art_2"]["content_hash"] = None  # repealed: no CLV
+
+    diff = diff_components(state, rows)
+    assert diff.text_changed == []
+    assert diff.is_empty
+
+
+def test_resync_writes_children_before_parents(tmp_path):
+    rows = _rows()
+    state = _state(rows)
+    state.pop("tit_01_art_1_inc_I")
+    state["tit_02"]["active"] = False
+    conn = FakeConnection()
+    journal = AmendmentJournal(str(tmp_path / "journal.jsonl"))
+    engine = TemporalEngine(conn, ComponentHierarchy.from_parent_map({}), journal)
+
+    resync = ConstitutionResync(engine=engine)
+    resync.diff = lambda *args: diff_components(state, rows)
+    summary = resync.resync(effective_date="2024-01-01")
+
+    assert summary["added"] == ["tit_01_art_1_inc_I"]
+    assert not engine.hierarchy.is_loaded  # structure changed: reloaded on next use
+    assert [e["effective_date"] for e in journal.events() if e.get("resync")] == ["2024-01-01"]
+    writes = [(q, p) for q, p in conn.log if p and "ids" in p]
+    assert [(q, p["ids"]) for q, p in writes] == [
+        (ConstitutionResync.PROPAGATE_QUERY, ["tit_01_art_1"]),
+        (ConstitutionResync.REACTIVATE_QUERY, ["tit_02"]),
+        (ConstitutionResync.PROPAGATE_QUERY, ["tit_01"]),
+    ]
+    aggregates = [p["rows"] for q, p in conn.log if "parent_ctv_id IS NOT NULL" in q]
+    assert aggregates == [[]]  # the item hangs off tit_01_art_1's new version
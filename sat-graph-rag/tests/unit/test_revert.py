@@ -0,0 +1,115 @@
+"""Unit tests for reverting an applied amendment."""
+
+import json
+
+import pytest
+
+from src.graph.hierarchy import ComponentHierarchy
+from src.graph.journal import AmendmentJournal
+from src.graph.memory import InMemoryGraph
+from src.graph.temporal_engine import TemporalEngine
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+from tests.unit.test_temporal_engine import PARENTS
+
+
+@pytest.fixture
+def graph(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    return InMemoryGraph.from_json(str(path))
+
+
+def _modify(comp_id, text):
+    return {"component_id": comp_id, "new_content": text, "change_type": "modify"}
+
+
+def test_revert_restores_previous_versions(graph):
+    engine = TemporalEngine(graph)
+    before = (len(graph.ctvs), len(graph.clvs), len(graph.text_units))
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "Art. 1º novo")])
+
+    result = engine.revert_amendment(1)
+
+    assert result == {"deleted_ctvs": 2, "reopened_ctvs": 2, "deleted_text_units": 1}
+    assert (len(graph.ctvs), len(graph.clvs), len(graph.text_units)) == before
+    assert graph.active_version("tit_01")["ctv_id"] == "tit_01_v1"
+    assert graph.active_version("tit_01_art_1")["date_end"] is None
+    assert not graph.is_committed(1)
+    assert graph.amendment_changes(1) == []
+
+
+def test_revert_keeps_text_units_still_in_use(graph):
+    engine = TemporalEngine(graph)
+    text = graph.text_for("tit_01_art_2_v1")["full_text"]
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", text)])
+
+    assert engine.revert_amendment(1)["deleted_text_units"] == 0
+    assert graph.text_for("tit_01_art_2_v1")["full_text"] == text
+
+
+def test_revert_refused_once_superseded(graph):
+    engine = TemporalEngine(graph)
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "a")])
+    engine.apply_amendment(2, "1995-08-15", [_modify("tit_01_art_2", "b")])
+
+    # EC 2 superseded EC 1's tit_01 version
+    with pytest.raises(ValueError):
+        engine.revert_amendment(1)
+    engine.revert_amendment(2)
+    engine.revert_amendment(1)
+    assert graph.active_version("tit_01")["ctv_id"] == "tit_01_v1"
+
+
+def test_reverted_amendment_can_be_reapplied(graph, tmp_path):
+    journal = AmendmentJournal(str(tmp_path / "journal.jsonl"))
+    engine = TemporalEngine(graph, journal=journal)
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "errado")])
+    engine.revert_amendment(1)
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "certo")])
+
+    assert graph.text_for("tit_01_art_1_v2")["full_text"] == "certo"
+    assert AmendmentJournal(journal.path).is_committed(1)
+
+
+def test_revert_in_neo4j_touches_only_the_footprint():
+    def responder(query, params):
+        if "collect(DISTINCT v.component_id)" in query:
+            return [{"components": ["art_1_par_1"]}]
+        if "next.ctv_id AS next_ctv_id" in query:
+            return [
+                {"ctv_id": f"{c}_v2", "prev_ctv_id": f"{c}_v1", "next_ctv_id": None}
+                for c in params["comp_ids"]
+            ]
+        if "collect(DISTINCT t.content_hash)" in query:
+            return [{"hashes": ["h1"]}]
+        if "RETURN count(t) AS deleted" in query:
+            return [{"deleted": 1}]
+        return []
+
+    conn = FakeConnection(responder)
+    engine = TemporalEngine(conn, ComponentHierarchy.from_parent_map(PARENTS))
+    result = engine.revert_amendment(1)
+
+    assert conn.fake_session.transactions == 1
+    footprint = next(p["comp_ids"] for q, p in conn.log if "next_ctv_id" in q)
+    assert footprint == ["art_1", "art_1_par_1", "tit_01"]  # not art_2
+    assert result == {"deleted_ctvs": 3, "reopened_ctvs": 3, "deleted_text_units": 1}
+
+
+def test_revert_in_neo4j_refused_when_superseded():
+    def responder(query, params):
+        if "collect(DISTINCT v.component_id)" in query:
+            return [{"components": ["art_2"]}]
+        if "next.ctv_id AS next_ctv_id" in query:
+            return [{"ctv_id": "tit_01_v2", "prev_ctv_id": "tit_01_v1", "next_ctv_id": "tit_01_v3"}]
+        return []
+
+    conn = FakeConnection(responder)
+    engine = TemporalEngine(conn, ComponentHierarchy.from_parent_map(PARENTS))
+    with pytest.raises(ValueError):
+        engine.revert_amendment(1)
+    assert not any("DETACH DELETE" in query for query, _ in conn.log)
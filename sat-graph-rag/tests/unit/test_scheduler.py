@@ -0,0 +1,117 @@
+"""Unit tests for concurrent amendment scheduling."""
+
+import copy
+import threading
+
+from src.graph.hierarchy import ComponentHierarchy
+from src.graph.loader import iter_component_rows
+from src.graph.memory import InMemoryGraph
+from src.graph.scheduler import AmendmentScheduler
+from src.graph.temporal_engine import TemporalEngine
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+PARENTS = {"tit_01": None, "art_1": "tit_01", "art_2": "tit_01", "tit_02": None, "art_3": "tit_02"}
+
+
+def _amendment(number, day, *comp_ids):
+    return {
+        "amendment_number": number,
+        "amendment_date": day,
+        "changes": [
+            {"component_id": c, "new_content": f"EC {number}", "change_type": "modify"}
+            for c in comp_ids
+        ],
+    }
+
+
+class RecordingEngine:
+    """Engine stand-in that records the order amendments are applied in."""
+
+    def __init__(self, on_apply=None):
+        self.conn = None
+        self.hierarchy = ComponentHierarchy.from_parent_map(PARENTS)
+        self.stats = {}
+        self.applied = []
+        self.on_apply = on_apply
+        self.lock = threading.Lock()
+
+    def apply_amendment(self, number, day, changes, description=""):
+        if self.on_apply:
+            self.on_apply(number)
+        with self.lock:
+            self.applied.append(number)
+        return self.stats
+
+
+def test_conflicting_amendments_depend_on_last_writer():
+    scheduler = AmendmentScheduler(RecordingEngine(), max_workers=4)
+    scheduled = scheduler.schedule([
+        _amendment(3, "1993-01-01", "art_1"),
+        _amendment(1, "1992-01-01", "art_1"),
+        _amendment(2, "1992-06-01", "art_3"),
+        _amendment(4, "1994-01-01", "art_2", "art_3"),
+    ])
+    assert [s.amendment_number for s in scheduled] == [1, 2, 3, 4]
+    assert scheduled[0].footprint == {"art_1", "tit_01"}
+    assert scheduled[1].depends_on == set()
+    assert scheduled[2].depends_on == {0}
+    assert scheduled[3].depends_on == {1, 2}
+
+
+def test_disjoint_amendments_run_concurrently():
+    started = {n: threading.Event() for n in (1, 2)}
+
+    def on_apply(number):
+        if number in started:
+            started[number].set()
+        # EC 1 only finishes once EC 2 (another Title) is running as well
+        if number == 1:
+            assert started[2].wait(timeout=5)
+
+    engine = RecordingEngine(on_apply)
+    result = AmendmentScheduler(engine, max_workers=2).run([
+        _amendment(1, "1992-01-01", "art_1"),
+        _amendment(2, "1992-06-01", "art_3"),
+        _amendment(3, "1993-01-01", "art_2"),
+    ])
+    assert sorted(result["applied"]) == [1, 2, 3]
+    assert engine.applied.index(1) < engine.applied.index(3)
+
+
+def test_failed_amendment_does_not_block_later_ones():
+    def on_apply(number):
+        if number == 1:
+            raise RuntimeError("boom")
+
+    engine = RecordingEngine(on_apply)
+    result = AmendmentScheduler(engine, max_workers=2).run([
+        _amendment(1, "1992-01-01", "art_1"),
+        _amendment(2, "1993-01-01", "art_2"),
+    ])
+    assert result["failed"] == {1: "boom"}
+    assert result["applied"] == [2]
+
+
+def test_result_matches_serial_replay():
+    amendments = [
+        _amendment(1, "1992-01-01", "tit_01_art_1_inc_I"),
+        _amendment(2, "1992-06-01", "tit_02"),
+        _amendment(3, "1993-01-01", "tit_01_art_2", "tit_01_art_1"),
+    ]
+
+    def graph():
+        g = InMemoryGraph()
+        g.add_rows(iter_component_rows(SAMPLE_COMPONENTS, "CF1988", "1988-10-05"))
+        return g
+
+    serial = TemporalEngine(graph())
+    for a in copy.deepcopy(amendments):
+        serial.apply_amendment(a["amendment_number"], a["amendment_date"], a["changes"])
+
+    scheduled = TemporalEngine(graph())
+    result = AmendmentScheduler(scheduled).run(amendments)
+
+    assert result["stats"] == serial.stats
+    assert scheduled.conn.ctvs == serial.conn.ctvs
+    assert scheduled.conn.aggregates == serial.conn.aggregates
@@ -0,0 +1,136 @@
+"""Unit tests for graph snapshots and rebuilds from the event log."""
+
+import json
+
+import pytest
+
+from src.graph.journal import AmendmentJournal
+from src.graph.memory import InMemoryGraph
+from src.graph.snapshot import SnapshotStore, restore_from_snapshot, take_snapshot
+from src.graph.temporal_engine import TemporalEngine
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+
+@pytest.fixture
+def setup(tmp_path):
+    """A live in-memory graph whose amendments are journaled."""
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    journal = AmendmentJournal(str(tmp_path / "journal.jsonl"))
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    engine = TemporalEngine(graph, journal=journal)
+    return graph, engine, journal, store, str(path)
+
+
+def _modify(comp_id, text):
+    return {"component_id": comp_id, "new_content": text, "change_type": "modify"}
+
+
+def _same_graph(a, b):
+    assert a.ctvs == b.ctvs
+    assert a.aggregates == b.aggregates
+    assert a.expressed_in == b.expressed_in
+    assert set(a.text_units) == set(b.text_units)
+    assert a.actions.keys() == b.actions.keys()
+
+
+def test_snapshot_round_trip(setup):
+    graph, engine, journal, store, json_path = setup
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "novo")], "EC 1")
+
+    path = take_snapshot(journal, store, json_path)
+    restored, seq, base_rows = store.load(path)
+
+    assert seq == 1
+    assert len(base_rows) == 5
+    _same_graph(restored, graph)
+    assert restored.point_in_time("1993-01-01", "tit_01_art_1") == \
+        graph.point_in_time("1993-01-01", "tit_01_art_1")
+
+
+def test_restore_replays_events_after_the_snapshot(setup):
+    graph, engine, journal, store, json_path = setup
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "novo")], "EC 1")
+    take_snapshot(journal, store, json_path)
+    engine.apply_amendment(2, "1995-08-15", [_modify("tit_01_art_2", "outro")], "EC 2")
+    engine.apply_amendment(3, "1996-01-01", [_modify("tit_02", "terceiro")], "EC 3")
+    engine.revert_amendment(3)
+
+    restored = restore_from_snapshot(journal, store, write=False)
+
+    _same_graph(restored, graph)
+    assert restored.is_committed(2)
+    assert not restored.is_committed(3)
+
+
+def test_snapshot_not_due(setup):
+    graph, engine, journal, store, json_path = setup
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "novo")])
+    assert take_snapshot(journal, store, json_path) is not None
+
+    engine.apply_amendment(2, "1995-08-15", [_modify("tit_01_art_2", "outro")])
+    assert take_snapshot(journal, store, json_path, min_events=2) is None
+    assert [seq for seq, _ in store.paths(journal.journal_id)] == [1]
+
+
+def test_restore_bulk_writes_the_graph(setup):
+    graph, engine, journal, store, json_path = setup
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "novo")])
+    take_snapshot(journal, store, json_path)
+
+    conn = FakeConnection()
+    restore_from_snapshot(journal, store, conn)
+
+    queries = [query for query, _ in conn.log]
+    assert any("MERGE (n:Norm" in q for q in queries)
+    assert any("a.status = row.status" in q for q in queries)
+
+
+def test_restore_without_snapshot_fails(setup):
+    _, _, journal, store, _ = setup
+    with pytest.raises(ValueError):
+        restore_from_snapshot(journal, store, write=False)
+
+
+def test_events_after_a_resync_are_not_replayed(setup):
+    graph, engine, journal, store, json_path = setup
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "novo")])
+    take_snapshot(journal, store, json_path)
+    journal.record_resync("2000-01-01", {"added": ["tit_03"]})
+    engine.apply_amendment(2, "2001-01-01", [_modify("tit_01_art_2", "outro")])
+
+    assert journal.is_committed(2) and journal.last_seq == 3
+    with pytest.raises(ValueError, match="resync"):
+        take_snapshot(journal, store, json_path)
+    with pytest.raises(ValueError, match="resync"):
+        restore_from_snapshot(journal, store, write=False)
+    assert [seq for seq, _ in store.paths(journal.journal_id)] == [1]
+
+
+def test_snapshots_of_a_rotated_journal_are_not_used(setup):
+    graph, engine, journal, store, json_path = setup
+    engine.apply_amendment(1, "1992-03-31", [_modify("tit_01_art_1", "novo")])
+    engine.apply_amendment(2, "1995-08-15", [_modify("tit_01_art_2", "outro")])
+    take_snapshot(journal, store, json_path)
+
+    # reset_database.py: wipe the graph, rotate the journal
+    journal.rotate()
+    with pytest.raises(ValueError, match="No snapshot"):
+        restore_from_snapshot(journal, store, write=False)
+
+    graph = InMemoryGraph.from_json(json_path)
+    engine = TemporalEngine(graph, journal=journal)
+    engine.apply_amendment(5, "2000-01-01", [_modify("tit_02", "quinto")])
+
+    # seq 1 of the new journal is below the old snapshot's seq 2
+    path = take_snapshot(journal, store, json_path)
+    assert path.name == f"snapshot_000001_{journal.journal_id}.json.gz"
+    restored = restore_from_snapshot(journal, store, write=False)
+    _same_graph(restored, graph)
+    assert restored.is_committed(5)
+    assert not restored.is_committed(1)
@@ -0,0 +1,141 @@
+"""Unit tests for the batched, single-transaction TemporalEngine."""
+
+from src.graph.hierarchy import ComponentHierarchy
+from src.graph.temporal_engine import TemporalEngine
+from tests.unit.fakes import FakeConnection
+
+# tit_01 -> art_1 -> art_1_par_1, tit_01 -> art_2
+PARENTS = {"tit_01": None, "art_1": "tit_01", "art_2": "tit_01", "art_1_par_1": "art_1"}
+
+
+def _responder(query, params):
+    """Answer the engine's read-back queries for a tiny hierarchy."""
+    if "RETURN row.component_id AS component_id" in query:
+        return [
+            {"component_id": r["component_id"], "ctv_id": f"{r['component_id']}_v2"}
+            for r in params["rows"] if r["component_id"] in PARENTS
+        ]
+    if "prev_ctv_id" in query and "RETURN comp_id" in query:
+        return [
+            {"component_id": c, "ctv_id": f"{c}_v2", "prev_ctv_id": f"{c}_v1"}
+            for c in params["comp_ids"]
+        ]
+    if "RETURN count(*) AS created" in query:
+        return [{"created": 2 * len(params["rows"]), "reused": len(params["rows"])}]
+    return []
+
+
+def _apply(changes, conn=None):
+    conn = conn or FakeConnection(_responder)
+    engine = TemporalEngine(conn, ComponentHierarchy.from_parent_map(PARENTS))
+    stats = engine.apply_amendment(1, "1992-03-31", changes, "EC 1")
+    return conn, stats
+
+
+def test_amendment_runs_in_one_transaction():
+    conn, stats = _apply([
+        {"component_id": "art_1_par_1", "new_content": "novo", "change_type": "modify"},
+        {"component_id": "art_2", "new_content": "novo", "change_type": "modify"},
+    ])
+    assert conn.fake_session.transactions == 1
+    assert stats["actions_created"] == 1
+    # 2 changed components + ancestors art_1 and tit_01
+    assert stats["new_ctvs"] == 4
+    assert stats["closed_ctvs"] == 4
+
+
+def test_ancestors_updated_deepest_level_first():
+    conn, _ = _apply([
+        {"component_id": "art_1_par_1", "new_content": "novo", "change_type": "modify"},
+    ])
+    levels = [
+        params["comp_ids"] for query, params in conn.log
+        if "created_by_action: 'amendment_propagation'" in query
+    ]
+    assert levels == [["art_1"], ["tit_01"]]
+
+
+def test_changed_components_batched_per_statement():
+    conn, _ = _apply([
+        {"component_id": "art_1", "new_content": "a", "change_type": "modify"},
+        {"component_id": "art_2", "new_content": "b", "change_type": "modify"},
+    ])
+    version_batches = [
+        params["rows"] for query, params in conn.log
+        if "created_by_action: 'amendment'," in query
+    ]
+    assert len(version_batches) == 1
+    assert {r["component_id"] for r in version_batches[0]} == {"art_1", "art_2"}
+
+
+def test_repeated_component_gets_one_version_per_change():
+    rounds = TemporalEngine._change_rounds([
+        {"component_id": "art_1"},
+        {"component_id": "art_2"},
+        {"component_id": "art_1"},
+    ])
+    assert [[c["component_id"] for c in r] for r in rounds] == [["art_1", "art_2"], ["art_1"]]
+
+
+def test_repeal_creates_no_text():
+    conn, _ = _apply([
+        {"component_id": "art_2", "new_content": "", "change_type": "repeal"},
+    ])
+    assert not any("MERGE (t:TextUnit" in query for query, _ in conn.log)
+
+
+def test_stats_not_counted_when_transaction_fails():
+    def failing(query, params):
+        if "RETURN count(*) AS created" in query:
+            raise RuntimeError("connection lost")
+        return _responder(query, params)
+
+    engine = TemporalEngine(FakeConnection(failing), ComponentHierarchy.from_parent_map(PARENTS))
+    try:
+        engine.apply_amendment(1, "1992-03-31", [
+            {"component_id": "art_2", "new_content": "novo", "change_type": "modify"},
+        ])
+    except RuntimeError:
+        pass
+    assert engine.stats["new_ctvs"] == 0
+    assert engine.stats["actions_created"] == 0
+
+
+def test_hierarchy_loaded_once_across_amendments():
+    def responder(query, params):
+        if "AS parent_id" in query:
+            return [{"component_id": c, "parent_id": p} for c, p in PARENTS.items()]
+        return _responder(query, params)
+
+    conn = FakeConnection(responder)
+    engine = TemporalEngine(conn)
+    for n in (1, 2):
+        engine.apply_amendment(n, "1992-03-31", [
+            {"component_id": "art_1_par_1", "new_content": "novo", "change_type": "modify"},
+        ])
+    assert sum("AS parent_id" in query for query, _ in conn.log) == 1
+    assert not any("HAS_CHILD*" in query for query, _ in conn.log)
+
+
+def test_propagated_versions_share_previous_clv():
+    conn, _ = _apply([
+        {"component_id": "art_1_par_1", "new_content": "novo", "change_type": "modify"},
+    ])
+    shared = [
+        query for query, _ in conn.log if "CREATE (new)-[:EXPRESSED_IN]->(prev_clv)" in query
+    ]
+    assert len(shared) == 2  # one per ancestor level
+    assert sum("CREATE (l:CLV" in query for query, _ in conn.log) == 1
+
+
+def test_current_version_found_through_current_link():
+    conn, _ = _apply([
+        {"component_id": "art_1_par_1", "new_content": "novo", "change_type": "modify"},
+    ])
+    versioning = [query for query, _ in conn.log if "CREATE (v)-[:SUPERSEDES]->(cur)" in query]
+    assert len(versioning) == 3  # the change, then one per ancestor level
+    for query in versioning:
+        assert "-[current:CURRENT]->(cur:CTV)" in query
+        assert "DELETE current" in query
+        assert "CREATE (c)-[:CURRENT]->(v)" in query
+    assert not any("{is_active: true}" in query for query, _ in conn.log)
@@ -0,0 +1,52 @@
+"""Unit tests for content-addressed TextUnit maintenance."""
+
+from src.graph.loader import compute_content_hash
+from src.graph.schema import SchemaManager
+from src.graph.text_store import backfill_content_hashes
+from tests.unit.fakes import FakeConnection
+
+
+def _responder(missing, updated):
+    """TextUnits without a hash, until `updated` says a write matched them."""
+    def responder(query, params):
+        if "RETURN elementId(t) AS element_id" in query:
+            return missing[:params["limit"]]
+        if "SET t.content_hash" in query:
+            count = updated(params["rows"])
+            del missing[:count]
+            return [{"updated": count}]
+        return []
+    return responder
+
+
+def test_backfill_updates_by_element_id():
+    missing = [{"element_id": f"4:x:{i}", "full_text": f"texto {i}"} for i in range(3)]
+    conn = FakeConnection(_responder(missing, len))
+
+    assert backfill_content_hashes(conn, batch_size=2) == 3
+    writes = [p["rows"] for q, p in conn.log if "SET t.content_hash" in q]
+    assert [len(rows) for rows in writes] == [2, 1]
+    assert writes[0][0] == {"element_id": "4:x:0", "content_hash": compute_content_hash("texto 0")}
+
+
+def test_backfill_stops_when_a_batch_updates_nothing():
+    missing = [{"element_id": "4:x:0", "full_text": None}]
+    conn = FakeConnection(_responder(missing, lambda rows: 0))
+
+    assert backfill_content_hashes(conn) == 0
+    assert conn.fake_session.transactions == 1
+
+
+def test_content_hash_constraint_waits_for_dedupe():
+    def responder(duplicates):
+        def respond(query, params):
+            return [{"duplicates": duplicates}] if "AS duplicates" in query else []
+        return respond
+
+    conn = FakeConnection(responder(3))
+    SchemaManager(conn).create_constraints()
+    assert SchemaManager.CONTENT_HASH_CONSTRAINT not in [q for q, _ in conn.log]
+
+    conn = FakeConnection(responder(0))
+    SchemaManager(conn).create_constraints()
+    assert SchemaManager.CONTENT_HASH_CONSTRAINT in [q for q, _ in conn.log]
@@ -0,0 +1,117 @@
+"""Unit tests for the CTV validity index."""
+
+import json
+from datetime import date
+
+from src.graph.memory import InMemoryGraph
+from src.graph.validity import ValidityIndex
+from src.rag.planner import QueryPlan, QueryType
+from src.rag.retriever import HybridRetriever
+from tests.unit.fakes import FakeConnection
+from tests.unit.test_loader import SAMPLE_COMPONENTS
+
+VERSIONS = {
+    "tit_01": [
+        ("1988-10-05", "1992-03-31", "tit_01_v1", 1),
+        ("1992-03-31", "1992-03-31", "tit_01_v2", 2),  # same-day amendments
+        ("1992-03-31", None, "tit_01_v3", 3),
+    ],
+    "tit_01_art_1": [
+        ("1992-03-31", None, "tit_01_art_1_v2", 2),  # given out of order
+        ("1988-10-05", "1992-03-31", "tit_01_art_1_v1", 1),
+    ],
+    "tit_02": [("1988-10-05", "2000-01-01", "tit_02_v1", 1)],  # removed in 2000
+}
+
+
+def _index():
+    return ValidityIndex.from_versions(VERSIONS, roots=["tit_02", "tit_01"])
+
+
+def test_version_at_boundaries():
+    index = _index()
+    assert index.version_at("tit_01", "1988-10-04") is None
+    assert index.version_at("tit_01", "1988-10-05") == "tit_01_v1"
+    assert index.version_at("tit_01", "1992-03-30") == "tit_01_v1"
+    # the last version started that day is the one in force
+    assert index.version_at("tit_01", "1992-03-31") == "tit_01_v3"
+    assert index.version_at("tit_01_art_1", "1990-01-01") == "tit_01_art_1_v1"
+    assert index.version_at("tit_02", "1999-12-31") == "tit_02_v1"
+    assert index.version_at("tit_02", "2000-01-01") is None
+    assert index.version_at("missing", "2000-01-01") is None
+
+
+def test_match_and_roots():
+    index = _index()
+    assert index.match("tit_01") == ["tit_01"]
+    assert index.match("art_1") == ["tit_01_art_1"]
+    assert index.roots() == ["tit_01", "tit_02"]
+
+
+def test_set_versions_replaces_one_component():
+    index = _index()
+    index.set_versions("tit_02", [("1988-10-05", None, "tit_02_v1", 1)])
+    assert index.version_at("tit_02", "2010-01-01") == "tit_02_v1"
+
+
+def test_loaded_once_from_graph():
+    def responder(query, params):
+        if "AS is_root" in query:
+            return [
+                {"component_id": "tit_01", "is_root": True, "versions": [
+                    ["1988-10-05", None, "tit_01_v1", 1],
+                ]},
+                {"component_id": "tit_09", "is_root": True, "versions": [[None, None, None, None]]},
+            ]
+        return []
+
+    conn = FakeConnection(responder)
+    index = ValidityIndex(conn)
+    assert index.version_at("tit_01", "2000-01-01") == "tit_01_v1"
+    assert index.version_at("tit_09", "2000-01-01") is None
+    assert len(index) == 2
+    assert len(conn.log) == 1
+
+
+def test_retriever_reads_only_the_valid_versions():
+    def responder(query, params):
+        if "AS is_root" in query:
+            return [
+                {"component_id": c, "is_root": c in ("tit_01", "tit_02"), "versions": v}
+                for c, v in VERSIONS.items()
+            ]
+        return []
+
+    conn = FakeConnection(responder)
+    retriever = HybridRetriever(conn)
+    retriever.retrieve(QueryPlan(
+        query_type=QueryType.POINT_IN_TIME, original_query="",
+        target_date=date(1990, 1, 1), target_component="art_1",
+    ))
+    retriever.retrieve(QueryPlan(
+        query_type=QueryType.POINT_IN_TIME, original_query="", target_date=date(2001, 1, 1),
+    ))
+
+    lookups = [p for q, p in conn.log if "$ctv_ids[i]" in q]
+    assert lookups[0]["ctv_ids"] == ["tit_01_art_1_v1"]
+    assert lookups[0]["with_status"]
+    assert lookups[1]["ctv_ids"] == ["tit_01_v3"]  # tit_02 no longer in force
+    assert not any("date_start <=" in q for q, _ in conn.log)
+
+
+def test_in_memory_index_follows_amendments(tmp_path):
+    path = tmp_path / "constitution.json"
+    path.write_text(
+        json.dumps({"official_id": "CF1988", "components": SAMPLE_COMPONENTS}),
+        encoding="utf-8",
+    )
+    graph = InMemoryGraph.from_json(str(path))
+    assert graph.version_at("tit_01_art_1", "1995-01-01")["ctv_id"] == "tit_01_art_1_v1"
+
+    change = {"component_id": "tit_01_art_1", "new_content": "novo", "change_type": "modify"}
+    graph.apply_amendment(1, "1992-03-31", [change])
+    assert graph.version_at("tit_01_art_1", "1995-01-01")["ctv_id"] == "tit_01_art_1_v2"
+    assert graph.version_at("tit_01_art_1", "1990-01-01")["ctv_id"] == "tit_01_art_1_v1"
+
+    graph.revert_amendment(1)
+    assert graph.version_at("tit_01_art_1", "1995-01-01")["ctv_id"] == "tit_01_art_1_v1"